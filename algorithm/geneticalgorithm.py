@@ -58,14 +58,40 @@ class Engine(configurablebase.ConfigurableBase):
         self.mp_active = False
 
 
+    def load_initial_config(self, config, global_config=None):
+        """As for ConfigurableBase, but the callbacks are kept as given, not
+        deep-copied with the rest of the config. A deep copy of a bound method
+        copies the whole object it is bound to - for the master's gene_test, that 
+        is the master with all of its data - and would leave the copy, not 
+        the master, being called.
+        """
+        callbacks = {}
+        config = dict(config)
+        for key in ['gene_test_callback', 'gene_test_batch_callback']:
+            if key in config:
+                callbacks[key] = config.pop(key)
+
+        configurablebase.ConfigurableBase.load_initial_config(self, config, global_config)
+        self.config.update(callbacks)
+
+
     def complete_configuration(self):
         self.gene_test = self.config['gene_test_callback']
+        self.gene_test_batch = self.config['gene_test_batch_callback']
+
+        abort_cost_mult = self.config['abort_cost_mult']
+        if (abort_cost_mult != 0) and (abort_cost_mult < 1):
+            msg = ('abort_cost_mult is ' + str(abort_cost_mult) + ' in the algorithm' +
+                ' configuration, but must be 0 (off) or at least 1, as a bound below the' +
+                ' cost of the best gene so far could abort a better gene.')
+            raise mureilexception.ConfigException(msg, {})
         
         random.seed(self.config['seed'])
         self.population = Pop(self.config)
 
         self.clones_data = []
         self.best_gene_data = []
+        self.best_score = None
         self.iteration_count = -1
         
         self.is_configured = True
@@ -100,6 +126,16 @@ class Engine(configurablebase.ConfigurableBase):
             start_values_min: list of minimum initialisation values for genes.
                 Should be empty, or the same length as min_len.
             start_values_max: as for start_values_min, but maximum.
+            abort_cost_mult: float, default 0 - if non-zero, each gene is evaluated with
+                a cost bound of abort_cost_mult times the cost of the best gene found so far,
+                and the gene_test_callback may abort the evaluation once the cost is sure
+                to exceed that bound. Must be 0 or at least 1. The callback must then accept
+                the bound as a second argument, as in gene_test in txmultimastersimple and
+                txmultimasterflow.
+            gene_test_batch_callback: default '' - optional function handle to calculate the scores of
+                a list of genes in one call, returning a list of scores, as in gene_test_batch
+                in simplemureilmaster. If set, it is used instead of gene_test_callback to score
+                the population when not multiprocessing and abort_cost_mult is 0.
         """
         return [
             ('min_param_val', int, None), 
@@ -117,7 +153,9 @@ class Engine(configurablebase.ConfigurableBase):
             ('max_len', int, None),
             ('gene_test_callback', None, self.gene_test_undef),
             ('start_values_min', None, []),
-            ('start_values_max', None, [])
+            ('start_values_max', None, []),
+            ('abort_cost_mult', float, 0),
+            ('gene_test_batch_callback', None, '')
             ]
 
 
@@ -183,7 +221,11 @@ class Engine(configurablebase.ConfigurableBase):
                 break
             pos = vals[0]
             gene = vals[1]
-            score = self.gene_test(gene)
+            cost_bound = vals[2]
+            if cost_bound is None:
+                score = self.gene_test(gene)
+            else:
+                score = self.gene_test(gene, cost_bound)
             self.poolout.put((pos, score))
         return None
 
@@ -246,6 +288,8 @@ class Engine(configurablebase.ConfigurableBase):
             logger.debug('b_score = %f', b_score)
 
         self.best_gene_data.append([bestgene.values[:], bestgene.score, self.iteration_count])
+        if (self.best_score is None) or (bestgene.score > self.best_score):
+            self.best_score = bestgene.score
         self.population.lemming()
         self.population.breed()
         self.decloner()
@@ -259,25 +303,48 @@ class Engine(configurablebase.ConfigurableBase):
         output: None
         sends every gene to poolin, then updates all genes scores from poolout data
         """
+        cost_bound = self.get_cost_bound()
+
         if self.mp_active:
             for n in range(len(self.population.genes)):
                 vals = self.population.genes[n].values
-                self.poolin.put((n, vals))
+                self.poolin.put((n, vals, cost_bound))
             for n in range(len(self.population.genes)):
                 # Implements a blocking get - will wait up
                 # to 60 seconds for a result to be available, then
                 # raise the Empty exception.
                 s = self.poolout.get(True, 60)
                 self.population.genes[s[0]].score = s[1]
+        elif self.gene_test_batch and (cost_bound is None):
+            genes = self.population.genes
+            scores = self.gene_test_batch([gene.values for gene in genes])
+            for n in range(len(genes)):
+                genes[n].score = scores[n]
         else:
             for n in range(len(self.population.genes)):
                 vals = self.population.genes[n].values
-                self.population.genes[n].score = self.gene_test(vals)
+                if cost_bound is None:
+                    self.population.genes[n].score = self.gene_test(vals)
+                else:
+                    self.population.genes[n].score = self.gene_test(vals, cost_bound)
 
 
         return None
 
 
+    def get_cost_bound(self):
+        """input: None
+        output: float, or None
+        returns the cost above which gene evaluation may be aborted, being
+        abort_cost_mult times the cost of the best gene so far, or None if
+        abort_cost_mult is 0 or there is no best gene with a positive cost yet
+        """
+        if self.config['abort_cost_mult'] > 0:
+            if (self.best_score is not None) and (self.best_score < 0):
+                return -self.best_score * self.config['abort_cost_mult']
+        return None
+
+
     def clone_test(self):
         field = []
         for base in self.population.genes[0].values:
@@ -26,6 +26,9 @@
 
 from tools import mureilbase, configurablebase, mureilexception
 
+import mmap
+import numpy
+
 class DataSinglePassBase(configurablebase.ConfigurableBase, 
     mureilbase.DataSinglePassInterface):
 
@@ -43,5 +46,32 @@ class DataSinglePassBase(configurablebase.ConfigurableBase,
             msg = 'Data ts length requested, but ts_length not available'
             raise mureilexception.ConfigException(msg, {})
 
+    def share_data(self):
+        """Move the numeric array series in self.data into a single block of
+        shared memory, replacing each with a read-only view of its copy in
+        the block. Processes forked after this call, such as the algorithm's
+        multiprocessing workers, then map the same physical memory as the parent,
+        and a model that tries to write to the data raises an exception rather
+        than leaving each process with its own copy of the pages it wrote to.
+        
+        Series read in later, for example with lazy loading, are not moved.
+        """
+        # Keep each array 64-byte aligned in the block, as numpy does.
+        align = 64
+        arrays = [(name, series) for (name, series) in self.data.iteritems()
+            if isinstance(series, numpy.ndarray) and not series.dtype.hasobject]
+
+        sizes = [(series.nbytes + align - 1) // align * align for (name, series) in arrays]
+        self.shared_block = mmap.mmap(-1, max(sum(sizes), 1))
+
+        offset = 0
+        for (name, series), size in zip(arrays, sizes):
+            shared = numpy.ndarray(series.shape, dtype=series.dtype, 
+                buffer=self.shared_block, offset=offset)
+            shared[...] = series
+            shared.flags.writeable = False
+            self.data[name] = shared
+            offset += size
+
     pass
     
\ No newline at end of file
@@ -26,7 +26,7 @@
 # Sample data source file, for Marcelle to play with
 
 import numpy
-from data import datasinglepassbase
+from data import datasinglepassbase, sampledata
 
 class Data(datasinglepassbase.DataSinglePassBase):
 
@@ -44,2034 +44,12 @@ class Data(datasinglepassbase.DataSinglePassBase):
 
 
     def wind_data(self):
-        data = numpy.array([
-            [0.14, 0.62, 0.80, 0.33],
-            [0.57, 0.49, 0.87, 0.42],
-            [0.48, 0.40, 0.90, 0.15],
-            [0.71, 0.42, 0.88, 0.23],
-            [0.78, 0.42, 0.83, 0.28],
-            [0.70, 0.44, 0.57, 0.49],
-            [0.71, 0.45, 0.68, 0.61],
-            [0.72, 0.55, 0.55, 0.62],
-            [0.64, 0.40, 0.67, 0.59],
-            [0.40, 0.27, 0.36, 0.66],
-            [0.54, 0.27, 0.21, 0.61],
-            [0.47, 0.35, 0.16, 0.68],
-            [0.32, 0.43, 0.11, 0.74],
-            [0.59, 0.42, 0.17, 0.73],
-            [0.10, 0.49, 0.17, 0.73],
-            [0.15, 0.54, 0.17, 0.78],
-            [0.25, 0.59, 0.37, 0.76],
-            [0.32, 0.74, 0.59, 0.74],
-            [0.39, 0.73, 0.40, 0.74],
-            [0.34, 0.86, 0.39, 0.69],
-            [0.68, 0.89, 0.62, 0.62],
-            [0.67, 0.91, 0.84, 0.62],
-            [0.76, 0.91, 0.66, 0.64],
-            [0.67, 0.91, 0.80, 0.73],
-            [0.74, 0.82, 0.78, 0.66],
-            [0.65, 0.66, 0.72, 0.66],
-            [0.62, 0.82, 0.63, 0.55],
-            [0.67, 0.76, 0.78, 0.44],
-            [0.30, 0.83, 0.74, 0.52],
-            [0.35, 0.75, 0.71, 0.58],
-            [0.61, 0.78, 0.40, 0.58],
-            [0.17, 0.82, 0.59, 0.36],
-            [0.11, 0.77, 0.59, 0.17],
-            [0.43, 0.74, 0.36, 0.19],
-            [0.46, 0.67, 0.28, 0.28],
-            [0.43, 0.57, 0.23, 0.16],
-            [0.41, 0.68, 0.38, 0.19],
-            [0.15, 0.54, 0.31, 0.21],
-            [0.31, 0.42, 0.36, 0.18],
-            [0.38, 0.40, 0.62, 0.20],
-            [0.15, 0.46, 0.72, 0.33],
-            [0.13, 0.52, 0.66, 0.28],
-            [0.25, 0.77, 0.72, 0.28],
-            [0.03, 0.67, 0.71, 0.25],
-            [0.02, 0.58, 0.62, 0.24],
-            [0.01, 0.68, 0.85, 0.24],
-            [0.12, 0.55, 0.79, 0.34],
-            [0.37, 0.68, 0.81, 0.19],
-            [0.40, 0.72, 0.80, 0.16],
-            [0.11, 0.33, 0.31, 0.27],
-            [0.25, 0.49, 0.29, 0.24],
-            [0.26, 0.51, 0.39, 0.07],
-            [0.16, 0.44, 0.30, 0.12],
-            [0.23, 0.39, 0.64, 0.10],
-            [0.22, 0.18, 0.59, 0.16],
-            [0.24, 0.53, 0.51, 0.20],
-            [0.21, 0.38, 0.49, 0.22],
-            [0.26, 0.13, 0.31, 0.25],
-            [0.24, 0.18, 0.22, 0.27],
-            [0.19, 0.08, 0.18, 0.33],
-            [0.10, 0.10, 0.17, 0.36],
-            [0.28, 0.08, 0.20, 0.34],
-            [0.18, 0.11, 0.25, 0.42],
-            [0.13, 0.21, 0.33, 0.46],
-            [0.17, 0.30, 0.33, 0.54],
-            [0.12, 0.54, 0.43, 0.49],
-            [0.06, 0.83, 0.43, 0.46],
-            [0.04, 0.71, 0.49, 0.40],
-            [0.03, 0.84, 0.36, 0.33],
-            [0.08, 0.55, 0.35, 0.53],
-            [0.05, 0.47, 0.38, 0.54],
-            [0.01, 0.59, 0.20, 0.52],
-            [0.16, 0.44, 0.23, 0.70],
-            [0.12, 0.44, 0.18, 0.65],
-            [0.06, 0.50, 0.16, 0.69],
-            [0.18, 0.40, 0.11, 0.74],
-            [0.30, 0.48, 0.09, 0.64],
-            [0.04, 0.61, 0.23, 0.72],
-            [0.07, 0.37, 0.20, 0.71],
-            [0.06, 0.62, 0.05, 0.70],
-            [0.43, 0.37, 0.02, 0.54],
-            [0.12, 0.29, 0.05, 0.54],
-            [0.21, 0.24, 0.09, 0.51],
-            [0.14, 0.22, 0.11, 0.66],
-            [0.11, 0.13, 0.19, 0.67],
-            [0.11, 0.15, 0.26, 0.59],
-            [0.08, 0.48, 0.28, 0.58],
-            [0.21, 0.51, 0.35, 0.58],
-            [0.12, 0.34, 0.26, 0.57],
-            [0.27, 0.54, 0.28, 0.53],
-            [0.22, 0.83, 0.45, 0.48],
-            [0.00, 0.75, 0.41, 0.54],
-            [0.02, 0.65, 0.33, 0.61],
-            [0.09, 0.34, 0.22, 0.70],
-            [0.60, 0.66, 0.20, 0.65],
-            [0.70, 0.35, 0.15, 0.69],
-            [0.49, 0.53, 0.09, 0.69],
-            [0.50, 0.57, 0.11, 0.68],
-            [0.31, 0.53, 0.26, 0.63],
-            [0.07, 0.53, 0.30, 0.57],
-            [0.28, 0.59, 0.18, 0.44],
-            [0.30, 0.45, 0.07, 0.35],
-            [0.11, 0.58, 0.17, 0.34],
-            [0.11, 0.55, 0.38, 0.37],
-            [0.22, 0.47, 0.20, 0.41],
-            [0.30, 0.28, 0.23, 0.26],
-            [0.28, 0.23, 0.22, 0.29],
-            [0.21, 0.22, 0.19, 0.40],
-            [0.07, 0.20, 0.21, 0.49],
-            [0.20, 0.19, 0.33, 0.51],
-            [0.18, 0.37, 0.40, 0.60],
-            [0.49, 0.40, 0.51, 0.66],
-            [0.39, 0.44, 0.57, 0.75],
-            [0.56, 0.61, 0.46, 0.66],
-            [0.31, 0.75, 0.36, 0.63],
-            [0.21, 0.57, 0.37, 0.51],
-            [0.15, 0.61, 0.24, 0.35],
-            [0.60, 0.54, 0.25, 0.27],
-            [0.58, 0.54, 0.33, 0.30],
-            [0.68, 0.41, 0.22, 0.27],
-            [0.41, 0.65, 0.44, 0.24],
-            [0.47, 0.55, 0.22, 0.20],
-            [0.41, 0.51, 0.16, 0.10],
-            [0.64, 0.51, 0.18, 0.21],
-            [0.56, 0.28, 0.10, 0.13],
-            [0.49, 0.11, 0.37, 0.11],
-            [0.56, 0.40, 0.26, 0.15],
-            [0.35, 0.43, 0.16, 0.17],
-            [0.14, 0.31, 0.30, 0.18],
-            [0.15, 0.34, 0.37, 0.18],
-            [0.59, 0.33, 0.34, 0.22],
-            [0.52, 0.38, 0.37, 0.28],
-            [0.20, 0.36, 0.37, 0.24],
-            [0.19, 0.32, 0.36, 0.18],
-            [0.31, 0.46, 0.52, 0.22],
-            [0.10, 0.62, 0.34, 0.20],
-            [0.05, 0.64, 0.24, 0.15],
-            [0.14, 0.68, 0.16, 0.17],
-            [0.09, 0.72, 0.13, 0.18],
-            [0.17, 0.69, 0.08, 0.24],
-            [0.04, 0.71, 0.33, 0.26],
-            [0.18, 0.61, 0.52, 0.24],
-            [0.11, 0.64, 0.35, 0.18],
-            [0.14, 0.51, 0.46, 0.13],
-            [0.66, 0.65, 0.36, 0.12],
-            [0.40, 0.81, 0.17, 0.20],
-            [0.08, 0.73, 0.08, 0.17],
-            [0.73, 0.67, 0.46, 0.54],
-            [0.07, 0.62, 0.45, 0.47],
-            [0.22, 0.28, 0.36, 0.27],
-            [0.23, 0.70, 0.21, 0.60],
-            [0.32, 0.76, 0.33, 0.51],
-            [0.09, 0.60, 0.83, 0.58],
-            [0.17, 0.62, 0.91, 0.50],
-            [0.22, 0.47, 0.87, 0.51],
-            [0.23, 0.55, 0.85, 0.41],
-            [0.10, 0.43, 0.91, 0.41],
-            [0.25, 0.54, 0.90, 0.35],
-            [0.13, 0.56, 0.82, 0.29],
-            [0.05, 0.45, 0.75, 0.26],
-            [0.10, 0.56, 0.80, 0.21],
-            [0.19, 0.68, 0.84, 0.20],
-            [0.14, 0.73, 0.75, 0.49],
-            [0.20, 0.63, 0.48, 0.53],
-            [0.06, 0.67, 0.68, 0.77],
-            [0.11, 0.59, 0.62, 0.75],
-            [0.05, 0.41, 0.55, 0.57],
-            [0.03, 0.60, 0.47, 0.59],
-            [0.08, 0.60, 0.33, 0.52],
-            [0.67, 0.42, 0.58, 0.57],
-            [0.08, 0.53, 0.42, 0.44],
-            [0.45, 0.61, 0.27, 0.62],
-            [0.44, 0.50, 0.24, 0.63],
-            [0.41, 0.55, 0.53, 0.52],
-            [0.20, 0.40, 0.34, 0.51],
-            [0.06, 0.27, 0.39, 0.65],
-            [0.40, 0.21, 0.45, 0.70],
-            [0.06, 0.29, 0.37, 0.71],
-            [0.15, 0.17, 0.46, 0.78],
-            [0.09, 0.15, 0.31, 0.79],
-            [0.12, 0.13, 0.47, 0.81],
-            [0.12, 0.16, 0.51, 0.76],
-            [0.12, 0.20, 0.50, 0.85],
-            [0.07, 0.16, 0.64, 0.78],
-            [0.13, 0.15, 0.67, 0.81],
-            [0.06, 0.60, 0.61, 0.83],
-            [0.06, 0.58, 0.70, 0.73],
-            [0.04, 0.28, 0.67, 0.64],
-            [0.06, 0.24, 0.78, 0.44],
-            [0.22, 0.17, 0.72, 0.43],
-            [0.05, 0.29, 0.71, 0.34],
-            [0.19, 0.08, 0.69, 0.35],
-            [0.19, 0.10, 0.68, 0.23],
-            [0.10, 0.16, 0.52, 0.25],
-            [0.06, 0.43, 0.53, 0.20],
-            [0.04, 0.35, 0.74, 0.19],
-            [0.15, 0.26, 0.47, 0.20],
-            [0.14, 0.30, 0.55, 0.23],
-            [0.05, 0.20, 0.44, 0.16],
-            [0.04, 0.16, 0.55, 0.18],
-            [0.09, 0.40, 0.70, 0.37],
-            [0.15, 0.56, 0.70, 0.40],
-            [0.06, 0.49, 0.60, 0.40],
-            [0.18, 0.55, 0.59, 0.38],
-            [0.20, 0.48, 0.54, 0.31],
-            [0.27, 0.30, 0.47, 0.42],
-            [0.22, 0.23, 0.39, 0.48],
-            [0.24, 0.25, 0.44, 0.50],
-            [0.24, 0.26, 0.56, 0.52],
-            [0.15, 0.45, 0.80, 0.53],
-            [0.16, 0.68, 0.86, 0.59],
-            [0.14, 0.84, 0.80, 0.51],
-            [0.07, 0.82, 0.77, 0.35],
-            [0.10, 0.81, 0.74, 0.34],
-            [0.13, 0.77, 0.70, 0.28],
-            [0.33, 0.66, 0.63, 0.26],
-            [0.29, 0.73, 0.61, 0.29],
-            [0.20, 0.65, 0.69, 0.30],
-            [0.03, 0.52, 0.58, 0.37],
-            [0.06, 0.43, 0.59, 0.32],
-            [0.18, 0.34, 0.35, 0.38],
-            [0.07, 0.16, 0.22, 0.30],
-            [0.27, 0.15, 0.28, 0.26],
-            [0.09, 0.35, 0.33, 0.41],
-            [0.24, 0.37, 0.56, 0.38],
-            [0.29, 0.58, 0.69, 0.45],
-            [0.28, 0.70, 0.59, 0.42],
-            [0.26, 0.77, 0.50, 0.48],
-            [0.18, 0.59, 0.51, 0.39],
-            [0.22, 0.56, 0.39, 0.51],
-            [0.20, 0.45, 0.48, 0.46],
-            [0.11, 0.33, 0.53, 0.65],
-            [0.12, 0.35, 0.57, 0.77],
-            [0.17, 0.45, 0.61, 0.73],
-            [0.13, 0.62, 0.74, 0.54],
-            [0.22, 0.47, 0.74, 0.59],
-            [0.21, 0.73, 0.75, 0.56],
-            [0.05, 0.53, 0.64, 0.70],
-            [0.06, 0.23, 0.72, 0.55],
-            [0.13, 0.26, 0.77, 0.42],
-            [0.10, 0.19, 0.55, 0.44],
-            [0.18, 0.51, 0.68, 0.41],
-            [0.10, 0.56, 0.76, 0.47],
-            [0.07, 0.62, 0.75, 0.57],
-            [0.25, 0.68, 0.49, 0.44],
-            [0.68, 0.34, 0.54, 0.38],
-            [0.09, 0.46, 0.41, 0.29],
-            [0.09, 0.44, 0.44, 0.47],
-            [0.04, 0.32, 0.67, 0.40],
-            [0.03, 0.24, 0.76, 0.39],
-            [0.17, 0.36, 0.67, 0.35],
-            [0.12, 0.29, 0.50, 0.44],
-            [0.14, 0.38, 0.48, 0.41],
-            [0.13, 0.45, 0.48, 0.61],
-            [0.08, 0.58, 0.47, 0.57],
-            [0.18, 0.46, 0.53, 0.62],
-            [0.12, 0.48, 0.63, 0.59],
-            [0.20, 0.57, 0.71, 0.60],
-            [0.16, 0.80, 0.69, 0.57],
-            [0.06, 0.48, 0.75, 0.54],
-            [0.02, 0.85, 0.83, 0.48],
-            [0.02, 0.83, 0.74, 0.54],
-            [0.04, 0.78, 0.80, 0.36],
-            [0.66, 0.77, 0.86, 0.43],
-            [0.05, 0.82, 0.84, 0.40],
-            [0.16, 0.74, 0.87, 0.37],
-            [0.07, 0.71, 0.83, 0.29],
-            [0.06, 0.72, 0.78, 0.36],
-            [0.07, 0.72, 0.78, 0.41],
-            [0.05, 0.82, 0.59, 0.29],
-            [0.33, 0.85, 0.60, 0.37],
-            [0.25, 0.88, 0.66, 0.37],
-            [0.03, 0.80, 0.86, 0.39],
-            [0.01, 0.68, 0.80, 0.43],
-            [0.03, 0.44, 0.65, 0.39],
-            [0.04, 0.39, 0.54, 0.37],
-            [0.18, 0.48, 0.47, 0.33],
-            [0.15, 0.43, 0.65, 0.38],
-            [0.14, 0.57, 0.63, 0.43],
-            [0.24, 0.74, 0.57, 0.42],
-            [0.27, 0.87, 0.62, 0.39],
-            [0.28, 0.94, 0.55, 0.32],
-            [0.21, 0.94, 0.57, 0.34],
-            [0.06, 0.94, 0.64, 0.15],
-            [0.03, 0.93, 0.60, 0.12],
-            [0.11, 0.92, 0.63, 0.11],
-            [0.16, 0.94, 0.55, 0.16],
-            [0.11, 0.93, 0.52, 0.21],
-            [0.05, 0.91, 0.55, 0.18],
-            [0.05, 0.91, 0.79, 0.11],
-            [0.47, 0.88, 0.75, 0.29],
-            [0.06, 0.94, 0.68, 0.26],
-            [0.02, 0.94, 0.67, 0.27],
-            [0.00, 0.94, 0.63, 0.27],
-            [0.01, 0.94, 0.64, 0.39],
-            [0.03, 0.94, 0.65, 0.50],
-            [0.25, 0.89, 0.75, 0.56],
-            [0.36, 0.87, 0.67, 0.54],
-            [0.02, 0.79, 0.43, 0.53],
-            [0.11, 0.74, 0.46, 0.53],
-            [0.07, 0.72, 0.43, 0.61],
-            [0.21, 0.61, 0.55, 0.58],
-            [0.18, 0.80, 0.46, 0.60],
-            [0.14, 0.84, 0.51, 0.55],
-            [0.27, 0.85, 0.48, 0.58],
-            [0.15, 0.87, 0.64, 0.54],
-            [0.17, 0.92, 0.71, 0.50],
-            [0.34, 0.95, 0.73, 0.37],
-            [0.12, 0.93, 0.63, 0.41],
-            [0.27, 0.92, 0.70, 0.27],
-            [0.01, 0.93, 0.60, 0.33],
-            [0.11, 0.95, 0.45, 0.35],
-            [0.05, 0.94, 0.44, 0.46],
-            [0.12, 0.94, 0.36, 0.39],
-            [0.07, 0.94, 0.18, 0.45],
-            [0.12, 0.94, 0.14, 0.42],
-            [0.08, 0.94, 0.39, 0.35],
-            [0.08, 0.94, 0.37, 0.26],
-            [0.16, 0.93, 0.12, 0.41],
-            [0.21, 0.89, 0.18, 0.47],
-            [0.09, 0.86, 0.55, 0.56],
-            [0.12, 0.81, 0.47, 0.54],
-            [0.09, 0.88, 0.31, 0.52],
-            [0.25, 0.85, 0.41, 0.49],
-            [0.20, 0.79, 0.43, 0.47],
-            [0.11, 0.69, 0.34, 0.57],
-            [0.09, 0.66, 0.28, 0.56],
-            [0.05, 0.83, 0.29, 0.48],
-            [0.09, 0.79, 0.40, 0.47],
-            [0.09, 0.85, 0.38, 0.45],
-            [0.04, 0.92, 0.49, 0.33],
-            [0.02, 0.93, 0.63, 0.32],
-            [0.01, 0.93, 0.65, 0.14],
-            [0.02, 0.92, 0.70, 0.20],
-            [0.10, 0.90, 0.69, 0.08],
-            [0.07, 0.90, 0.72, 0.09],
-            [0.06, 0.93, 0.68, 0.16],
-            [0.15, 0.90, 0.40, 0.11],
-            [0.13, 0.81, 0.43, 0.12],
-            [0.38, 0.77, 0.41, 0.13],
-            [0.11, 0.72, 0.27, 0.13],
-            [0.12, 0.58, 0.45, 0.11],
-            [0.15, 0.52, 0.26, 0.12],
-            [0.01, 0.51, 0.23, 0.10],
-            [0.11, 0.51, 0.17, 0.16],
-            [0.04, 0.30, 0.21, 0.26],
-            [0.20, 0.32, 0.24, 0.25],
-            [0.07, 0.48, 0.20, 0.32],
-            [0.11, 0.32, 0.18, 0.35],
-            [0.08, 0.34, 0.19, 0.36],
-            [0.18, 0.28, 0.28, 0.37],
-            [0.15, 0.70, 0.32, 0.45],
-            [0.20, 0.51, 0.35, 0.35],
-            [0.30, 0.68, 0.47, 0.43],
-            [0.10, 0.65, 0.54, 0.38],
-            [0.08, 0.77, 0.65, 0.29],
-            [0.17, 0.87, 0.61, 0.32],
-            [0.38, 0.82, 0.58, 0.28],
-            [0.20, 0.84, 0.64, 0.40],
-            [0.24, 0.84, 0.54, 0.42],
-            [0.02, 0.83, 0.49, 0.39],
-            [0.51, 0.88, 0.59, 0.43],
-            [0.28, 0.87, 0.59, 0.43],
-            [0.47, 0.78, 0.63, 0.38],
-            [0.10, 0.83, 0.63, 0.41],
-            [0.05, 0.84, 0.59, 0.34],
-            [0.14, 0.77, 0.62, 0.36],
-            [0.14, 0.84, 0.51, 0.55],
-            [0.04, 0.84, 0.63, 0.62],
-            [0.21, 0.76, 0.47, 0.64],
-            [0.12, 0.80, 0.29, 0.65],
-            [0.15, 0.82, 0.20, 0.62],
-            [0.15, 0.78, 0.22, 0.63],
-            [0.12, 0.80, 0.24, 0.57],
-            [0.15, 0.86, 0.21, 0.64],
-            [0.21, 0.82, 0.16, 0.67],
-            [0.19, 0.84, 0.19, 0.64],
-            [0.13, 0.69, 0.29, 0.64],
-            [0.18, 0.90, 0.19, 0.69],
-            [0.19, 0.91, 0.39, 0.63],
-            [0.04, 0.91, 0.49, 0.65],
-            [0.08, 0.92, 0.45, 0.72],
-            [0.05, 0.91, 0.58, 0.69],
-            [0.21, 0.88, 0.53, 0.70],
-            [0.04, 0.85, 0.54, 0.74],
-            [0.12, 0.66, 0.58, 0.67],
-            [0.06, 0.45, 0.52, 0.68],
-            [0.03, 0.25, 0.43, 0.63],
-            [0.13, 0.36, 0.45, 0.63],
-            [0.16, 0.25, 0.20, 0.59],
-            [0.26, 0.27, 0.13, 0.55],
-            [0.03, 0.37, 0.14, 0.61],
-            [0.25, 0.21, 0.16, 0.69],
-            [0.20, 0.29, 0.37, 0.72],
-            [0.17, 0.23, 0.31, 0.63],
-            [0.51, 0.21, 0.30, 0.65],
-            [0.34, 0.23, 0.24, 0.69],
-            [0.31, 0.26, 0.27, 0.69],
-            [0.26, 0.35, 0.19, 0.64],
-            [0.26, 0.40, 0.21, 0.66],
-            [0.30, 0.40, 0.18, 0.65],
-            [0.31, 0.65, 0.15, 0.64],
-            [0.19, 0.65, 0.21, 0.65],
-            [0.25, 0.33, 0.09, 0.60],
-            [0.11, 0.43, 0.05, 0.71],
-            [0.03, 0.71, 0.20, 0.66],
-            [0.06, 0.69, 0.21, 0.65],
-            [0.10, 0.52, 0.25, 0.68],
-            [0.15, 0.58, 0.34, 0.67],
-            [0.04, 0.56, 0.38, 0.66],
-            [0.09, 0.66, 0.25, 0.75],
-            [0.15, 0.49, 0.27, 0.67],
-            [0.22, 0.55, 0.21, 0.67],
-            [0.02, 0.41, 0.20, 0.66],
-            [0.21, 0.46, 0.14, 0.67],
-            [0.20, 0.31, 0.24, 0.71],
-            [0.13, 0.22, 0.17, 0.70],
-            [0.07, 0.20, 0.15, 0.76],
-            [0.23, 0.24, 0.12, 0.69],
-            [0.41, 0.18, 0.14, 0.69],
-            [0.18, 0.19, 0.10, 0.69],
-            [0.12, 0.17, 0.15, 0.54],
-            [0.13, 0.25, 0.12, 0.61],
-            [0.19, 0.31, 0.09, 0.60],
-            [0.15, 0.40, 0.05, 0.60],
-            [0.14, 0.58, 0.13, 0.59],
-            [0.12, 0.60, 0.04, 0.62],
-            [0.33, 0.48, 0.13, 0.56],
-            [0.10, 0.29, 0.05, 0.58],
-            [0.09, 0.36, 0.07, 0.51],
-            [0.21, 0.45, 0.08, 0.46],
-            [0.13, 0.33, 0.31, 0.41],
-            [0.05, 0.36, 0.26, 0.43],
-            [0.20, 0.23, 0.13, 0.34],
-            [0.26, 0.24, 0.16, 0.26],
-            [0.14, 0.07, 0.29, 0.16],
-            [0.15, 0.13, 0.28, 0.23],
-            [0.13, 0.15, 0.09, 0.28],
-            [0.15, 0.10, 0.08, 0.31],
-            [0.08, 0.08, 0.08, 0.24],
-            [0.08, 0.34, 0.15, 0.25],
-            [0.04, 0.26, 0.38, 0.25],
-            [0.13, 0.40, 0.54, 0.29],
-            [0.04, 0.48, 0.56, 0.31],
-            [0.08, 0.34, 0.75, 0.26],
-            [0.10, 0.20, 0.61, 0.25],
-            [0.14, 0.41, 0.67, 0.30],
-            [0.19, 0.37, 0.73, 0.31],
-            [0.22, 0.35, 0.76, 0.33],
-            [0.25, 0.37, 0.73, 0.39],
-            [0.21, 0.10, 0.50, 0.25],
-            [0.29, 0.06, 0.34, 0.13],
-            [0.15, 0.06, 0.28, 0.17],
-            [0.14, 0.06, 0.45, 0.12],
-            [0.21, 0.14, 0.46, 0.07],
-            [0.35, 0.17, 0.40, 0.19],
-            [0.10, 0.14, 0.50, 0.11],
-            [0.08, 0.17, 0.30, 0.11],
-            [0.14, 0.07, 0.33, 0.11],
-            [0.13, 0.14, 0.41, 0.09],
-            [0.06, 0.09, 0.28, 0.05],
-            [0.15, 0.07, 0.25, 0.31],
-            [0.16, 0.18, 0.34, 0.27],
-            [0.14, 0.08, 0.18, 0.28],
-            [0.02, 0.08, 0.29, 0.30],
-            [0.01, 0.13, 0.22, 0.29],
-            [0.16, 0.21, 0.21, 0.36],
-            [0.13, 0.28, 0.26, 0.37],
-            [0.08, 0.32, 0.29, 0.42],
-            [0.13, 0.12, 0.30, 0.48],
-            [0.07, 0.42, 0.32, 0.39],
-            [0.21, 0.10, 0.42, 0.46],
-            [0.27, 0.07, 0.45, 0.44],
-            [0.16, 0.13, 0.55, 0.50],
-            [0.29, 0.21, 0.59, 0.41],
-            [0.17, 0.60, 0.69, 0.38],
-            [0.69, 0.55, 0.73, 0.43],
-            [0.04, 0.52, 0.65, 0.41],
-            [0.17, 0.51, 0.50, 0.50],
-            [0.39, 0.31, 0.57, 0.37],
-            [0.65, 0.34, 0.48, 0.46],
-            [0.32, 0.37, 0.63, 0.39],
-            [0.25, 0.41, 0.49, 0.41],
-            [0.32, 0.25, 0.48, 0.37],
-            [0.27, 0.24, 0.38, 0.28],
-            [0.11, 0.40, 0.63, 0.39],
-            [0.60, 0.29, 0.61, 0.43],
-            [0.02, 0.20, 0.70, 0.42],
-            [0.18, 0.14, 0.62, 0.43],
-            [0.24, 0.09, 0.74, 0.47],
-            [0.05, 0.05, 0.54, 0.53],
-            [0.13, 0.12, 0.49, 0.46],
-            [0.04, 0.09, 0.37, 0.51],
-            [0.18, 0.07, 0.36, 0.59],
-            [0.16, 0.19, 0.42, 0.56],
-            [0.23, 0.17, 0.41, 0.60],
-            [0.18, 0.11, 0.31, 0.53],
-            [0.12, 0.42, 0.41, 0.64],
-            [0.16, 0.67, 0.47, 0.46],
-            [0.15, 0.59, 0.69, 0.47],
-            [0.12, 0.82, 0.63, 0.30],
-            [0.07, 0.84, 0.61, 0.28],
-            [0.05, 0.77, 0.61, 0.32],
-            [0.45, 0.73, 0.47, 0.32],
-            [0.51, 0.66, 0.53, 0.24],
-            [0.10, 0.66, 0.54, 0.28],
-            [0.03, 0.69, 0.54, 0.38],
-            [0.06, 0.51, 0.59, 0.32],
-            [0.07, 0.57, 0.39, 0.22],
-            [0.49, 0.42, 0.37, 0.47],
-            [0.44, 0.63, 0.37, 0.39],
-            [0.06, 0.70, 0.38, 0.34],
-            [0.41, 0.65, 0.36, 0.40],
-            [0.25, 0.50, 0.38, 0.37],
-            [0.28, 0.47, 0.24, 0.34],
-            [0.17, 0.30, 0.20, 0.40],
-            [0.15, 0.22, 0.14, 0.40],
-            [0.23, 0.24, 0.11, 0.38],
-            [0.30, 0.32, 0.08, 0.41],
-            [0.21, 0.30, 0.09, 0.37],
-            [0.21, 0.32, 0.13, 0.30],
-            [0.32, 0.74, 0.14, 0.33],
-            [0.10, 0.72, 0.23, 0.28],
-            [0.13, 0.79, 0.24, 0.33],
-            [0.10, 0.76, 0.25, 0.44],
-            [0.14, 0.75, 0.22, 0.47],
-            [0.06, 0.79, 0.06, 0.58],
-            [0.45, 0.74, 0.17, 0.54],
-            [0.18, 0.60, 0.16, 0.54],
-            [0.03, 0.64, 0.42, 0.63],
-            [0.03, 0.54, 0.40, 0.57],
-            [0.17, 0.58, 0.37, 0.50],
-            [0.06, 0.50, 0.33, 0.48],
-            [0.06, 0.51, 0.28, 0.47],
-            [0.03, 0.60, 0.37, 0.57],
-            [0.19, 0.54, 0.22, 0.58],
-            [0.06, 0.42, 0.08, 0.53],
-            [0.08, 0.17, 0.19, 0.58],
-            [0.19, 0.14, 0.49, 0.61],
-            [0.18, 0.13, 0.52, 0.60],
-            [0.19, 0.18, 0.56, 0.50],
-            [0.25, 0.16, 0.59, 0.38],
-            [0.17, 0.24, 0.55, 0.34],
-            [0.34, 0.14, 0.63, 0.40],
-            [0.27, 0.20, 0.62, 0.61],
-            [0.31, 0.43, 0.63, 0.71],
-            [0.18, 0.60, 0.74, 0.80],
-            [0.09, 0.67, 0.81, 0.83],
-            [0.05, 0.40, 0.56, 0.92],
-            [0.03, 0.64, 0.60, 0.92],
-            [0.21, 0.61, 0.56, 0.90],
-            [0.09, 0.59, 0.73, 0.87],
-            [0.58, 0.49, 0.72, 0.82],
-            [0.62, 0.39, 0.76, 0.88],
-            [0.18, 0.23, 0.79, 0.90],
-            [0.18, 0.27, 0.90, 0.81],
-            [0.30, 0.16, 0.91, 0.84],
-            [0.71, 0.26, 0.82, 0.85],
-            [0.63, 0.35, 0.82, 0.87],
-            [0.71, 0.31, 0.82, 0.86],
-            [0.06, 0.15, 0.92, 0.85],
-            [0.13, 0.19, 0.88, 0.88],
-            [0.18, 0.22, 0.84, 0.88],
-            [0.32, 0.22, 0.75, 0.82],
-            [0.24, 0.23, 0.56, 0.83],
-            [0.21, 0.21, 0.47, 0.81],
-            [0.35, 0.21, 0.36, 0.85],
-            [0.27, 0.14, 0.30, 0.82],
-            [0.18, 0.10, 0.29, 0.81],
-            [0.27, 0.47, 0.43, 0.77],
-            [0.24, 0.56, 0.47, 0.81],
-            [0.17, 0.66, 0.43, 0.83],
-            [0.09, 0.59, 0.52, 0.75],
-            [0.04, 0.27, 0.54, 0.77],
-            [0.53, 0.11, 0.59, 0.51],
-            [0.35, 0.12, 0.50, 0.69],
-            [0.47, 0.14, 0.47, 0.69],
-            [0.50, 0.07, 0.56, 0.61],
-            [0.31, 0.21, 0.61, 0.48],
-            [0.43, 0.47, 0.83, 0.56],
-            [0.54, 0.29, 0.77, 0.60],
-            [0.14, 0.12, 0.84, 0.50],
-            [0.62, 0.17, 0.74, 0.44],
-            [0.64, 0.20, 0.57, 0.46],
-            [0.34, 0.12, 0.57, 0.36],
-            [0.24, 0.31, 0.45, 0.40],
-            [0.48, 0.33, 0.30, 0.45],
-            [0.22, 0.36, 0.21, 0.54],
-            [0.28, 0.37, 0.19, 0.48],
-            [0.30, 0.31, 0.20, 0.41],
-            [0.18, 0.51, 0.18, 0.53],
-            [0.19, 0.44, 0.15, 0.61],
-            [0.32, 0.58, 0.21, 0.65],
-            [0.38, 0.38, 0.19, 0.44],
-            [0.23, 0.58, 0.23, 0.20],
-            [0.11, 0.50, 0.41, 0.19],
-            [0.11, 0.42, 0.42, 0.14],
-            [0.73, 0.41, 0.32, 0.16],
-            [0.29, 0.33, 0.36, 0.13],
-            [0.54, 0.52, 0.37, 0.36],
-            [0.67, 0.46, 0.41, 0.22],
-            [0.54, 0.45, 0.52, 0.26],
-            [0.75, 0.33, 0.37, 0.30],
-            [0.60, 0.35, 0.38, 0.25],
-            [0.51, 0.46, 0.29, 0.29],
-            [0.56, 0.69, 0.35, 0.21],
-            [0.73, 0.64, 0.22, 0.29],
-            [0.11, 0.51, 0.44, 0.24],
-            [0.38, 0.54, 0.42, 0.38],
-            [0.17, 0.60, 0.51, 0.52],
-            [0.18, 0.37, 0.43, 0.44],
-            [0.29, 0.33, 0.37, 0.39],
-            [0.13, 0.31, 0.22, 0.45],
-            [0.23, 0.18, 0.22, 0.45],
-            [0.14, 0.24, 0.22, 0.54],
-            [0.16, 0.23, 0.15, 0.60],
-            [0.38, 0.37, 0.15, 0.59],
-            [0.33, 0.49, 0.21, 0.64],
-            [0.20, 0.67, 0.20, 0.65],
-            [0.22, 0.72, 0.29, 0.72],
-            [0.33, 0.74, 0.25, 0.78],
-            [0.58, 0.72, 0.44, 0.79],
-            [0.53, 0.73, 0.53, 0.82],
-            [0.56, 0.63, 0.46, 0.83],
-            [0.51, 0.62, 0.26, 0.85],
-            [0.38, 0.62, 0.50, 0.88],
-            [0.26, 0.39, 0.36, 0.84],
-            [0.50, 0.54, 0.34, 0.83],
-            [0.27, 0.63, 0.62, 0.79],
-            [0.21, 0.57, 0.41, 0.83],
-            [0.41, 0.61, 0.38, 0.79],
-            [0.65, 0.50, 0.25, 0.72],
-            [0.52, 0.39, 0.45, 0.79],
-            [0.59, 0.33, 0.32, 0.78],
-            [0.56, 0.21, 0.36, 0.77],
-            [0.43, 0.10, 0.60, 0.62],
-            [0.33, 0.13, 0.59, 0.67],
-            [0.40, 0.12, 0.35, 0.57],
-            [0.58, 0.15, 0.36, 0.58],
-            [0.33, 0.25, 0.41, 0.58],
-            [0.35, 0.23, 0.52, 0.58],
-            [0.60, 0.34, 0.54, 0.46],
-            [0.44, 0.31, 0.57, 0.49],
-            [0.68, 0.29, 0.56, 0.46],
-            [0.75, 0.14, 0.37, 0.51],
-            [0.74, 0.27, 0.42, 0.45],
-            [0.62, 0.28, 0.39, 0.51],
-            [0.77, 0.25, 0.31, 0.55],
-            [0.77, 0.20, 0.36, 0.57],
-            [0.72, 0.19, 0.43, 0.54],
-            [0.84, 0.08, 0.44, 0.57],
-            [0.74, 0.12, 0.31, 0.46],
-            [0.69, 0.13, 0.36, 0.46],
-            [0.69, 0.14, 0.43, 0.50],
-            [0.73, 0.17, 0.47, 0.47],
-            [0.60, 0.17, 0.44, 0.34],
-            [0.69, 0.35, 0.42, 0.53],
-            [0.75, 0.37, 0.39, 0.55],
-            [0.77, 0.45, 0.24, 0.45],
-            [0.67, 0.56, 0.20, 0.45],
-            [0.53, 0.53, 0.20, 0.39],
-            [0.61, 0.42, 0.20, 0.43],
-            [0.51, 0.46, 0.21, 0.58],
-            [0.53, 0.39, 0.29, 0.55],
-            [0.67, 0.43, 0.48, 0.56],
-            [0.59, 0.42, 0.42, 0.64],
-            [0.77, 0.31, 0.61, 0.50],
-            [0.87, 0.14, 0.60, 0.65],
-            [0.87, 0.18, 0.56, 0.50],
-            [0.81, 0.14, 0.42, 0.58],
-            [0.83, 0.19, 0.66, 0.42],
-            [0.79, 0.14, 0.52, 0.55]])
-
-        return data
+        return sampledata.load_sample('mg_sample_wind.csv', ndmin=2)
 
 
     def solar_data(self):
-        data = numpy.array([
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.33],
-        [0.75, 0.78],
-        [0.87, 0.86],
-        [0.91, 0.90],
-        [0.92, 0.91],
-        [0.90, 0.90],
-        [0.90, 0.90],
-        [0.88, 0.82],
-        [0.90, 0.78],
-        [0.88, 0.57],
-        [0.76, 0.44],
-        [0.54, 0.32],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.27],
-        [0.75, 0.70],
-        [0.88, 0.82],
-        [0.93, 0.85],
-        [0.96, 0.81],
-        [0.95, 0.76],
-        [0.96, 0.63],
-        [0.92, 0.57],
-        [0.90, 0.46],
-        [0.83, 0.27],
-        [0.77, 0.25],
-        [0.56, 0.14],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.34],
-        [0.73, 0.80],
-        [0.87, 0.89],
-        [0.94, 0.93],
-        [0.97, 0.94],
-        [0.96, 0.89],
-        [0.94, 0.80],
-        [0.88, 0.62],
-        [0.70, 0.70],
-        [0.68, 0.61],
-        [0.70, 0.52],
-        [0.47, 0.18],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.37],
-        [0.75, 0.84],
-        [0.89, 0.93],
-        [0.96, 0.98],
-        [1.00, 1.00],
-        [1.00, 1.00],
-        [1.00, 0.99],
-        [0.96, 0.92],
-        [0.88, 0.90],
-        [0.89, 0.88],
-        [0.74, 0.72],
-        [0.54, 0.30],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.39],
-        [0.77, 0.86],
-        [0.91, 0.96],
-        [0.97, 1.00],
-        [1.00, 1.02],
-        [1.00, 1.03],
-        [1.02, 1.06],
-        [1.01, 1.05],
-        [1.00, 1.02],
-        [0.95, 0.94],
-        [0.84, 0.77],
-        [0.57, 0.31],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.38],
-        [0.76, 0.85],
-        [0.90, 0.94],
-        [0.95, 0.98],
-        [0.96, 0.99],
-        [0.96, 0.98],
-        [0.98, 1.00],
-        [0.97, 0.99],
-        [0.97, 0.96],
-        [0.92, 0.90],
-        [0.82, 0.73],
-        [0.57, 0.30],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.33],
-        [0.68, 0.78],
-        [0.83, 0.86],
-        [0.88, 0.89],
-        [0.88, 0.89],
-        [0.88, 0.87],
-        [0.89, 0.76],
-        [0.87, 0.78],
-        [0.87, 0.78],
-        [0.86, 0.64],
-        [0.76, 0.62],
-        [0.52, 0.19],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.35],
-        [0.69, 0.81],
-        [0.81, 0.88],
-        [0.86, 0.92],
-        [0.86, 0.93],
-        [0.88, 0.94],
-        [0.91, 0.95],
-        [0.90, 0.93],
-        [0.91, 0.92],
-        [0.87, 0.86],
-        [0.76, 0.69],
-        [0.49, 0.14],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.20],
-        [0.66, 0.48],
-        [0.82, 0.71],
-        [0.85, 0.62],
-        [0.88, 0.72],
-        [0.89, 0.68],
-        [0.92, 0.77],
-        [0.93, 0.79],
-        [0.92, 0.76],
-        [0.88, 0.72],
-        [0.78, 0.59],
-        [0.53, 0.14],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.33],
-        [0.73, 0.74],
-        [0.86, 0.81],
-        [0.89, 0.80],
-        [0.91, 0.79],
-        [0.93, 0.71],
-        [0.96, 0.78],
-        [0.97, 0.86],
-        [0.98, 0.89],
-        [0.94, 0.86],
-        [0.83, 0.71],
-        [0.59, 0.14],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.39],
-        [0.75, 0.84],
-        [0.87, 0.90],
-        [0.91, 0.92],
-        [0.92, 0.93],
-        [0.93, 0.94],
-        [0.96, 0.96],
-        [0.99, 0.97],
-        [0.98, 0.95],
-        [0.79, 0.90],
-        [0.67, 0.72],
-        [0.54, 0.07],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.28],
-        [0.78, 0.83],
-        [0.92, 0.89],
-        [0.97, 0.89],
-        [0.99, 0.93],
-        [1.00, 0.95],
-        [1.02, 0.95],
-        [1.02, 0.94],
-        [1.02, 0.93],
-        [0.98, 0.88],
-        [0.87, 0.58],
-        [0.60, 0.08],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.33, 0.27],
-        [0.96, 0.40],
-        [1.02, 0.32],
-        [1.04, 0.22],
-        [1.04, 0.25],
-        [1.05, 0.28],
-        [1.06, 0.23],
-        [1.04, 0.30],
-        [0.98, 0.27],
-        [0.86, 0.12],
-        [0.60, 0.07],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.15],
-        [0.76, 0.63],
-        [0.92, 0.61],
-        [0.98, 0.67],
-        [1.00, 0.67],
-        [1.00, 0.66],
-        [1.01, 0.59],
-        [1.00, 0.55],
-        [0.99, 0.63],
-        [0.94, 0.62],
-        [0.81, 0.49],
-        [0.55, 0.06],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.05],
-        [0.72, 0.62],
-        [0.88, 0.67],
-        [0.94, 0.62],
-        [0.95, 0.72],
-        [0.84, 0.69],
-        [0.82, 0.51],
-        [0.79, 0.49],
-        [0.82, 0.51],
-        [0.82, 0.42],
-        [0.77, 0.38],
-        [0.54, 0.06],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.04],
-        [0.75, 0.63],
-        [0.91, 0.52],
-        [0.97, 0.53],
-        [0.98, 0.37],
-        [0.98, 0.26],
-        [1.00, 0.22],
-        [1.00, 0.15],
-        [1.00, 0.28],
-        [0.95, 0.41],
-        [0.81, 0.11],
-        [0.55, 0.06],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.09],
-        [0.75, 0.63],
-        [0.91, 0.52],
-        [0.97, 0.53],
-        [0.98, 0.36],
-        [0.98, 0.26],
-        [1.00, 0.22],
-        [1.00, 0.15],
-        [0.99, 0.28],
-        [0.95, 0.40],
-        [0.81, 0.10],
-        [0.55, 0.06],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.13],
-        [0.75, 0.63],
-        [0.91, 0.52],
-        [0.97, 0.54],
-        [0.98, 0.37],
-        [0.98, 0.27],
-        [1.00, 0.23],
-        [1.00, 0.15],
-        [1.00, 0.28],
-        [0.95, 0.41],
-        [0.81, 0.11],
-        [0.55, 0.06],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.28],
-        [0.06, 0.77],
-        [0.05, 0.87],
-        [0.05, 0.91],
-        [0.05, 0.84],
-        [0.05, 0.66],
-        [0.00, 0.62],
-        [0.00, 0.47],
-        [0.08, 0.48],
-        [0.08, 0.40],
-        [0.00, 0.29],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.09],
-        [0.64, 0.37],
-        [0.81, 0.48],
-        [0.86, 0.53],
-        [0.88, 0.61],
-        [0.89, 0.65],
-        [0.92, 0.75],
-        [0.94, 0.81],
-        [0.95, 0.85],
-        [0.91, 0.79],
-        [0.79, 0.60],
-        [0.52, 0.07],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.29],
-        [0.73, 0.68],
-        [0.89, 0.86],
-        [0.94, 0.94],
-        [0.96, 0.96],
-        [0.96, 0.95],
-        [0.99, 0.98],
-        [1.02, 0.99],
-        [1.01, 0.97],
-        [0.96, 0.91],
-        [0.83, 0.71],
-        [0.55, 0.07],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.19],
-        [0.76, 0.86],
-        [0.94, 0.96],
-        [1.01, 1.02],
-        [1.03, 1.03],
-        [1.01, 1.01],
-        [1.04, 1.02],
-        [1.05, 1.03],
-        [1.03, 1.01],
-        [0.97, 0.94],
-        [0.83, 0.73],
-        [0.55, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.17],
-        [0.74, 0.75],
-        [0.92, 0.84],
-        [0.97, 0.94],
-        [0.99, 0.94],
-        [0.97, 0.90],
-        [0.98, 0.91],
-        [0.98, 0.91],
-        [0.98, 0.85],
-        [0.93, 0.66],
-        [0.78, 0.40],
-        [0.51, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.16],
-        [0.71, 0.81],
-        [0.88, 0.92],
-        [0.95, 0.97],
-        [0.94, 0.97],
-        [0.95, 0.97],
-        [0.98, 0.96],
-        [0.96, 0.94],
-        [0.96, 0.92],
-        [0.92, 0.85],
-        [0.79, 0.61],
-        [0.51, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.12],
-        [0.72, 0.83],
-        [0.89, 0.93],
-        [0.96, 0.97],
-        [0.96, 0.98],
-        [0.94, 0.96],
-        [0.95, 0.97],
-        [0.95, 0.99],
-        [0.94, 0.98],
-        [0.85, 0.90],
-        [0.75, 0.67],
-        [0.49, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.13],
-        [0.69, 0.87],
-        [0.86, 0.97],
-        [0.92, 1.01],
-        [0.92, 1.01],
-        [0.90, 0.99],
-        [0.93, 1.00],
-        [0.94, 1.01],
-        [0.93, 0.97],
-        [0.88, 0.89],
-        [0.75, 0.68],
-        [0.48, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.11],
-        [0.64, 0.84],
-        [0.80, 0.94],
-        [0.85, 0.97],
-        [0.85, 0.98],
-        [0.78, 0.97],
-        [0.81, 0.98],
-        [0.85, 0.97],
-        [0.78, 0.94],
-        [0.71, 0.81],
-        [0.57, 0.61],
-        [0.33, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.41, 0.49],
-        [0.63, 0.68],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.10, 0.30],
-        [0.49, 0.89],
-        [0.58, 0.92],
-        [0.63, 0.91],
-        [0.54, 0.84],
-        [0.39, 0.62],
-        [0.16, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00],
-        [0.00, 0.00]])
-
-        return data
+        return sampledata.load_sample('mg_sample_solar.csv', ndmin=2)
 
 
     def demand_data(self):
-        data = numpy.array([    
-            20464,
-            19875,
-            18916,
-            18099,
-            17758,
-            17871,
-            18066,
-            19198,
-            20766,
-            22574,
-            24035,
-            25230,
-            25988,
-            26430,
-            26574,
-            27004,
-            27211,
-            27235,
-            27166,
-            26385,
-            25987,
-            24794,
-            23287,
-            22064,
-            21166,
-            19771,
-            19017,
-            18397,
-            18535,
-            19528,
-            21944,
-            25039,
-            26903,
-            28372,
-            29227,
-            29953,
-            30432,
-            30924,
-            31221,
-            31324,
-            31420,
-            30694,
-            29165,
-            27463,
-            26701,
-            25240,
-            23461,
-            22115,
-            21452,
-            19931,
-            19138,
-            18368,
-            18414,
-            19361,
-            21669,
-            24495,
-            26256,
-            27494,
-            28376,
-            29075,
-            29708,
-            30308,
-            30807,
-            30982,
-            31069,
-            30271,
-            28573,
-            27178,
-            26677,
-            25350,
-            23690,
-            22257,
-            21468,
-            20057,
-            19184,
-            18451,
-            18429,
-            19342,
-            21645,
-            24660,
-            26195,
-            27536,
-            28356,
-            29302,
-            30011,
-            30684,
-            31291,
-            31628,
-            32239,
-            31614,
-            29974,
-            28515,
-            27808,
-            26446,
-            24487,
-            22703,
-            21784,
-            20306,
-            19450,
-            18636,
-            18640,
-            19527,
-            21653,
-            24728,
-            26698,
-            28559,
-            29709,
-            30639,
-            31375,
-            32111,
-            32412,
-            32674,
-            32886,
-            32244,
-            30883,
-            29268,
-            28696,
-            26835,
-            24707,
-            22846,
-            21859,
-            20294,
-            19379,
-            18660,
-            18625,
-            19478,
-            21764,
-            24756,
-            26639,
-            28224,
-            29343,
-            30673,
-            31539,
-            32262,
-            32873,
-            33306,
-            33625,
-            32797,
-            30993,
-            29319,
-            28897,
-            27464,
-            25820,
-            24000,
-            22773,
-            20951,
-            20006,
-            19186,
-            18907,
-            19071,
-            19677,
-            21334,
-            23986,
-            26816,
-            28725,
-            29907,
-            30559,
-            31084,
-            31215,
-            31241,
-            31203,
-            30304,
-            28975,
-            27578,
-            27063,
-            25877,
-            24243,
-            22810,
-            21593,
-            19912,
-            18657,
-            17958,
-            17694,
-            17726,
-            17776,
-            18958,
-            20723,
-            22491,
-            23603,
-            24447,
-            25044,
-            25386,
-            25738,
-            25996,
-            25957,
-            26054,
-            25685,
-            24960,
-            24932,
-            23532,
-            21848,
-            20361,
-            19829,
-            18773,
-            18185,
-            17566,
-            17629,
-            18461,
-            20831,
-            23498,
-            24788,
-            25932,
-            26489,
-            26773,
-            27047,
-            27324,
-            27401,
-            27334,
-            27305,
-            27028,
-            25969,
-            24876,
-            24780,
-            23587,
-            22362,
-            21117,
-            20638,
-            19267,
-            18468,
-            17646,
-            17636,
-            18557,
-            20863,
-            23607,
-            24636,
-            25546,
-            25902,
-            26168,
-            25955,
-            26184,
-            26252,
-            26042,
-            25866,
-            25600,
-            24703,
-            24028,
-            23769,
-            22679,
-            21448,
-            20392,
-            19904,
-            18711,
-            17881,
-            17137,
-            17052,
-            17819,
-            20251,
-            22955,
-            23852,
-            24641,
-            25076,
-            25205,
-            25410,
-            25484,
-            25408,
-            25321,
-            25322,
-            25156,
-            24305,
-            23592,
-            23502,
-            22544,
-            21329,
-            20408,
-            19909,
-            18655,
-            17761,
-            16986,
-            16946,
-            17825,
-            20201,
-            22818,
-            23743,
-            24471,
-            24691,
-            24696,
-            24643,
-            24731,
-            24677,
-            24455,
-            24428,
-            24306,
-            23605,
-            23142,
-            23141,
-            22013,
-            20911,
-            20106,
-            19771,
-            18504,
-            17643,
-            16812,
-            16815,
-            17736,
-            20182,
-            22756,
-            23618,
-            24178,
-            24450,
-            24403,
-            24505,
-            24476,
-            24315,
-            24062,
-            24061,
-            23720,
-            22808,
-            22187,
-            21990,
-            21103,
-            20566,
-            20080,
-            19810,
-            18490,
-            17576,
-            16612,
-            16463,
-            16781,
-            17465,
-            18929,
-            20628,
-            21869,
-            22259,
-            22340,
-            22268,
-            21989,
-            21872,
-            21870,
-            22055,
-            22152,
-            22034,
-            21551,
-            21398,
-            20624,
-            20098,
-            19553,
-            19162,
-            17941,
-            17106,
-            16289,
-            15898,
-            15981,
-            16375,
-            17319,
-            18916,
-            20351,
-            21153,
-            21492,
-            21687,
-            21687,
-            21608,
-            21813,
-            22071,
-            22261,
-            22312,
-            22133,
-            22155,
-            21226,
-            20223,
-            19363,
-            19045,
-            17987,
-            17329,
-            16658,
-            16632,
-            17662,
-            20166,
-            22807,
-            24016,
-            25113,
-            25737,
-            26215,
-            26428,
-            26765,
-            26931,
-            26849,
-            26968,
-            26528,
-            25411,
-            24359,
-            23885,
-            22658,
-            21441,
-            20592,
-            20151,
-            18913,
-            18021,
-            17149,
-            17139,
-            18094,
-            20522,
-            23074,
-            24044,
-            25216,
-            25815,
-            26259,
-            26507,
-            26760,
-            26787,
-            26729,
-            26991,
-            26893,
-            25947,
-            25047,
-            24445,
-            23177,
-            21940,
-            20885,
-            20416,
-            19065,
-            18207,
-            17373,
-            17333,
-            18267,
-            20874,
-            23516,
-            24508,
-            25661,
-            26327,
-            26690,
-            26930,
-            27305,
-            27554,
-            27626,
-            27755,
-            27452,
-            26267,
-            25410,
-            25167,
-            23891,
-            22582,
-            21440,
-            20906,
-            19413,
-            18506,
-            17667,
-            17521,
-            18313,
-            20757,
-            23460,
-            24772,
-            26073,
-            26774,
-            27692,
-            28174,
-            28686,
-            29138,
-            29296,
-            29454,
-            28964,
-            27552,
-            26284,
-            25965,
-            24251,
-            22670,
-            21505,
-            20898,
-            19628,
-            18654,
-            17850,
-            17851,
-            18727,
-            21151,
-            23738,
-            25011,
-            26033,
-            26631,
-            27236,
-            27423,
-            27792,
-            27751,
-            27749,
-            27450,
-            26580,
-            25066,
-            24184,
-            24043,
-            22867,
-            22048,
-            21192,
-            20661,
-            19241,
-            18130,
-            17206,
-            16979,
-            17341,
-            18087,
-            19517,
-            21160,
-            22312,
-            22876,
-            23031,
-            22926,
-            22879,
-            22820,
-            22813,
-            22900,
-            22799,
-            22396,
-            22138,
-            22149,
-            21360,
-            20676,
-            20080,
-            19658,
-            18361,
-            17565,
-            16712,
-            16476,
-            16584,
-            16989,
-            18014,
-            19558,
-            20984,
-            21748,
-            22069,
-            22340,
-            22456,
-            22466,
-            22708,
-            23022,
-            23179,
-            23189,
-            22912,
-            22978,
-            21877,
-            20700,
-            19766,
-            19388,
-            18412,
-            17798,
-            17135,
-            17116,
-            18061,
-            20477,
-            23060,
-            24323,
-            25804,
-            26596,
-            27210,
-            27596,
-            28194,
-            28457,
-            28637,
-            28607,
-            27640,
-            25890,
-            24868,
-            24345,
-            22844,
-            21662,
-            20690,
-            20200,
-            18915,
-            18047,
-            17198,
-            17180,
-            18130,
-            20613,
-            23168,
-            24396,
-            25474,
-            26097,
-            26633,
-            26902,
-            27286,
-            27438,
-            27421,
-            27367,
-            26797,
-            25259,
-            24405,
-            24228,
-            22976,
-            21722,
-            20693,
-            20298,
-            19014,
-            18149,
-            17405,
-            17411,
-            18357,
-            20811,
-            23383,
-            24389,
-            25255,
-            25808,
-            26214,
-            26434,
-            26771,
-            26942,
-            26833,
-            26829,
-            26208,
-            25114,
-            24524,
-            24033,
-            22625,
-            21499,
-            20510,
-            20129,
-            18881,
-            17980,
-            17170,
-            17184,
-            18183,
-            20720,
-            23232,
-            24353,
-            25287,
-            25928,
-            26409,
-            26621,
-            26910,
-            27277,
-            27489,
-            27653,
-            27374,
-            26389,
-            25739,
-            25294,
-            23618,
-            22142,
-            21188,
-            20626,
-            19231,
-            18312,
-            17577,
-            17515,
-            18419,
-            20784,
-            23078,
-            24378,
-            25439,
-            26095,
-            26615,
-            26873,
-            27139,
-            27472,
-            27702,
-            27658,
-            26923,
-            25508,
-            24697,
-            24217,
-            22899,
-            21843,
-            20984,
-            20333,
-            18905,
-            17915,
-            16999,
-            16753,
-            16988,
-            17852,
-            19130,
-            20680,
-            21845,
-            22307,
-            22505,
-            22696,
-            22824,
-            23063,
-            23362,
-            23658,
-            23561,
-            22981,
-            22732,
-            22561,
-            21563,
-            20909,
-            20173], dtype=float)
-
-        return data
+        return sampledata.load_sample('mg_sample_demand.csv')
@@ -34,14 +34,23 @@ import csv
 
 from data import datasinglepassbase
 from tools import mureilbuilder, mureiltypes, mureilexception
+from tools import representativeperiods
 
 import numpy
 import copy
+import os
+import hashlib
+import tempfile
+
+import logging
+
+logger = logging.getLogger(__name__)
 
 class Data(datasinglepassbase.DataSinglePassBase):
     """Read in a list of variables from netCDF files.
     Checks if they are numpy.array(dtype=float), and if not,
-    copies them to a numpy.array(dtype=float) array.
+    copies them to a numpy.array(dtype=float) array, or float32
+    if use_float32 is set.
     """
 
     def process_initial_config(self):
@@ -61,96 +70,56 @@ class Data(datasinglepassbase.DataSinglePassBase):
 
     def complete_configuration(self):
         self.data = {}
+        if self.config['use_float32']:
+            self.float_dtype = numpy.float32
+        else:
+            self.float_dtype = numpy.float64
+        self.unloaded = {}
+        self.ts_keep = None
 
-        for list_type in ['ts_float_list', 'ts_int_list', 
-            'other_float_list', 'other_int_list']:
-
-            for series_name in self.config[list_type]:        
-                infile = self.config['dir'] + self.config[series_name + '_file']
-
-                try:
-                    f = nc.NetCDFFile(infile)
-                except:
-                    msg = ('File ' + infile + ' for data series ' + series_name +
-                        ' was not opened.')
-                    raise mureilexception.ConfigException(msg, {})
-
-                try:
-                    vbl = f.variables[self.config[series_name + '_vbl']]
-                except:
-                    msg = ('Variable ' + self.config[series_name + '_vbl'] +
-                        ' not found in file ' + infile)
-                    raise mureilexception.ConfigException(msg, {})
-                    
-                dims = len(vbl.shape)
+        if self.config['resample_factor'] < 1:
+            msg = 'Data resample_factor must be 1 or more, but is {:d}'.format(
+                self.config['resample_factor'])
+            raise mureilexception.ConfigException(msg, {})
 
-                if (dims == 1):
-                    temp = vbl[:]
-                elif (dims == 2):
-                    temp = vbl[:,:]
-                else:
-                    msg = 'Data series ' + series_name + ' has more than 2 dimensions, so is not handled.'
-                    raise mureilexception.ConfigException(msg, {})
+        all_ts = self.config['ts_float_list'] + self.config['ts_int_list'] + self.config['ts_csv_list']
 
-                if 'float' in list_type:
-                    if not mureiltypes.check_ndarray_float(temp, True):
-                        self.data[series_name] = numpy.array(temp, dtype=float)
-                    else:
-                        self.data[series_name] = temp
+        for list_type in ['ts_float_list', 'ts_int_list', 
+            'other_float_list', 'other_int_list', 'ts_csv_list']:
+            for series_name in self.config[list_type]:
+                if self.config['lazy_load']:
+                    self.unloaded[series_name] = list_type
                 else:
-                    if not mureiltypes.check_ndarray_int(temp, True):
-                        self.data[series_name] = numpy.array(temp, dtype=int)
-                    else:
-                        self.data[series_name] = temp
-
-        for list_type in ['ts_csv_list']:
-            for series_name in self.config[list_type]:        
-                infile = self.config['dir'] + self.config[series_name + '_file']
-                temp = []
-                
-                try:
-                    with open(infile, 'rU') as n:
-                        reader = csv.reader(n)
-                        for row in reader:
-                            if reader.line_num == 1:
-                                self.data[series_name + '_hdr'] = row[1:]
-                            else:
-                                if reader.line_num == 2:
-                                    temp = [map(float, (row[1:]))]
-                                else:
-                                    temp.append(map(float, (row[1:])))
-
-                    self.data[series_name] = numpy.array(temp, dtype=float)
-                    if not mureiltypes.check_ndarray_float(temp, True):
-                        self.data[series_name] = numpy.array(temp, dtype=float)
-                    else:
-                        self.data[series_name] = temp
-
-                except:
-                    msg = ('File ' + infile + ' for data series ' + series_name +
-                        ' was not opened or had an error in reading.')
-                    raise mureilexception.ConfigException(msg, {})
-
+                    self.data[series_name] = self.read_series(series_name, list_type)
 
         # Now apply the NaN filter to the ts lists, but note that the integer
-        # ones are not identified as nan.
-        all_ts = self.config['ts_float_list'] + self.config['ts_int_list'] + self.config['ts_csv_list']
-        
+        # ones are not identified as nan. With lazy_load, each timeseries is read
+        # here only to find its NaNs and choose the representative periods, and
+        # is dropped again.
         if len(all_ts) == 0:
             self.ts_length = 0
             logger.warning('No timeseries data defined')
         else:
-            self.ts_length = self.data[all_ts[0]].shape[0]
-
-            # Start with an array of 'False'
-            nan_acc = (numpy.ones(self.ts_length) == 0)
+            nan_acc = None
+            
+            # The unfiltered timeseries, held until the representative periods
+            # are chosen, so each is only read once.
+            unfiltered = {}
 
             # Accumulate 'True' entries in nan_acc where NaN found in timeseries
             for ts_name in all_ts:
-                ts_nan = numpy.isnan(self.data[ts_name])
+                series = self.get_unfiltered_series(ts_name)
+                if self.config['rep_period_count'] > 0:
+                    unfiltered[ts_name] = series
+
+                ts_nan = numpy.isnan(series)
                 if ts_nan.ndim > 1:
                     ts_nan = ts_nan.any(1)
 
+                if nan_acc is None:
+                    self.ts_length = len(ts_nan)
+                    nan_acc = ts_nan
+
                 # Check all the timeseries are the same length
                 if not (len(ts_nan) == self.ts_length):
                     msg = ('Data series ' + ts_name +
@@ -161,20 +130,227 @@ class Data(datasinglepassbase.DataSinglePassBase):
                 nan_acc = numpy.logical_or(nan_acc, ts_nan)
 
             # Clean up the timeseries using slices
-            nan_acc = numpy.logical_not(nan_acc)
-            for ts_name in all_ts:
-                if self.data[ts_name].ndim == 1:
-                    self.data[ts_name] = self.data[ts_name][nan_acc]            
-                else:
-                    self.data[ts_name] = self.data[ts_name][nan_acc, :]            
+            self.ts_keep = numpy.logical_not(nan_acc)
+            self.ts_length = numpy.count_nonzero(self.ts_keep)
+
+            # Reduce the timeseries to a set of representative periods, if requested.
+            if self.config['rep_period_count'] > 0:
+                keep = representativeperiods.select_representative_periods(
+                    [unfiltered[ts_name][self.ts_keep] for ts_name in all_ts], 
+                    self.config['rep_period_len'], self.config['rep_period_count'], 
+                    self.config['rep_cluster_count'], self.config['rep_seed'])
+                self.ts_keep = numpy.flatnonzero(self.ts_keep)[keep]
+                self.ts_length = len(self.ts_keep)
 
-            self.ts_length = self.data[all_ts[0]].shape[0]
+            for ts_name in all_ts:
+                if ts_name in self.data:
+                    self.data[ts_name] = self.data[ts_name][self.ts_keep]
 
         self.is_configured = True
 
         return None
 
 
+    def get_timeseries(self, ts_name):
+        """Return the named data series, first reading it in if lazy_load
+        is set and it has not yet been requested.
+        """
+        if ts_name in self.unloaded:
+            list_type = self.unloaded.pop(ts_name)
+            series = self.read_series(ts_name, list_type)
+            if list_type.startswith('ts_'):
+                series = series[self.ts_keep]
+            self.data[ts_name] = series
+
+        return datasinglepassbase.DataSinglePassBase.get_timeseries(self, ts_name)
+
+
+    def get_unfiltered_series(self, series_name):
+        """Return the named data series as read from file, before the NaN
+        filter is applied, reading it in if it has not been loaded.
+        """
+        if series_name in self.data:
+            return self.data[series_name]
+        else:
+            return self.read_series(series_name, self.unloaded[series_name])
+
+
+    def read_series(self, series_name, list_type):
+        """Read the named data series from its netCDF or CSV file. For a
+        ts_csv_list series, the header is also stored, as series_name_hdr.
+        
+        Inputs:
+            series_name: the name of the data series
+            list_type: the name of the config list the series is in, 
+                e.g. ts_float_list
+            
+        Outputs:
+            a numpy array of the data, of float type for float and csv
+            series, and integer type for int series.
+        """
+        infile = self.config['dir'] + self.config[series_name + '_file']
+
+        if list_type == 'ts_csv_list':
+            try:
+                hdr, values = self.read_csv_series(infile)
+            except:
+                msg = ('File ' + infile + ' for data series ' + series_name +
+                    ' was not opened or had an error in reading.')
+                raise mureilexception.ConfigException(msg, {})
+
+            self.data[series_name + '_hdr'] = hdr
+            return self.resample(values.astype(self.float_dtype, copy=False), list_type)
+
+        try:
+            f = nc.NetCDFFile(infile, mmap=self.config['mmap'])
+        except:
+            msg = ('File ' + infile + ' for data series ' + series_name +
+                ' was not opened.')
+            raise mureilexception.ConfigException(msg, {})
+
+        try:
+            vbl = f.variables[self.config[series_name + '_vbl']]
+        except:
+            msg = ('Variable ' + self.config[series_name + '_vbl'] +
+                ' not found in file ' + infile)
+            raise mureilexception.ConfigException(msg, {})
+            
+        dims = len(vbl.shape)
+
+        if (dims == 1):
+            temp = vbl[:]
+        elif (dims == 2):
+            temp = vbl[:,:]
+        else:
+            msg = 'Data series ' + series_name + ' has more than 2 dimensions, so is not handled.'
+            raise mureilexception.ConfigException(msg, {})
+
+        # netCDF stores big-endian data, so with mmap the variable is a
+        # read-only, non-native view of the file. Copy it straight from
+        # the map into a native array, so the calculations run at full speed.
+        if 'float' in list_type:
+            if not ((temp.dtype == self.float_dtype) and temp.dtype.isnative):
+                temp = numpy.array(temp, dtype=self.float_dtype)
+        else:
+            if not (mureiltypes.check_ndarray_int(temp, True) and temp.dtype.isnative):
+                temp = numpy.array(temp, dtype=int)
+
+        f.close()
+
+        return self.resample(temp, list_type)
+
+
+    def resample(self, series, list_type):
+        """Resample a timeseries to resample_factor times the timestep, taking
+        the mean of each block of resample_factor timesteps for floating point 
+        series, and the first value of each block for integer series. Any 
+        timesteps left over after the last full block are dropped. Series not 
+        in a timeseries list are returned unchanged.
+        
+        Inputs:
+            series: numpy array, with the timesteps along the first dimension
+            list_type: the name of the config list the series is in, 
+                e.g. ts_float_list
+            
+        Outputs:
+            the resampled numpy array, of the same dtype as series.
+        """
+        factor = self.config['resample_factor']
+        if (factor == 1) or not list_type.startswith('ts_'):
+            return series
+
+        count = series.shape[0] // factor
+        blocks = series[:count * factor].reshape((count, factor) + series.shape[1:])
+
+        if list_type == 'ts_int_list':
+            return blocks[:, 0]
+        else:
+            return blocks.mean(axis=1, dtype=series.dtype)
+
+
+    def read_csv_series(self, infile):
+        """Read in a CSV timeseries file. If csv_cache_dir is set, the parsed
+        data is kept there in a numpy .npz file, and is used in place of the CSV
+        as long as the CSV file has not changed since the cache was written.
+        
+        Inputs:
+            infile: the path to the CSV file
+            
+        Outputs:
+            hdr: list of the column headers, not including the time column
+            values: numpy.array(dtype=float) of the data, one row per timestep
+        """
+        cache_dir = self.config['csv_cache_dir']
+        if not cache_dir:
+            return self.parse_csv_file(infile)
+
+        source = os.path.abspath(infile)
+        stat = os.stat(source)
+        stamp = numpy.array([stat.st_mtime, stat.st_size], dtype=float)
+        # The hash of the full path keeps apart CSV files of the same name in 
+        # different directories.
+        cache_file = os.path.join(cache_dir, os.path.basename(infile) + '.' + 
+            hashlib.md5(source).hexdigest()[:12] + '.npz')
+
+        try:
+            cached = numpy.load(cache_file)
+            try:
+                if ((str(cached['source']) == source) and 
+                    numpy.array_equal(cached['stamp'], stamp)):
+                    return cached['hdr'].tolist(), cached['values']
+            finally:
+                cached.close()
+        except Exception:
+            # No cache yet, or it is unreadable - it is rewritten below.
+            pass
+
+        hdr, values = self.parse_csv_file(infile)
+
+        # Write to a temporary file of its own and move it into place, so a partly
+        # written cache is never picked up, even with several runs sharing the
+        # cache directory. The rename replaces any old cache file in one step.
+        temp_file = None
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            fd, temp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                numpy.savez(f, source=numpy.array(source), stamp=stamp,
+                    hdr=numpy.array(hdr, dtype=str), values=values)
+            os.rename(temp_file, cache_file)
+        except (IOError, OSError):
+            logger.warning('CSV cache file ' + cache_file + ' could not be written.')
+            if temp_file is not None and os.path.exists(temp_file):
+                os.remove(temp_file)
+
+        return hdr, values
+
+
+    def parse_csv_file(self, infile):
+        """Parse a CSV timeseries file, with a header row and a time column
+        to the left, which is ignored.
+        
+        Inputs:
+            infile: the path to the CSV file
+            
+        Outputs:
+            hdr: list of the column headers, not including the time column
+            values: numpy.array(dtype=float) of the data, one row per timestep
+        """
+        hdr = []
+        temp = []
+
+        with open(infile, 'rU') as n:
+            reader = csv.reader(n)
+            for row in reader:
+                if reader.line_num == 1:
+                    hdr = row[1:]
+                else:
+                    temp.append(map(float, (row[1:])))
+
+        return hdr, numpy.array(temp, dtype=float)
+
+
     def get_config_spec(self):
         """Return a list of tuples of format (name, conversion function, default),
         e.g. ('capex', float, 2.0). Put None if no conversion required, or if no
@@ -205,6 +381,46 @@ class Data(datasinglepassbase.DataSinglePassBase):
             
         and for each name in ts_csv_list, e.g. ts_demand_matrix:
         ts_demand_matrix_file: string filename of the CSV file with the data.
+        
+        csv_cache_dir: optional - full or relative path to a directory to keep a binary
+            copy of each parsed ts_csv_list file, named as the CSV file with a hash of
+            its full path and .npz added.
+            The copy is used on later runs in place of parsing the CSV file, and is
+            rebuilt if the CSV file is modified. If not set, no cache is used.
+        
+        lazy_load: boolean, default False - if True, each data series is only kept in memory
+            once it is requested, typically as listed by a generator's get_data_types, so
+            series in the lists that no model uses are not held. The timeseries are still 
+            all read once at configuration, to apply the NaN filter and representative
+            period selection across all of them, so the results are the same as with
+            lazy_load False. Requested timeseries are then read again, so csv_cache_dir
+            is recommended for ts_csv_list series. With rep_period_count set, all the
+            timeseries are held together while the periods are chosen.
+
+        use_float32: boolean, default False - typically set globally. If True, the floating 
+            point and csv series are stored as float32, halving their memory.
+
+        resample_factor: integer, default 1 - if greater than 1, the timeseries are resampled
+            as they are read in, to a timestep resample_factor times as long, e.g. 2 to take 
+            30-minute data to hourly. Float and csv series take the mean of each block of 
+            resample_factor timesteps, and integer series the first value. A block with a NaN 
+            in it becomes NaN, so is removed by the NaN filter, and any timesteps after the 
+            last full block are dropped. The global timestep_mins or timestep_hrs must be
+            set to the resampled timestep.
+        
+        rep_period_count: integer, default 0 - if non-zero, the timeseries (after NaN filtering) 
+            are clustered into periods of rep_period_len timesteps, and rep_period_count of these 
+            are kept, sampled from the clusters in proportion to their size. The timeseries length 
+            is reduced accordingly, so time_scale_up_mult is calculated for the reduced length.
+        rep_period_len: integer, default 24 - the number of timesteps in each representative period.
+        rep_cluster_count: integer, default 0 - the number of clusters to use. If 0, rep_period_count
+            is used.
+        rep_seed: integer, default 0 - the seed for the clustering initialisation.
+        
+        mmap: boolean, default True - if True, the netCDF variables are read through a 
+            memory map of the file, so only the pages holding the requested variables
+            are read, and each is copied once from the map into a native array. If False,
+            each variable is read from the file with a plain read.
         """
         return [
             ('description', None, 'None'),
@@ -213,6 +429,15 @@ class Data(datasinglepassbase.DataSinglePassBase):
             ('ts_int_list', mureilbuilder.make_string_list, []),
             ('other_float_list', mureilbuilder.make_string_list, []),
             ('other_int_list', mureilbuilder.make_string_list, []),
-            ('ts_csv_list', mureilbuilder.make_string_list, [])
+            ('ts_csv_list', mureilbuilder.make_string_list, []),
+            ('rep_period_count', int, 0),
+            ('rep_period_len', int, 24),
+            ('rep_cluster_count', int, 0),
+            ('rep_seed', int, 0),
+            ('mmap', mureilbuilder.string_to_bool, True),
+            ('csv_cache_dir', None, ''),
+            ('lazy_load', mureilbuilder.string_to_bool, False),
+            ('use_float32', mureilbuilder.string_to_bool, False),
+            ('resample_factor', int, 1)
             ]
         
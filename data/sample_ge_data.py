@@ -28,7 +28,7 @@
 
 import numpy
 
-from data import datasinglepassbase
+from data import datasinglepassbase, sampledata
 
 class Data(datasinglepassbase.DataSinglePassBase):
 
@@ -46,1677 +46,26 @@ class Data(datasinglepassbase.DataSinglePassBase):
 
 
     def wind_data(self):
-        data = numpy.array([
-            [0.80],
-            [0.87],
-            [0.90],
-            [0.88],
-            [0.83],
-            [0.57],
-            [0.68],
-            [0.55],
-            [0.67],
-            [0.36],
-            [0.21],
-            [0.16],
-            [0.11],
-            [0.17],
-            [0.17],
-            [0.17],
-            [0.37],
-            [0.59],
-            [0.40],
-            [0.39],
-            [0.62],
-            [0.84],
-            [0.66],
-            [0.80],
-            [0.78],
-            [0.72],
-            [0.63],
-            [0.78],
-            [0.74],
-            [0.71],
-            [0.40],
-            [0.59],
-            [0.59],
-            [0.36],
-            [0.28],
-            [0.23],
-            [0.38],
-            [0.31],
-            [0.36],
-            [0.62],
-            [0.72],
-            [0.66],
-            [0.72],
-            [0.71],
-            [0.62],
-            [0.85],
-            [0.79],
-            [0.81],
-            [0.80],
-            [0.31],
-            [0.29],
-            [0.39],
-            [0.30],
-            [0.64],
-            [0.59],
-            [0.51],
-            [0.49],
-            [0.31],
-            [0.22],
-            [0.18],
-            [0.17],
-            [0.20],
-            [0.25],
-            [0.33],
-            [0.33],
-            [0.43],
-            [0.43],
-            [0.49],
-            [0.36],
-            [0.35],
-            [0.38],
-            [0.20],
-            [0.23],
-            [0.18],
-            [0.16],
-            [0.11],
-            [0.09],
-            [0.23],
-            [0.20],
-            [0.05],
-            [0.02],
-            [0.05],
-            [0.09],
-            [0.11],
-            [0.19],
-            [0.26],
-            [0.28],
-            [0.35],
-            [0.26],
-            [0.28],
-            [0.45],
-            [0.41],
-            [0.33],
-            [0.22],
-            [0.20],
-            [0.15],
-            [0.09],
-            [0.11],
-            [0.26],
-            [0.30],
-            [0.18],
-            [0.07],
-            [0.17],
-            [0.38],
-            [0.20],
-            [0.23],
-            [0.22],
-            [0.19],
-            [0.21],
-            [0.33],
-            [0.40],
-            [0.51],
-            [0.57],
-            [0.46],
-            [0.36],
-            [0.37],
-            [0.24],
-            [0.25],
-            [0.33],
-            [0.22],
-            [0.44],
-            [0.22],
-            [0.16],
-            [0.18],
-            [0.10],
-            [0.37],
-            [0.26],
-            [0.16],
-            [0.30],
-            [0.37],
-            [0.34],
-            [0.37],
-            [0.37],
-            [0.36],
-            [0.52],
-            [0.34],
-            [0.24],
-            [0.16],
-            [0.13],
-            [0.08],
-            [0.33],
-            [0.52],
-            [0.35],
-            [0.46],
-            [0.36],
-            [0.17],
-            [0.08],
-            [0.46],
-            [0.45],
-            [0.36],
-            [0.21],
-            [0.33],
-            [0.83],
-            [0.91],
-            [0.87],
-            [0.85],
-            [0.91],
-            [0.90],
-            [0.82],
-            [0.75],
-            [0.80],
-            [0.84],
-            [0.75],
-            [0.48],
-            [0.68],
-            [0.62],
-            [0.55],
-            [0.47],
-            [0.33],
-            [0.58],
-            [0.42],
-            [0.27],
-            [0.24],
-            [0.53],
-            [0.34],
-            [0.39],
-            [0.45],
-            [0.37],
-            [0.46],
-            [0.31],
-            [0.47],
-            [0.51],
-            [0.50],
-            [0.64],
-            [0.67],
-            [0.61],
-            [0.70],
-            [0.67],
-            [0.78],
-            [0.72],
-            [0.71],
-            [0.69],
-            [0.68],
-            [0.52],
-            [0.53],
-            [0.74],
-            [0.47],
-            [0.55],
-            [0.44],
-            [0.55],
-            [0.70],
-            [0.70],
-            [0.60],
-            [0.59],
-            [0.54],
-            [0.47],
-            [0.39],
-            [0.44],
-            [0.56],
-            [0.80],
-            [0.86],
-            [0.80],
-            [0.77],
-            [0.74],
-            [0.70],
-            [0.63],
-            [0.61],
-            [0.69],
-            [0.58],
-            [0.59],
-            [0.35],
-            [0.22],
-            [0.28],
-            [0.33],
-            [0.56],
-            [0.69],
-            [0.59],
-            [0.50],
-            [0.51],
-            [0.39],
-            [0.48],
-            [0.53],
-            [0.57],
-            [0.61],
-            [0.74],
-            [0.74],
-            [0.75],
-            [0.64],
-            [0.72],
-            [0.77],
-            [0.55],
-            [0.68],
-            [0.76],
-            [0.75],
-            [0.49],
-            [0.54],
-            [0.41],
-            [0.44],
-            [0.67],
-            [0.76],
-            [0.67],
-            [0.50],
-            [0.48],
-            [0.48],
-            [0.47],
-            [0.53],
-            [0.63],
-            [0.71],
-            [0.69],
-            [0.75],
-            [0.83],
-            [0.74],
-            [0.80],
-            [0.86],
-            [0.84],
-            [0.87],
-            [0.83],
-            [0.78],
-            [0.78],
-            [0.59],
-            [0.60],
-            [0.66],
-            [0.86],
-            [0.80],
-            [0.65],
-            [0.54],
-            [0.47],
-            [0.65],
-            [0.63],
-            [0.57],
-            [0.62],
-            [0.55],
-            [0.57],
-            [0.64],
-            [0.60],
-            [0.63],
-            [0.55],
-            [0.52],
-            [0.55],
-            [0.79],
-            [0.75],
-            [0.68],
-            [0.67],
-            [0.63],
-            [0.64],
-            [0.65],
-            [0.75],
-            [0.67],
-            [0.43],
-            [0.46],
-            [0.43],
-            [0.55],
-            [0.46],
-            [0.51],
-            [0.48],
-            [0.64],
-            [0.71],
-            [0.73],
-            [0.63],
-            [0.70],
-            [0.60],
-            [0.45],
-            [0.44],
-            [0.36],
-            [0.18],
-            [0.14],
-            [0.39],
-            [0.37],
-            [0.12],
-            [0.18],
-            [0.55],
-            [0.47],
-            [0.31],
-            [0.41],
-            [0.43],
-            [0.34],
-            [0.28],
-            [0.29],
-            [0.40],
-            [0.38],
-            [0.49],
-            [0.63],
-            [0.65],
-            [0.70],
-            [0.69],
-            [0.72],
-            [0.68],
-            [0.40],
-            [0.43],
-            [0.41],
-            [0.27],
-            [0.45],
-            [0.26],
-            [0.23],
-            [0.17],
-            [0.21],
-            [0.24],
-            [0.20],
-            [0.18],
-            [0.19],
-            [0.28],
-            [0.32],
-            [0.35],
-            [0.47],
-            [0.54],
-            [0.65],
-            [0.61],
-            [0.58],
-            [0.64],
-            [0.54],
-            [0.49],
-            [0.59],
-            [0.59],
-            [0.63],
-            [0.63],
-            [0.59],
-            [0.62],
-            [0.51],
-            [0.63],
-            [0.47],
-            [0.29],
-            [0.20],
-            [0.22],
-            [0.24],
-            [0.21],
-            [0.16],
-            [0.19],
-            [0.29],
-            [0.19],
-            [0.39],
-            [0.49],
-            [0.45],
-            [0.58],
-            [0.53],
-            [0.54],
-            [0.58],
-            [0.52],
-            [0.43],
-            [0.45],
-            [0.20],
-            [0.13],
-            [0.14],
-            [0.16],
-            [0.37],
-            [0.31],
-            [0.30],
-            [0.24],
-            [0.27],
-            [0.19],
-            [0.21],
-            [0.18],
-            [0.15],
-            [0.21],
-            [0.09],
-            [0.05],
-            [0.20],
-            [0.21],
-            [0.25],
-            [0.34],
-            [0.38],
-            [0.25],
-            [0.27],
-            [0.21],
-            [0.20],
-            [0.14],
-            [0.24],
-            [0.17],
-            [0.15],
-            [0.12],
-            [0.14],
-            [0.10],
-            [0.15],
-            [0.12],
-            [0.09],
-            [0.05],
-            [0.13],
-            [0.04],
-            [0.13],
-            [0.05],
-            [0.07],
-            [0.08],
-            [0.31],
-            [0.26],
-            [0.13],
-            [0.16],
-            [0.29],
-            [0.28],
-            [0.09],
-            [0.08],
-            [0.08],
-            [0.15],
-            [0.38],
-            [0.54],
-            [0.56],
-            [0.75],
-            [0.61],
-            [0.67],
-            [0.73],
-            [0.76],
-            [0.73],
-            [0.50],
-            [0.34],
-            [0.28],
-            [0.45],
-            [0.46],
-            [0.40],
-            [0.50],
-            [0.30],
-            [0.33],
-            [0.41],
-            [0.28],
-            [0.25],
-            [0.34],
-            [0.18],
-            [0.29],
-            [0.22],
-            [0.21],
-            [0.26],
-            [0.29],
-            [0.30],
-            [0.32],
-            [0.42],
-            [0.45],
-            [0.55],
-            [0.59],
-            [0.69],
-            [0.73],
-            [0.65],
-            [0.50],
-            [0.57],
-            [0.48],
-            [0.63],
-            [0.49],
-            [0.48],
-            [0.38],
-            [0.63],
-            [0.61],
-            [0.70],
-            [0.62],
-            [0.74],
-            [0.54],
-            [0.49],
-            [0.37],
-            [0.36],
-            [0.42],
-            [0.41],
-            [0.31],
-            [0.41],
-            [0.47],
-            [0.69],
-            [0.63],
-            [0.61],
-            [0.61],
-            [0.47],
-            [0.53],
-            [0.54],
-            [0.54],
-            [0.59],
-            [0.39],
-            [0.37],
-            [0.37],
-            [0.38],
-            [0.36],
-            [0.38],
-            [0.24],
-            [0.20],
-            [0.14],
-            [0.11],
-            [0.08],
-            [0.09],
-            [0.13],
-            [0.14],
-            [0.23],
-            [0.24],
-            [0.25],
-            [0.22],
-            [0.06],
-            [0.17],
-            [0.16],
-            [0.42],
-            [0.40],
-            [0.37],
-            [0.33],
-            [0.28],
-            [0.37],
-            [0.22],
-            [0.08],
-            [0.19],
-            [0.49],
-            [0.52],
-            [0.56],
-            [0.59],
-            [0.55],
-            [0.63],
-            [0.62],
-            [0.63],
-            [0.74],
-            [0.81],
-            [0.56],
-            [0.60],
-            [0.56],
-            [0.73],
-            [0.72],
-            [0.76],
-            [0.79],
-            [0.90],
-            [0.91],
-            [0.82],
-            [0.82],
-            [0.82],
-            [0.92],
-            [0.88],
-            [0.84],
-            [0.75],
-            [0.56],
-            [0.47],
-            [0.36],
-            [0.30],
-            [0.29],
-            [0.43],
-            [0.47],
-            [0.43],
-            [0.52],
-            [0.54],
-            [0.59],
-            [0.50],
-            [0.47],
-            [0.56],
-            [0.61],
-            [0.83],
-            [0.77],
-            [0.84],
-            [0.74],
-            [0.57],
-            [0.57],
-            [0.45],
-            [0.30],
-            [0.21],
-            [0.19],
-            [0.20],
-            [0.18],
-            [0.15],
-            [0.21],
-            [0.19],
-            [0.23],
-            [0.41],
-            [0.42],
-            [0.32],
-            [0.36],
-            [0.37],
-            [0.41],
-            [0.52],
-            [0.37],
-            [0.38],
-            [0.29],
-            [0.35],
-            [0.22],
-            [0.44],
-            [0.42],
-            [0.51],
-            [0.43],
-            [0.37],
-            [0.22],
-            [0.22],
-            [0.22],
-            [0.15],
-            [0.15],
-            [0.21],
-            [0.20],
-            [0.29],
-            [0.25],
-            [0.44],
-            [0.53],
-            [0.46],
-            [0.26],
-            [0.50],
-            [0.36],
-            [0.34],
-            [0.62],
-            [0.41],
-            [0.38],
-            [0.25],
-            [0.45],
-            [0.32],
-            [0.36],
-            [0.60],
-            [0.59],
-            [0.35],
-            [0.36],
-            [0.41],
-            [0.52],
-            [0.54],
-            [0.57],
-            [0.56],
-            [0.37],
-            [0.42],
-            [0.39],
-            [0.31],
-            [0.36],
-            [0.43],
-            [0.44],
-            [0.31],
-            [0.36],
-            [0.43],
-            [0.47],
-            [0.44],
-            [0.42],
-            [0.39],
-            [0.24],
-            [0.20],
-            [0.20],
-            [0.20],
-            [0.21],
-            [0.29],
-            [0.48],
-            [0.42],
-            [0.61],
-            [0.60],
-            [0.56],
-            [0.42],
-            [0.66],
-            [0.52]])
-
-        return data
+        return sampledata.load_sample('ge_sample_wind.csv', ndmin=2)
 
 
     def solar_data(self):
-        data = numpy.array([
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.75],
-        [0.87],
-        [0.91],
-        [0.92],
-        [0.90],
-        [0.90],
-        [0.88],
-        [0.90],
-        [0.88],
-        [0.76],
-        [0.54],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.75],
-        [0.88],
-        [0.93],
-        [0.96],
-        [0.95],
-        [0.96],
-        [0.92],
-        [0.90],
-        [0.83],
-        [0.77],
-        [0.56],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.73],
-        [0.87],
-        [0.94],
-        [0.97],
-        [0.96],
-        [0.94],
-        [0.88],
-        [0.70],
-        [0.68],
-        [0.70],
-        [0.47],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.75],
-        [0.89],
-        [0.96],
-        [1.00],
-        [1.00],
-        [1.00],
-        [0.96],
-        [0.88],
-        [0.89],
-        [0.74],
-        [0.54],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.77],
-        [0.91],
-        [0.97],
-        [1.00],
-        [1.00],
-        [1.02],
-        [1.01],
-        [1.00],
-        [0.95],
-        [0.84],
-        [0.57],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.76],
-        [0.90],
-        [0.95],
-        [0.96],
-        [0.96],
-        [0.98],
-        [0.97],
-        [0.97],
-        [0.92],
-        [0.82],
-        [0.57],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.68],
-        [0.83],
-        [0.88],
-        [0.88],
-        [0.88],
-        [0.89],
-        [0.87],
-        [0.87],
-        [0.86],
-        [0.76],
-        [0.52],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.69],
-        [0.81],
-        [0.86],
-        [0.86],
-        [0.88],
-        [0.91],
-        [0.90],
-        [0.91],
-        [0.87],
-        [0.76],
-        [0.49],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.66],
-        [0.82],
-        [0.85],
-        [0.88],
-        [0.89],
-        [0.92],
-        [0.93],
-        [0.92],
-        [0.88],
-        [0.78],
-        [0.53],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.73],
-        [0.86],
-        [0.89],
-        [0.91],
-        [0.93],
-        [0.96],
-        [0.97],
-        [0.98],
-        [0.94],
-        [0.83],
-        [0.59],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.75],
-        [0.87],
-        [0.91],
-        [0.92],
-        [0.93],
-        [0.96],
-        [0.99],
-        [0.98],
-        [0.79],
-        [0.67],
-        [0.54],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.78],
-        [0.92],
-        [0.97],
-        [0.99],
-        [1.00],
-        [1.02],
-        [1.02],
-        [1.02],
-        [0.98],
-        [0.87],
-        [0.60],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.33],
-        [0.96],
-        [1.02],
-        [1.04],
-        [1.04],
-        [1.05],
-        [1.06],
-        [1.04],
-        [0.98],
-        [0.86],
-        [0.60],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.76],
-        [0.92],
-        [0.98],
-        [1.00],
-        [1.00],
-        [1.01],
-        [1.00],
-        [0.99],
-        [0.94],
-        [0.81],
-        [0.55],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.72],
-        [0.88],
-        [0.94],
-        [0.95],
-        [0.84],
-        [0.82],
-        [0.79],
-        [0.82],
-        [0.82],
-        [0.77],
-        [0.54],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.75],
-        [0.91],
-        [0.97],
-        [0.98],
-        [0.98],
-        [1.00],
-        [1.00],
-        [1.00],
-        [0.95],
-        [0.81],
-        [0.55],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.75],
-        [0.91],
-        [0.97],
-        [0.98],
-        [0.98],
-        [1.00],
-        [1.00],
-        [0.99],
-        [0.95],
-        [0.81],
-        [0.55],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.75],
-        [0.91],
-        [0.97],
-        [0.98],
-        [0.98],
-        [1.00],
-        [1.00],
-        [1.00],
-        [0.95],
-        [0.81],
-        [0.55],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.06],
-        [0.05],
-        [0.05],
-        [0.05],
-        [0.05],
-        [0.00],
-        [0.00],
-        [0.08],
-        [0.08],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.64],
-        [0.81],
-        [0.86],
-        [0.88],
-        [0.89],
-        [0.92],
-        [0.94],
-        [0.95],
-        [0.91],
-        [0.79],
-        [0.52],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.73],
-        [0.89],
-        [0.94],
-        [0.96],
-        [0.96],
-        [0.99],
-        [1.02],
-        [1.01],
-        [0.96],
-        [0.83],
-        [0.55],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.76],
-        [0.94],
-        [1.01],
-        [1.03],
-        [1.01],
-        [1.04],
-        [1.05],
-        [1.03],
-        [0.97],
-        [0.83],
-        [0.55],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.74],
-        [0.92],
-        [0.97],
-        [0.99],
-        [0.97],
-        [0.98],
-        [0.98],
-        [0.98],
-        [0.93],
-        [0.78],
-        [0.51],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.71],
-        [0.88],
-        [0.95],
-        [0.94],
-        [0.95],
-        [0.98],
-        [0.96],
-        [0.96],
-        [0.92],
-        [0.79],
-        [0.51],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.72],
-        [0.89],
-        [0.96],
-        [0.96],
-        [0.94],
-        [0.95],
-        [0.95],
-        [0.94],
-        [0.85],
-        [0.75],
-        [0.49],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.69],
-        [0.86],
-        [0.92],
-        [0.92],
-        [0.90],
-        [0.93],
-        [0.94],
-        [0.93],
-        [0.88],
-        [0.75],
-        [0.48],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.64],
-        [0.80],
-        [0.85],
-        [0.85],
-        [0.78],
-        [0.81],
-        [0.85],
-        [0.78],
-        [0.71],
-        [0.57],
-        [0.33],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.41],
-        [0.63],
-        [0.00],
-        [0.00],
-        [0.10],
-        [0.49],
-        [0.58],
-        [0.63],
-        [0.54],
-        [0.39],
-        [0.16],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00],
-        [0.00]])
+        return sampledata.load_sample('ge_sample_solar.csv', ndmin=2)
 
-        return data
 
     def demand_in_data(self):
-        data = numpy.array(
-        [ 5613.12, 5457.9,  5486.41, 5127.5,  5017.25, 5284.15, 6049.37, 7077.84,
-          7817.0,   8524.11, 8981.96, 9290.07, 9470.88, 9531.24, 9358.38, 8829.89,
-          8470.57, 7958.83, 7362.79, 6777.86, 6434.72, 6201.72, 5665.59, 5299.64,
-          5336.36, 4983.64, 5078.82, 4779.8,  4731.6,  5082.76, 5783.5,  6454.27,
-          6632.11, 6934.29, 7184.71, 7465.25, 7591.24, 7883.77, 8170.81, 8355.33,
-          8594.05, 8479.46, 8028.87, 7668.04, 7367.62, 7042.31, 6319.13, 5898.01,
-          5793.54, 5365.07, 5454.33, 5118.77, 5106.33, 5364.32, 6017.56, 6686.89,
-          6913.42, 7016.0,   7074.48, 7081.49, 7203.13, 7387.7,  7502.94, 7594.67,
-          7734.47, 7603.08, 7019.6,  6608.3,  6476.33, 6172.52, 5627.71, 5403.78,
-          5377.36, 5008.35, 5146.23, 4856.54, 4783.02, 5073.84, 5785.28, 6591.42,
-          6759.48, 7131.95, 7245.03, 7386.86, 7525.52, 7671.19, 7715.56, 7703.57,
-          8033.26, 7791.17, 7358.82, 6880.91, 6498.86, 6170.19, 5769.29, 5577.2,
-          5527.06, 5127.83, 5230.97, 4784.44, 4641.75, 4665.39, 4881.93, 5204.89,
-          5422.86, 5638.78, 5655.8,  5711.18, 5564.56, 5462.02, 5315.57, 5267.99,
-          5378.27, 5503.54, 5420.78, 5141.49, 4982.95, 4944.47, 4673.37, 4522.58,
-          4635.18, 4299.85, 4439.13, 4093.13, 3920.86, 3923.26, 4010.64, 4325.33,
-          4510.03, 4784.52, 4932.15, 5033.74, 5039.86, 4996.98, 4929.4,  4854.46,
-          4977.23, 5154.01, 5142.48, 5099.74, 5237.44, 5208.4,  4721.12, 4639.55,
-          4738.24, 4516.49, 4650.52, 4524.45, 4494.64, 4757.13, 5454.82, 6232.04,
-          6180.45, 6276.13, 6301.37, 6392.47, 6338.94, 6279.02, 6223.48, 6212.69,
-          6259.18, 6149.58, 5860.89, 5602.86, 5673.42, 5501.38, 5125.15, 4895.18,
-          5018.72, 4694.73, 4895.71, 4549.97, 4474.96, 4728.73, 5385.93, 6052.79,
-          6058.85, 6152.28, 6250.14, 6292.17, 6296.54, 6323.08, 6309.94, 6250.09,
-          6282.78, 6172.72, 5890.43, 5664.24, 5658.54, 5509.93, 5072.6,  4854.56,
-          4901.99, 4610.67, 4775.13, 4454.39, 4371.5,  4630.13, 5407.75, 6207.31,
-          6173.87, 6208.89, 6279.53, 6405.05, 6522.72, 6703.7,  6853.38, 6841.5,
-          6959.48, 6772.23, 6374.81, 6121.5,  6108.55, 5855.72, 5404.37, 5115.83,
-          5198.72, 4826.69, 4944.01, 4683.51, 4622.8,  4872.22, 5583.08, 6400.77,
-          6514.34, 6700.86, 6843.4,  7134.41, 7291.02, 7485.28, 7561.6,  7531.46,
-          7640.81, 7530.51, 7179.68, 6981.76, 6949.53, 6386.86, 5835.86, 5499.63,
-          5518.36, 5112.75, 5312.23, 5011.65, 4976.46, 5266.9,  5988.3,  6804.71,
-          7022.22, 7166.03, 7297.53, 7419.57, 7288.27, 7224.69, 6996.66, 6781.32,
-          6696.35, 6465.83, 6202.33, 5895.74, 5740.6,  5461.24, 5095.95, 4909.32,
-          4971.6,  4590.01, 4667.02, 4343.09, 4270.81, 4285.57, 4544.73, 4856.19,
-          5160.0,   5344.61, 5392.57, 5449.97, 5440.71, 5373.33, 5385.48, 5334.35,
-          5395.96, 5376.42, 5289.76, 5142.25, 5160.06, 5152.04, 4922.81, 4801.41,
-          4932.43, 4503.91, 4656.71, 4334.44, 4186.9,  4198.49, 4300.52, 4552.99,
-          4819.27, 5023.46, 5077.31, 5216.92, 5275.93, 5236.52, 5212.51, 5199.2,
-          5289.91, 5395.22, 5381.53, 5265.8,  5379.1,  5287.09, 4887.32, 4671.07,
-          4808.28, 4572.8,  4747.84, 4487.5,  4357.16, 4643.37, 5311.75, 6026.07,
-          6030.32, 6250.09, 6366.33, 6499.78, 6570.89, 6667.79, 6729.41, 6750.94,
-          6904.78, 6780.85, 6423.96, 6058.49, 6047.51, 5809.19, 5375.04, 5126.57,
-          5226.46, 4927.14, 5033.61, 4738.59, 4717.04, 4997.3,  5564.1,  6175.48,
-          6362.76, 6507.0,   6886.34, 7108.65, 7286.02, 7473.48, 7597.01, 7628.71,
-          7727.71, 7554.39, 7069.57, 6615.14, 6508.89, 6149.59, 5641.94, 5350.63,
-          5271.37, 4972.94, 5093.87, 4772.11, 4736.01, 4972.0,   5675.63, 6446.79,
-          6619.46, 6934.25, 7042.43, 7233.68, 7371.53, 7560.61, 7667.4,  7635.63,
-          7595.53, 7247.07, 6800.59, 6528.25, 6393.22, 6020.43, 5512.18, 5275.13,
-          5286.59, 4977.56, 5128.56, 4813.64, 4780.53, 5079.85, 5821.57, 6682.48,
-          6778.76, 6972.6,  7102.42, 7215.49, 7284.12, 7378.53, 7332.75, 7530.89,
-          7623.13, 7480.03, 6964.26, 6557.76, 6487.97, 5986.21, 5481.4,  5160.25,
-          5201.33, 4884.39, 5016.62, 4670.96, 4625.46, 4900.39, 5602.25, 6306.45,
-          6511.13, 6780.02, 6898.2,  6983.83, 7124.25, 7286.84, 7433.47, 7411.76,
-          7397.29, 7172.64, 6708.62, 6323.25, 6213.4,  5754.72, 5384.19, 5058.13,
-          5040.76, 4660.92, 4806.28, 4413.22, 4249.99, 4367.68, 4721.43, 5111.88,
-          5407.94, 5810.48, 6025.17, 6072.86, 6010.6,  5913.23, 5787.24, 5763.74,
-          5757.83, 5695.06, 5568.33, 5399.71, 5435.75, 5278.61, 4996.81, 4807.23,
-          4862.98, 4548.69, 4696.52, 4306.86, 4112.04, 4050.21, 4092.18, 4269.6,
-          4543.47, 4810.5,  4856.85, 4923.66, 4985.0,   4892.79, 4843.64, 4884.47,
-          4976.52, 5047.6,  5063.38, 4993.76, 5125.03, 4952.38, 4588.18, 4427.5,
-          4530.27, 4314.59, 4494.24, 4206.08, 4147.13, 4423.24, 5196.81, 5952.57,
-          6007.05, 6050.8,  6079.48, 6075.97, 6105.46, 6092.6,  6070.33, 6056.65,
-          6154.5,  6138.14, 5880.09, 5703.97, 5839.89, 5622.14, 5178.7,  4874.48,
-          4990.14, 4636.92, 4848.16, 4546.05, 4513.46, 4781.69, 5532.38, 6272.08,
-          6255.67, 6210.85, 6185.05, 6251.19, 6218.45, 6285.23, 6275.14, 6215.94,
-          6237.71, 6170.96, 5904.41, 5722.13, 5888.42, 5556.6,  5088.8,  4858.47,
-          4923.98, 4618.19, 4803.76, 4478.44, 4372.15, 4743.4,  5475.84, 6245.58,
-          6271.64, 6365.42, 6449.64, 6361.34, 6626.64, 6652.11, 6692.8,  6669.18,
-          6724.85, 6532.77, 6199.82, 5873.56, 5920.7,  5639.43, 5205.4,  4999.19,
-          5115.21, 4795.78, 4930.54, 4649.36, 4605.57, 4922.33, 5665.13, 6355.98,
-          6270.26, 6423.34, 6496.44, 6597.17, 6720.77, 6822.4,  6905.61, 6892.82,
-          7010.78, 6755.41, 6380.06, 6098.72, 6164.6,  5720.35, 5274.99, 5073.41,
-          5167.55, 4781.31, 5018.99, 4685.59, 4634.05, 4943.44, 5655.75, 6353.5,
-          6393.19, 6490.09, 6572.27, 6620.03, 6703.05, 6763.61, 6719.56, 6740.65,
-          6677.24, 6567.69, 6220.96, 5962.34, 6004.31, 5668.7,  5329.61, 5133.39,
-          5150.0,   4855.26, 4942.41, 4561.28, 4504.69, 4579.47, 4865.64, 5217.72,
-          5478.45, 5695.19, 5836.7,  5941.41, 6030.21, 6105.94, 6103.6,  6199.82,
-          6283.05, 6158.0,   5974.42, 5814.06, 5791.81, 5558.75, 5234.47, 5045.81,
-          5100.29, 4771.02, 4887.48, 4556.57, 4464.29, 4451.33, 4591.54, 4878.33,
-          5045.56, 5321.3,  5477.54, 5512.29, 5525.69, 5493.03, 5464.26, 5483.88,
-          5598.52, 5699.23, 5634.23, 5565.0,   5632.73, 5344.17, 4962.85, 4791.96,
-          4902.76, 4623.83, 4840.35, 4583.51, 4547.16, 4843.75, 5598.22, 6380.35,
-          6398.12, 6569.02, 6577.66, 6664.14, 6723.1,  6726.25, 6729.63, 6618.37,
-          6757.79, 6734.27, 6469.22, 6270.86, 6222.32, 5837.27, 5294.43, 5040.0],
-          dtype=float)
-          
-        return data
-          
+        return sampledata.load_sample('ge_sample_demand_in.csv')
+
+
     def dow_data(self):
         """dow_data is defined as 1 for a 'D', 0 for an 'E'.
         """
-        data = numpy.array(
-            [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
-            0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
-            0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,
-            0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
-            0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-            1,1,1,1,1,1], dtype=int)
+        return sampledata.load_sample('ge_sample_dow.csv', dtype=int)
+
 
-        return data
-            
     def temperature_data(self):
-        data = numpy.array(
-         [ 25.6, 25.4, 25.7, 28.3, 26.4, 29.0,  29.8, 30.5, 32.3, 34.3, 37.5, 37.6,
-          38.9, 39.4, 28.5, 24.5, 22.9, 22.3, 22.3, 21.7, 21.5, 21.1, 20.0,  19.5,
-          18.5, 18.1, 17.8, 17.8, 17.7, 17.9, 18.3, 18.5, 19.6, 21.8, 23.5, 23.8,
-          26.1, 25.3, 25.0,  26.6, 26.5, 26.1, 26.1, 25.1, 23.3, 23.2, 21.8, 21.6,
-          21.1, 20.8, 20.7, 20.7, 20.2, 19.8, 19.9, 19.9, 18.6, 18.9, 18.7, 19.7,
-          21.5, 22.6, 23.5, 23.7, 24.1, 24.1, 22.3, 21.3, 21.7, 21.6, 20.9, 20.3,
-          19.7, 19.7, 18.6, 18.5, 18.8, 19.2, 20.2, 21.8, 24.0,  24.7, 25.7, 26.0,
-          28.7, 28.9, 26.2, 28.8, 29.8, 28.5, 27.7, 22.4, 22.3, 22.8, 22.7, 22.6,
-          23.1, 23.0,  21.1, 20.5, 19.4, 18.4, 18.2, 18.2, 18.4, 18.3, 18.6, 18.7,
-          18.7, 18.7, 19.0,  19.8, 20.2, 19.1, 18.1, 18.1, 18.5, 17.1, 14.9, 14.1,
-          14.4, 14.4, 14.0,  13.7, 13.3, 13.1, 12.8, 13.3, 14.8, 15.5, 16.4, 15.3,
-          18.0,  18.9, 19.0,  19.3, 19.2, 18.7, 17.7, 16.1, 15.7, 15.6, 14.7, 13.4,
-          13.5, 12.5, 12.7, 12.3, 11.8, 11.0,  11.0,  12.5, 15.0,  17.0,  17.3, 18.4,
-          19.4, 19.3, 20.2, 21.1, 20.2, 20.5, 18.8, 18.2, 17.9, 17.8, 17.7, 17.5,
-          16.4, 15.7, 15.4, 14.9, 14.7, 14.9, 15.5, 16.9, 17.9, 17.9, 18.8, 19.9,
-          19.1, 20.7, 21.9, 21.5, 20.2, 20.3, 18.5, 17.5, 16.6, 16.1, 15.6, 15.3,
-          14.9, 14.7, 14.0,  13.7, 14.4, 13.9, 13.5, 13.9, 14.7, 16.9, 18.8, 21.0,
-          24.3, 26.2, 23.4, 24.8, 24.2, 22.8, 24.2, 22.1, 21.5, 21.2, 20.7, 20.2,
-          20.0,  19.2, 19.0,  18.5, 18.6, 18.9, 19.1, 19.3, 20.9, 22.2, 25.5, 26.9,
-          27.0,  27.7, 28.0,  28.4, 28.7, 29.1, 29.3, 28.2, 28.0,  24.0,  23.8, 24.1,
-          23.1, 23.0,  23.7, 23.9, 22.4, 22.2, 22.2, 23.4, 23.2, 22.9, 24.6, 25.6,
-          23.0,  22.0,  21.0,  20.8, 19.8, 19.3, 19.0,  18.3, 17.7, 18.0,  18.0,  17.9,
-          17.9, 16.7, 16.0,  15.9, 15.6, 15.5, 15.8, 15.8, 15.6, 16.5, 17.8, 19.0,
-          19.0,  19.5, 20.1, 20.0,  19.5, 18.7, 18.0,  16.8, 16.3, 15.9, 15.2, 14.8,
-          15.0,  14.4, 14.2, 14.2, 13.9, 13.6, 13.5, 13.9, 14.7, 15.6, 17.1, 18.4,
-          19.3, 19.7, 20.6, 20.4, 21.0,  21.0,  20.0,  18.2, 17.6, 17.5, 17.1, 16.4,
-          15.9, 15.6, 15.3, 14.8, 14.8, 15.0,  14.8, 15.3, 17.1, 17.1, 19.2, 19.6,
-          22.2, 22.5, 23.9, 24.2, 23.4, 23.7, 23.2, 22.3, 22.1, 21.5, 20.3, 19.0,
-          18.3, 17.7, 17.5, 17.3, 17.1, 16.9, 16.8, 18.1, 20.8, 23.3, 25.6, 26.8,
-          28.5, 28.8, 29.2, 29.2, 28.6, 28.4, 26.9, 25.9, 24.8, 24.2, 22.7, 22.6,
-          21.3, 20.8, 20.4, 20.3, 19.2, 19.6, 19.8, 20.9, 23.4, 24.4, 25.2, 26.6,
-          27.0,  28.1, 27.7, 27.5, 27.5, 26.3, 24.8, 22.2, 19.8, 19.7, 19.9, 20.2,
-          19.8, 19.8, 19.8, 19.9, 20.1, 20.0,  20.4, 20.7, 21.3, 22.5, 22.8, 25.2,
-          25.7, 27.0,  27.2, 26.8, 27.1, 27.4, 26.3, 22.9, 22.4, 22.0,  21.2, 21.0,
-          20.8, 20.6, 20.6, 20.1, 20.2, 19.5, 19.4, 19.8, 21.3, 22.0,  22.7, 24.4,
-          26.9, 27.8, 28.6, 28.9, 27.5, 25.6, 24.9, 24.1, 24.0,  23.4, 22.9, 21.6,
-          21.2, 20.2, 19.9, 19.9, 21.5, 22.9, 23.1, 23.0,  25.3, 26.4, 27.2, 28.0,
-          27.8, 26.7, 27.9, 26.0,  25.9, 25.4, 23.7, 22.4, 21.1, 20.7, 19.9, 19.2,
-          18.6, 18.2, 17.7, 16.9, 16.6, 17.6, 17.8, 18.0,  20.3, 21.2, 20.1, 18.0,
-          19.7, 20.4, 20.5, 19.1, 19.9, 18.9, 17.4, 16.5, 15.9, 15.0,  14.3, 13.8,
-          13.4, 12.9, 12.3, 11.9, 11.9, 12.1, 12.2, 13.1, 15.2, 17.1, 17.5, 17.1,
-          18.2, 19.4, 17.5, 18.7, 18.4, 18.2, 17.2, 16.7, 15.6, 16.2, 15.6, 15.3,
-          14.6, 14.3, 14.2, 14.5, 14.0,  14.3, 14.9, 14.9, 15.6, 17.0,  19.0,  18.8,
-          18.8, 19.5, 21.0,  20.4, 19.7, 18.8, 18.0,  17.8, 17.2, 16.7, 16.3, 16.3,
-          16.0,  16.0,  15.8, 15.5, 15.7, 15.7, 16.0,  16.1, 16.7, 17.3, 19.1, 20.4,
-          21.1, 20.5, 21.0,  22.1, 22.5, 21.6, 20.4, 18.7, 17.6, 17.2, 16.2, 15.9,
-          16.2, 16.0,  15.6, 14.9, 14.6, 13.9, 14.0,  14.8, 15.8, 17.6, 20.2, 20.5,
-          21.8, 21.9, 21.9, 23.9, 23.9, 22.3, 22.0,  19.7, 19.0,  18.2, 17.4, 17.3,
-          17.2, 17.3, 16.9, 16.9, 16.6, 16.7, 16.9, 16.9, 17.4, 18.4, 18.6, 20.2,
-          21.3, 22.1, 22.2, 22.0,  21.6, 21.6, 21.2, 20.4, 20.1, 19.3, 18.7, 17.6,
-          17.4, 17.3, 16.7, 16.2, 16.0,  15.8, 15.6, 17.2, 19.3, 20.7, 24.0,  26.9,
-          29.3, 27.8, 28.2, 27.3, 27.9, 25.2, 23.3, 22.3, 20.4, 20.7, 19.8, 20.2,
-          20.2, 19.8, 20.2, 20.1, 19.8, 19.5, 19.6, 18.8, 18.1, 18.0,  17.8, 18.1,
-          18.4, 18.3, 18.3, 19.0,  18.7, 18.6, 18.3, 17.9, 17.8, 17.5, 17.1, 16.8,
-          16.6, 16.5, 16.3, 16.2, 16.1, 16.1, 16.3, 16.3, 16.5, 16.7, 17.0,  17.4,
-          17.8, 17.3, 17.6, 17.7, 17.6, 17.3, 16.9, 16.9, 16.6, 16.6, 16.2, 15.3],
-          dtype=float)
-          
-        return data
+        return sampledata.load_sample('ge_sample_temperature.csv')
+
 
     def time_data(self):
-        data = numpy.array(
-          [ 2455593.5,     2455593.54167, 2455593.58333, 2455593.625,   2455593.66667,
-          2455593.70833, 2455593.75,    2455593.79167, 2455593.83333, 2455593.875,
-          2455593.91667, 2455593.95833, 2455594.0,      2455594.04167, 2455594.08333,
-          2455594.125,   2455594.16667, 2455594.20833, 2455594.25,    2455594.29167,
-          2455594.33333, 2455594.375,   2455594.41667, 2455594.45833, 2455594.5,
-          2455594.54167, 2455594.58333, 2455594.625,   2455594.66667, 2455594.70833,
-          2455594.75,    2455594.79167, 2455594.83333, 2455594.875,   2455594.91667,
-          2455594.95833, 2455595.0,      2455595.04167, 2455595.08333, 2455595.125,
-          2455595.16667, 2455595.20833, 2455595.25,    2455595.29167, 2455595.33333,
-          2455595.375,   2455595.41667, 2455595.45833, 2455595.5,     2455595.54167,
-          2455595.58333, 2455595.625,   2455595.66667, 2455595.70833, 2455595.75,
-          2455595.79167, 2455595.83333, 2455595.875,   2455595.91667, 2455595.95833,
-          2455596.0,      2455596.04167, 2455596.08333, 2455596.125,   2455596.16667,
-          2455596.20833, 2455596.25,    2455596.29167, 2455596.33333, 2455596.375,
-          2455596.41667, 2455596.45833, 2455596.5,     2455596.54167, 2455596.58333,
-          2455596.625,   2455596.66667, 2455596.70833, 2455596.75,    2455596.79167,
-          2455596.83333, 2455596.875,   2455596.91667, 2455596.95833, 2455597.0,
-          2455597.04167, 2455597.08333, 2455597.125,   2455597.16667, 2455597.20833,
-          2455597.25,    2455597.29167, 2455597.33333, 2455597.375,   2455597.41667,
-          2455597.45833, 2455597.5,     2455597.54167, 2455597.58333, 2455597.625,
-          2455597.66667, 2455597.70833, 2455597.75,    2455597.79167, 2455597.83333,
-          2455597.875,   2455597.91667, 2455597.95833, 2455598.0,      2455598.04167,
-          2455598.08333, 2455598.125,   2455598.16667, 2455598.20833, 2455598.25,
-          2455598.29167, 2455598.33333, 2455598.375,   2455598.41667, 2455598.45833,
-          2455598.5,     2455598.54167, 2455598.58333, 2455598.625,   2455598.66667,
-          2455598.70833, 2455598.75,    2455598.79167, 2455598.83333, 2455598.875,
-          2455598.91667, 2455598.95833, 2455599.0,      2455599.04167, 2455599.08333,
-          2455599.125,   2455599.16667, 2455599.20833, 2455599.25,    2455599.29167,
-          2455599.33333, 2455599.375,   2455599.41667, 2455599.45833, 2455599.5,
-          2455599.54167, 2455599.58333, 2455599.625,   2455599.66667, 2455599.70833,
-          2455599.75,    2455599.79167, 2455599.83333, 2455599.875,   2455599.91667,
-          2455599.95833, 2455600.0,      2455600.04167, 2455600.08333, 2455600.125,
-          2455600.16667, 2455600.20833, 2455600.25,    2455600.29167, 2455600.33333,
-          2455600.375,   2455600.41667, 2455600.45833, 2455600.5,     2455600.54167,
-          2455600.58333, 2455600.625,   2455600.66667, 2455600.70833, 2455600.75,
-          2455600.79167, 2455600.83333, 2455600.875,   2455600.91667, 2455600.95833,
-          2455601.0,      2455601.04167, 2455601.08333, 2455601.125,   2455601.16667,
-          2455601.20833, 2455601.25,    2455601.29167, 2455601.33333, 2455601.375,
-          2455601.41667, 2455601.45833, 2455601.5,     2455601.54167, 2455601.58333,
-          2455601.625,   2455601.66667, 2455601.70833, 2455601.75,    2455601.79167,
-          2455601.83333, 2455601.875,   2455601.91667, 2455601.95833, 2455602.0,
-          2455602.04167, 2455602.08333, 2455602.125,   2455602.16667, 2455602.20833,
-          2455602.25,    2455602.29167, 2455602.33333, 2455602.375,   2455602.41667,
-          2455602.45833, 2455602.5,     2455602.54167, 2455602.58333, 2455602.625,
-          2455602.66667, 2455602.70833, 2455602.75,    2455602.79167, 2455602.83333,
-          2455602.875,   2455602.91667, 2455602.95833, 2455603.0,      2455603.04167,
-          2455603.08333, 2455603.125,   2455603.16667, 2455603.20833, 2455603.25,
-          2455603.29167, 2455603.33333, 2455603.375,   2455603.41667, 2455603.45833,
-          2455603.5,     2455603.54167, 2455603.58333, 2455603.625,   2455603.66667,
-          2455603.70833, 2455603.75,    2455603.79167, 2455603.83333, 2455603.875,
-          2455603.91667, 2455603.95833, 2455604.0,      2455604.04167, 2455604.08333,
-          2455604.125,   2455604.16667, 2455604.20833, 2455604.25,    2455604.29167,
-          2455604.33333, 2455604.375,   2455604.41667, 2455604.45833, 2455604.5,
-          2455604.54167, 2455604.58333, 2455604.625,   2455604.66667, 2455604.70833,
-          2455604.75,    2455604.79167, 2455604.83333, 2455604.875,   2455604.91667,
-          2455604.95833, 2455605.0,      2455605.04167, 2455605.08333, 2455605.125,
-          2455605.16667, 2455605.20833, 2455605.25,    2455605.29167, 2455605.33333,
-          2455605.375,   2455605.41667, 2455605.45833, 2455605.5,     2455605.54167,
-          2455605.58333, 2455605.625,   2455605.66667, 2455605.70833, 2455605.75,
-          2455605.79167, 2455605.83333, 2455605.875,   2455605.91667, 2455605.95833,
-          2455606.0,      2455606.04167, 2455606.08333, 2455606.125,   2455606.16667,
-          2455606.20833, 2455606.25,    2455606.29167, 2455606.33333, 2455606.375,
-          2455606.41667, 2455606.45833, 2455606.5,     2455606.54167, 2455606.58333,
-          2455606.625,   2455606.66667, 2455606.70833, 2455606.75,    2455606.79167,
-          2455606.83333, 2455606.875,   2455606.91667, 2455606.95833, 2455607.0,
-          2455607.04167, 2455607.08333, 2455607.125,   2455607.16667, 2455607.20833,
-          2455607.25,    2455607.29167, 2455607.33333, 2455607.375,   2455607.41667,
-          2455607.45833, 2455607.5,     2455607.54167, 2455607.58333, 2455607.625,
-          2455607.66667, 2455607.70833, 2455607.75,    2455607.79167, 2455607.83333,
-          2455607.875,   2455607.91667, 2455607.95833, 2455608.0,      2455608.04167,
-          2455608.08333, 2455608.125,   2455608.16667, 2455608.20833, 2455608.25,
-          2455608.29167, 2455608.33333, 2455608.375,   2455608.41667, 2455608.45833,
-          2455608.5,     2455608.54167, 2455608.58333, 2455608.625,   2455608.66667,
-          2455608.70833, 2455608.75,    2455608.79167, 2455608.83333, 2455608.875,
-          2455608.91667, 2455608.95833, 2455609.0,      2455609.04167, 2455609.08333,
-          2455609.125,   2455609.16667, 2455609.20833, 2455609.25,    2455609.29167,
-          2455609.33333, 2455609.375,   2455609.41667, 2455609.45833, 2455609.5,
-          2455609.54167, 2455609.58333, 2455609.625,   2455609.66667, 2455609.70833,
-          2455609.75,    2455609.79167, 2455609.83333, 2455609.875,   2455609.91667,
-          2455609.95833, 2455610.0,      2455610.04167, 2455610.08333, 2455610.125,
-          2455610.16667, 2455610.20833, 2455610.25,    2455610.29167, 2455610.33333,
-          2455610.375,   2455610.41667, 2455610.45833, 2455610.5,     2455610.54167,
-          2455610.58333, 2455610.625,   2455610.66667, 2455610.70833, 2455610.75,
-          2455610.79167, 2455610.83333, 2455610.875,   2455610.91667, 2455610.95833,
-          2455611.0,      2455611.04167, 2455611.08333, 2455611.125,   2455611.16667,
-          2455611.20833, 2455611.25,    2455611.29167, 2455611.33333, 2455611.375,
-          2455611.41667, 2455611.45833, 2455611.5,     2455611.54167, 2455611.58333,
-          2455611.625,   2455611.66667, 2455611.70833, 2455611.75,    2455611.79167,
-          2455611.83333, 2455611.875,   2455611.91667, 2455611.95833, 2455612.0,
-          2455612.04167, 2455612.08333, 2455612.125,   2455612.16667, 2455612.20833,
-          2455612.25,    2455612.29167, 2455612.33333, 2455612.375,   2455612.41667,
-          2455612.45833, 2455612.5,     2455612.54167, 2455612.58333, 2455612.625,
-          2455612.66667, 2455612.70833, 2455612.75,    2455612.79167, 2455612.83333,
-          2455612.875,   2455612.91667, 2455612.95833, 2455613.0,      2455613.04167,
-          2455613.08333, 2455613.125,   2455613.16667, 2455613.20833, 2455613.25,
-          2455613.29167, 2455613.33333, 2455613.375,   2455613.41667, 2455613.45833,
-          2455613.5,     2455613.54167, 2455613.58333, 2455613.625,   2455613.66667,
-          2455613.70833, 2455613.75,    2455613.79167, 2455613.83333, 2455613.875,
-          2455613.91667, 2455613.95833, 2455614.0,      2455614.04167, 2455614.08333,
-          2455614.125,   2455614.16667, 2455614.20833, 2455614.25,    2455614.29167,
-          2455614.33333, 2455614.375,   2455614.41667, 2455614.45833, 2455614.5,
-          2455614.54167, 2455614.58333, 2455614.625,   2455614.66667, 2455614.70833,
-          2455614.75,    2455614.79167, 2455614.83333, 2455614.875,   2455614.91667,
-          2455614.95833, 2455615.0,      2455615.04167, 2455615.08333, 2455615.125,
-          2455615.16667, 2455615.20833, 2455615.25,    2455615.29167, 2455615.33333,
-          2455615.375,   2455615.41667, 2455615.45833, 2455615.5,     2455615.54167,
-          2455615.58333, 2455615.625,   2455615.66667, 2455615.70833, 2455615.75,
-          2455615.79167, 2455615.83333, 2455615.875,   2455615.91667, 2455615.95833,
-          2455616.0,      2455616.04167, 2455616.08333, 2455616.125,   2455616.16667,
-          2455616.20833, 2455616.25,    2455616.29167, 2455616.33333, 2455616.375,
-          2455616.41667, 2455616.45833, 2455616.5,     2455616.54167, 2455616.58333,
-          2455616.625,   2455616.66667, 2455616.70833, 2455616.75,    2455616.79167,
-          2455616.83333, 2455616.875,   2455616.91667, 2455616.95833, 2455617.0,
-          2455617.04167, 2455617.08333, 2455617.125,   2455617.16667, 2455617.20833,
-          2455617.25,    2455617.29167, 2455617.33333, 2455617.375,   2455617.41667,
-          2455617.45833, 2455617.5,     2455617.54167, 2455617.58333, 2455617.625,
-          2455617.66667, 2455617.70833, 2455617.75,    2455617.79167, 2455617.83333,
-          2455617.875,   2455617.91667, 2455617.95833, 2455618.0,      2455618.04167,
-          2455618.08333, 2455618.125,   2455618.16667, 2455618.20833, 2455618.25,
-          2455618.29167, 2455618.33333, 2455618.375,   2455618.41667, 2455618.45833,
-          2455618.5,     2455618.54167, 2455618.58333, 2455618.625,   2455618.66667,
-          2455618.70833, 2455618.75,    2455618.79167, 2455618.83333, 2455618.875,
-          2455618.91667, 2455618.95833, 2455619.0,      2455619.04167, 2455619.08333,
-          2455619.125,   2455619.16667, 2455619.20833, 2455619.25,    2455619.29167,
-          2455619.33333, 2455619.375,   2455619.41667, 2455619.45833, 2455619.5,
-          2455619.54167, 2455619.58333, 2455619.625,   2455619.66667, 2455619.70833,
-          2455619.75,    2455619.79167, 2455619.83333, 2455619.875,   2455619.91667,
-          2455619.95833, 2455620.0,      2455620.04167, 2455620.08333, 2455620.125,
-          2455620.16667, 2455620.20833, 2455620.25,    2455620.29167, 2455620.33333,
-          2455620.375,   2455620.41667, 2455620.45833, 2455620.5,     2455620.54167,
-          2455620.58333, 2455620.625,   2455620.66667, 2455620.70833, 2455620.75,
-          2455620.79167, 2455620.83333, 2455620.875,   2455620.91667, 2455620.95833,
-          2455621.0,      2455621.04167, 2455621.08333, 2455621.125,   2455621.16667,
-          2455621.20833, 2455621.25,    2455621.29167, 2455621.33333, 2455621.375,
-          2455621.41667, 2455621.45833],
-          dtype=float)
-          
-        return data
-        
-  
\ No newline at end of file
+        return sampledata.load_sample('ge_sample_time.csv')
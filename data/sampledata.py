@@ -0,0 +1,53 @@
+#
+#
+# Copyright (C) University of Melbourne 2012
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+
+
+"""Loads the sample datasets used by the sample Data classes, such as
+mg_sample_data and sample_ge_data, from the CSV files in data/sample_data.
+Keeping the data in files rather than as literals in the Python modules
+means it is not parsed and compiled each time the module is imported.
+"""
+
+import os
+import numpy
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_data')
+
+
+def load_sample(filename, dtype=float, ndmin=1):
+    """Load a sample dataset from a CSV file in data/sample_data, with one
+    row per timestep.
+    
+    Inputs:
+        filename: the name of the file in data/sample_data
+        dtype: the dtype of the array to return, default float
+        ndmin: 1 for a single series, 2 for a series with one column per site.
+        
+    Outputs:
+        numpy array of the data
+    """
+    return numpy.loadtxt(os.path.join(SAMPLE_DIR, filename), dtype=dtype,
+        delimiter=',', ndmin=ndmin)
@@ -41,6 +41,18 @@ class DemandMatrix(configurablebase.ConfigurableMultiBase):
 
     def __init__(self):
         configurablebase.ConfigurableMultiBase.__init__(self)
+        self.data = None
+        self.period_data = {}
+        self.period_bid_prices = {}
+
+
+    def complete_configuration_post_expand(self):
+        """If the data is already set, recalculate the per-period demand
+        for the new period configurations.
+        """
+        if self.data is not None:
+            self.precalc_period_data()
+        self.is_configured = True
 
 
     def get_config_spec(self):
@@ -80,6 +92,25 @@ class DemandMatrix(configurablebase.ConfigurableMultiBase):
         
         self.data = data[self.config['data_name']]
         self.node_list = data[self.config['node_list_name']]
+        self.precalc_period_data()
+
+
+    def precalc_period_data(self):
+        """Calculate the scaled demand matrix and the bid prices for each of
+        the configured periods, so that get_data and get_bid_prices just 
+        look them up.
+        """
+        self.period_data = {}
+        self.period_bid_prices = {}
+        
+        for period, conf in self.period_configs.iteritems():
+            scale_f = conf['scale']
+            if scale_f == 1:
+                self.period_data[period] = self.data
+            else:
+                self.period_data[period] = self.data * scale_f
+            
+            self.period_bid_prices[period] = numpy.ones(len(self.node_list)) * conf['bid_price']
 
 
     def get_node_names(self):
@@ -91,27 +122,21 @@ class DemandMatrix(configurablebase.ConfigurableMultiBase):
     
     def get_data(self, period):
         """Return the data matrix corresponding to the node names, for the
-        given period. Multiply the configured data matrix by the scale
-        value for the given period.
-        
-        ### TODO ### This should be precalculated.
+        given period. This is the configured data matrix multiplied by the 
+        scale value for the given period, as precalculated in 
+        precalc_period_data. The returned matrix must not be modified.
         """
         
-        scale_f = self.period_configs[period]['scale']
-        
-        if scale_f == 1:
-            return self.data
-        else:
-            return self.data * scale_f
+        return self.period_data[period]
         
     
     def get_bid_prices(self, period):
         """Return the bid price for the given period.
         This version just returns the same price for all nodes.
         The bid prices are output in the same order as the nodes in
-        get_node_names().
+        get_node_names(). The returned array must not be modified.
         """
         
-        return numpy.ones(len(self.node_list)) * self.period_configs[period]['bid_price']
+        return self.period_bid_prices[period]
         
             
@@ -31,6 +31,7 @@ Module for demand model using the TxMultiGeneratorBase base class.
 
 from generator import txmultigeneratorbase
 import numpy as np
+from demand import victempdemand
 
 class VicTempDemand(txmultigeneratorbase.TxMultiGeneratorBase):
     """Module implementing bottom-up temperature-based demand model for Victoria.
@@ -80,6 +81,10 @@ class VicTempDemand(txmultigeneratorbase.TxMultiGeneratorBase):
         self.ts_demand_in = data['ts_demand_in']
         self.ts_dow = data['ts_dow']
         self.ts_time = data['ts_time']
+
+        # The model outputs depend only on the period configuration and this data, 
+        # so are memoised by get_model_pred, keyed on the period configuration.
+        self.model_cache = {}
         
 
     def get_config_spec(self):
@@ -143,7 +148,38 @@ class VicTempDemand(txmultigeneratorbase.TxMultiGeneratorBase):
         """
 
         this_conf = self.period_configs[state_handle['curr_period']]
+        model_pred = self.get_model_pred(this_conf)
+
+        site_indices = self.get_site_indices(state_handle)
+        num_sites = len(site_indices) 
+        supply = np.zeros((num_sites, len(supply_request)))
+        vble_cost = np.zeros(num_sites)
+        carbon = np.zeros(num_sites)
 
+        # The demand model implemented here only makes sense as a single 'site'.
+        site = site_indices[0]
+        supply[0,:] = -model_pred 
+        vble_cost[0] = 0
+
+        return supply, vble_cost, carbon, {'ts_demand': np.copy(model_pred)}
+
+
+    def get_model_pred(self, this_conf):
+        """Return the modelled demand timeseries in MW for the period configuration
+        this_conf. This is calculated by calculate_model_pred the first time it
+        is requested for each distinct period configuration, and then kept in
+        self.model_cache. The returned array must not be modified.
+        """
+        key = tuple([this_conf[spec[0]] for spec in self.config_spec])
+        if key not in self.model_cache:
+            self.model_cache[key] = self.calculate_model_pred(this_conf)
+        return self.model_cache[key]
+
+
+    def calculate_model_pred(self, this_conf):
+        """Calculate the modelled demand timeseries in MW for the period 
+        configuration this_conf.
+        """
         
         # merge together the different factors into 4 different overall effects
         # this need to be refined to be more realistic (one day)
@@ -197,18 +233,7 @@ class VicTempDemand(txmultigeneratorbase.TxMultiGeneratorBase):
         # Convert from GW to MW
         model_pred *= 1000
         
-        site_indices = self.get_site_indices(state_handle)
-        num_sites = len(site_indices) 
-        supply = np.zeros((num_sites, len(supply_request)))
-        vble_cost = np.zeros(num_sites)
-        carbon = np.zeros(num_sites)
-
-        # The demand model implemented here only makes sense as a single 'site'.
-        site = site_indices[0]
-        supply[0,:] = -model_pred 
-        vble_cost[0] = 0
-
-        return supply, vble_cost, carbon, {'ts_demand': model_pred}
+        return model_pred
 
 
     def bottom_up(self,this_conf,weatherfac):
@@ -295,38 +320,9 @@ class VicTempDemand(txmultigeneratorbase.TxMultiGeneratorBase):
         t_step    = int(24/this_conf['timestep_hrs'])
         ndays     = len(demand)/t_step
 
-        for id in range(ndays):
-            daydemand = demand[id*t_step:id*t_step+t_step].copy()
-
-            # check the maximum available for load shaping
-
-            demandmean  = sum(daydemand)/float(t_step)
-            mean_filter = daydemand > demandmean
-            totavail    = sum(daydemand[mean_filter] - demandmean)
-            newtarget   = min(target, totavail)
-            newdemand   = daydemand.copy()
-            peak        = max(daydemand)
-            mini        = min(daydemand)
-
-            GWhsaved    = 0.0
-            counter     = 1
-            while GWhsaved <= newtarget:
-                yval                  = peak - 0.1*counter
-                GWh_filter            = daydemand > yval
-                GWhsaved              = sum(daydemand[GWh_filter] - yval)
-                newdemand[GWh_filter] = yval
-                counter += 1
-
-            counter   = 1
-            GWhearned = 0.0
-            while GWhearned <= GWhsaved:
-                yval                  = mini + 0.1*counter
-                GWh_filter            = daydemand < yval
-                GWhearned             = sum(yval - daydemand[GWh_filter])
-                newdemand[GWh_filter] = yval
-                counter += 1
-
-            shapediff[id*t_step:id*t_step+t_step] = daydemand-newdemand
+        # all of the days are shaped together, one row per day
+        days      = demand[:ndays*t_step].reshape(ndays, t_step)
+        shapediff[:ndays*t_step] = victempdemand.shape_days(days, target).ravel()
 
         return shapediff
 
@@ -30,6 +30,133 @@
 from generator import singlepassgenerator
 import numpy as np
 
+
+def row_totals(values):
+    """Return the total of each row of the 2-d array values. The values are
+    added in order along each row, as the builtin sum does, so the totals
+    match those of the original day-by-day shaping calculation exactly.
+    """
+    return np.cumsum(values, axis=1)[:, -1]
+
+
+def shaved_totals(days, yvals):
+    """Return the total of each row of days above the level in yvals.
+    """
+    levels = yvals[:, np.newaxis]
+    return row_totals(np.where(days > levels, days - levels, 0))
+
+
+def filled_totals(days, yvals):
+    """Return the total needed to raise each row of days up to the level in yvals.
+    """
+    levels = yvals[:, np.newaxis]
+    return row_totals(np.where(days < levels, levels - days, 0))
+
+
+def find_shave_levels(days, targets):
+    """For each row of days, find the level to shave the peaks down to, being
+    the first of peak - 0.1, peak - 0.2, ... that saves more than the target.
+    
+    Rather than stepping down from the peak, the exact level that saves the 
+    target is found in closed form from the cumulative sum of the sorted 
+    demand, and the step count is then checked against its neighbours.
+    
+    Inputs:
+        days: 2-d numpy.array, one row per day of demand in GW
+        targets: numpy.array of the total to be saved each day, in GWh
+        
+    Outputs:
+        yvals: the level the peaks are shaved down to each day
+        saved: the total saved by shaving to yvals each day
+    """
+    peaks = np.max(days, axis=1)
+    desc = -np.sort(-days, axis=1)
+    levels = (np.cumsum(desc, axis=1) - targets[:, np.newaxis]) / np.arange(1, days.shape[1] + 1)
+    # The exact level has k values above it, where k is the first count for
+    # which the level is not below the next demand value down
+    found = np.hstack((levels[:, :-1] >= desc[:, 1:], np.ones((days.shape[0], 1), dtype=bool)))
+    exact = levels[np.arange(days.shape[0]), np.argmax(found, axis=1)]
+
+    counter = np.maximum(np.floor((peaks - exact) / 0.1).astype(int) + 1, 1)
+    while True:
+        back = (counter > 1) & (shaved_totals(days, peaks - 0.1*(counter - 1)) > targets)
+        if not back.any():
+            break
+        counter[back] -= 1
+    saved = shaved_totals(days, peaks - 0.1*counter)
+    short = saved <= targets
+    while short.any():
+        counter[short] += 1
+        saved = shaved_totals(days, peaks - 0.1*counter)
+        short = saved <= targets
+
+    return peaks - 0.1*counter, saved
+
+
+def find_fill_levels(days, targets):
+    """For each row of days, find the level to fill the troughs up to, being
+    the first of mini + 0.1, mini + 0.2, ... that adds more than the target.
+    Found in closed form as for find_shave_levels.
+    
+    Inputs:
+        days: 2-d numpy.array, one row per day of demand in GW
+        targets: numpy.array of the total to be added each day, in GWh
+        
+    Outputs:
+        yvals: the level the troughs are filled up to each day
+        earned: the total added by filling to yvals each day
+    """
+    minis = np.min(days, axis=1)
+    asc = np.sort(days, axis=1)
+    levels = (np.cumsum(asc, axis=1) + targets[:, np.newaxis]) / np.arange(1, days.shape[1] + 1)
+    found = np.hstack((levels[:, :-1] <= asc[:, 1:], np.ones((days.shape[0], 1), dtype=bool)))
+    exact = levels[np.arange(days.shape[0]), np.argmax(found, axis=1)]
+
+    counter = np.maximum(np.floor((exact - minis) / 0.1).astype(int) + 1, 1)
+    while True:
+        back = (counter > 1) & (filled_totals(days, minis + 0.1*(counter - 1)) > targets)
+        if not back.any():
+            break
+        counter[back] -= 1
+    earned = filled_totals(days, minis + 0.1*counter)
+    short = earned <= targets
+    while short.any():
+        counter[short] += 1
+        earned = filled_totals(days, minis + 0.1*counter)
+        short = earned <= targets
+
+    return minis + 0.1*counter, earned
+
+
+def shape_days(days, target):
+    """Shape the demand in each row of days by shaving the peaks down, in
+    steps of 0.1, until more than the target (or the total available above 
+    the daily mean, if less) is saved, and then filling the troughs up, in 
+    steps of 0.1, until more than that is added.
+    
+    Inputs:
+        days: 2-d numpy.array, one row per day of demand in GW
+        target: the total to be saved each day, in GWh
+        
+    Outputs:
+        shapediff: 2-d numpy.array, the original less the shaped demand
+    """
+    t_step = days.shape[1]
+
+    # check the maximum available for load shaping
+    demandmean = row_totals(days) / float(t_step)
+    totavail = shaved_totals(days, demandmean)
+    newtargets = np.minimum(target, totavail)
+
+    (yvals, saved) = find_shave_levels(days, newtargets)
+    newdemand = np.where(days > yvals[:, np.newaxis], yvals[:, np.newaxis], days)
+
+    (yvals, earned) = find_fill_levels(days, saved)
+    newdemand = np.where(days < yvals[:, np.newaxis], yvals[:, np.newaxis], newdemand)
+
+    return days - newdemand
+
+
 class VicTempDemand(singlepassgenerator.SinglePassGeneratorBase):
     """The base class for generic generators that calculate the
     output and cost based on the full timeseries in one pass. 
@@ -59,6 +186,10 @@ class VicTempDemand(singlepassgenerator.SinglePassGeneratorBase):
         self.ts_demand_in = data['ts_demand_in']
         self.ts_dow = data['ts_dow']
         self.ts_time = data['ts_time']
+
+        # The model outputs depend only on the configuration and this data, 
+        # so are memoised by get_model_pred, keyed on the configuration.
+        self.model_cache = {}
         
 
     def get_config_spec(self):
@@ -126,6 +257,46 @@ class VicTempDemand(singlepassgenerator.SinglePassGeneratorBase):
                 from this generator.
         """
         
+        model_pred = self.get_model_pred()
+
+        output = -model_pred
+        cost = 0
+        
+        if (save_result):
+            self.saved['output'] = output
+            self.saved['cost'] = cost
+            self.saved['capacity'] = max(model_pred)
+            self.saved['other'] = {'ts_demand': -1 * output}
+        
+        return cost, output
+
+
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """As the demand does not depend on the params, return the same
+        demand for every row of the batch.
+        """
+        outputs = np.tile(-self.get_model_pred(), (rem_demand_batch.shape[0], 1))
+        costs = np.zeros(rem_demand_batch.shape[0])
+        return costs, outputs
+
+
+    def get_model_pred(self):
+        """Return the modelled demand timeseries in MW for the current 
+        configuration. This is calculated by calculate_model_pred the first 
+        time it is requested for each configuration, and then kept in
+        self.model_cache. The returned array must not be modified.
+        """
+        key = tuple([self.config[spec[0]] for spec in self.config_spec])
+        if key not in self.model_cache:
+            self.model_cache[key] = self.calculate_model_pred()
+        return self.model_cache[key]
+        
+        
+    def calculate_model_pred(self):
+        """Calculate the modelled demand timeseries in MW for the current
+        configuration.
+        """
+        
         # merge together the different factors into 4 different overall effects
         # this need to be refined to be more realistic (one day)
         total_efficiency = self.config['residential_efficiency'] + \
@@ -177,16 +348,7 @@ class VicTempDemand(singlepassgenerator.SinglePassGeneratorBase):
         # Convert from GW to MW
         model_pred *= 1000
         
-        output = -model_pred
-        cost = 0
-        
-        if (save_result):
-            self.saved['output'] = output
-            self.saved['cost'] = cost
-            self.saved['capacity'] = max(model_pred)
-            self.saved['other'] = {'ts_demand': -1 * output}
-        
-        return cost, output
+        return model_pred
 
 
     def bottom_up(self, weatherfac):
@@ -275,38 +437,9 @@ class VicTempDemand(singlepassgenerator.SinglePassGeneratorBase):
         t_step    = int(24/self.config['timestep_hrs'])
         ndays     = len(demand)/t_step
 
-        for id in range(ndays):
-            daydemand = demand[id*t_step:id*t_step+t_step].copy()
-
-            # check the maximum available for load shaping
-
-            demandmean  = sum(daydemand)/float(t_step)
-            mean_filter = daydemand > demandmean
-            totavail    = sum(daydemand[mean_filter] - demandmean)
-            newtarget   = min(target, totavail)
-            newdemand   = daydemand.copy()
-            peak        = max(daydemand)
-            mini        = min(daydemand)
-
-            GWhsaved    = 0.0
-            counter     = 1
-            while GWhsaved <= newtarget:
-                yval                  = peak - 0.1*counter
-                GWh_filter            = daydemand > yval
-                GWhsaved              = sum(daydemand[GWh_filter] - yval)
-                newdemand[GWh_filter] = yval
-                counter += 1
-
-            counter   = 1
-            GWhearned = 0.0
-            while GWhearned <= GWhsaved:
-                yval                  = mini + 0.1*counter
-                GWh_filter            = daydemand < yval
-                GWhearned             = sum(yval - daydemand[GWh_filter])
-                newdemand[GWh_filter] = yval
-                counter += 1
-
-            shapediff[id*t_step:id*t_step+t_step] = daydemand-newdemand
+        # all of the days are shaped together, one row per day
+        days      = demand[:ndays*t_step].reshape(ndays, t_step)
+        shapediff[:ndays*t_step] = shape_days(days, target).ravel()
 
         return shapediff
 
@@ -29,6 +29,8 @@
 
 from tools import configurablebase
 
+import numpy
+
 class SinglePassGeneratorBase(configurablebase.ConfigurableBase):
     """The base class for generic generators that calculate the
     output and cost based on the full timeseries in one pass. 
@@ -114,6 +116,35 @@ class SinglePassGeneratorBase(configurablebase.ConfigurableBase):
         return None
     
     
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the cost and output for a batch of param sets, such as
+        a whole population of genes, against a matching batch of remaining
+        demand. This default implementation calls calculate_cost_and_output
+        once per row; generators with a vectorisable model may override it
+        to evaluate the whole batch at once. 
+        
+        As for calculate_cost_and_output with save_result False, this function
+        is required to be thread-safe.
+        
+        Inputs:
+            params_batch: numpy.array - 2-d, one row per param set, each row
+                the same length as requested in get_param_count.
+            rem_demand_batch: numpy.array - 2-d, one row per param set, each row
+                a time series of the demand remaining to be met by this generator.
+                
+        Outputs:
+            costs: numpy.array - 1-d, the cost in $M for each param set.
+            outputs: numpy.array - 2-d, one row per param set, each row a time
+                series of the power output in MW from this generator.
+        """
+        costs = numpy.zeros(rem_demand_batch.shape[0])
+        outputs = numpy.zeros(rem_demand_batch.shape)
+        for i in range(rem_demand_batch.shape[0]):
+            (costs[i], outputs[i]) = self.calculate_cost_and_output(
+                params_batch[i], rem_demand_batch[i])
+        return costs, outputs
+    
+    
     def interpret_to_string(self):
         """Return a string that describes the generator type and the
         current capacity, following a call to calculate_cost_and_output
@@ -83,9 +83,14 @@ class VariableGeneratorBasic(singlepassgenerator.SinglePassGeneratorBase):
         """
         self.ts_cap_fac = data[self.config['data_type']]
 
-        # For best speed performance, require numpy.array with dtype=float64.
+        # For best speed performance, require numpy.array with dtype=float64,
+        # or float32 if the global use_float32 is set.
         # This should have been converted in the Data module.
-        mureiltypes.check_ndarray_float(self.ts_cap_fac)
+        mureiltypes.check_ndarray_float(self.ts_cap_fac, allow_float32=True)
+
+        # Keep a transposed copy, one contiguous row per site, for the
+        # batch calculations, which multiply a batch of params by it.
+        self.cap_fac_by_site = numpy.ascontiguousarray(self.ts_cap_fac.T)
         
         
     def get_param_count(self):
@@ -150,6 +155,16 @@ class VariableGeneratorBasic(singlepassgenerator.SinglePassGeneratorBase):
             self.saved['capacity'] = params * self.config['size']
                 
         return cost, output
+
+    
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the cost and output for a batch of param sets in one
+        matrix product, as described in SinglePassGeneratorBase. The
+        results for each row match calculate_cost_and_output.
+        """
+        outputs = numpy.dot(params_batch, self.cap_fac_by_site) * self.config['size']
+        costs = numpy.sum(params_batch, axis=1) * self.config['size'] * self.config['capex']
+        return costs, outputs
     
     
     def interpret_to_string(self):
@@ -212,6 +227,17 @@ class VariableGeneratorLinearInstall(VariableGeneratorBasic):
         return cost, output
 
 
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the cost and output for a batch of param sets in one
+        pass, as described in SinglePassGeneratorBase.
+        """
+        outputs = numpy.dot(params_batch, self.cap_fac_by_site) * self.config['size']
+        active = params_batch > 0
+        costs = numpy.sum(params_batch * active, axis=1) * self.config['capex'] * self.config['size'] + (
+            self.config['install'] * numpy.sum(active, axis=1))
+        return costs, outputs
+
+
 class VariableGeneratorExpCost(VariableGeneratorBasic):
     """Override the VariableGeneratorBasic calculate method by calculating an
     exponential method capacity cost.
@@ -269,6 +295,18 @@ class VariableGeneratorExpCost(VariableGeneratorBasic):
             self.saved['capacity'] = params * self.config['size']
                 
         return cost, output
+
+
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the cost and output for a batch of param sets in one
+        pass, as described in SinglePassGeneratorBase.
+        """
+        outputs = numpy.dot(params_batch, self.cap_fac_by_site) * self.config['size']
+        unit_cost = self.config['size'] * self.config['capex']
+        cpt = ((self.config['install'] - unit_cost) *
+            numpy.exp(-0.1 * (params_batch - 1))) + unit_cost
+        costs = numpy.sum(numpy.where(params_batch < 1, 0, params_batch * cpt), axis=1)
+        return costs, outputs
                 
 
 class VariableGeneratorSqrtCost(VariableGeneratorBasic):
@@ -323,6 +361,19 @@ class VariableGeneratorSqrtCost(VariableGeneratorBasic):
         return cost, output
 
 
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the cost and output for a batch of param sets in one
+        pass, as described in SinglePassGeneratorBase.
+        """
+        outputs = numpy.dot(params_batch, self.cap_fac_by_site) * self.config['size']
+        m_gen = (self.config['capex'] * self.config['max_count']) / numpy.sqrt(self.config['max_count'])
+        gen_add = self.config['install'] + (
+            self.config['size'] * self.config['capex']) - m_gen
+        costs = numpy.sum(numpy.where(params_batch < 1, 0, 
+            m_gen * numpy.sqrt(numpy.clip(params_batch, 1, numpy.Inf)) + gen_add), axis=1)
+        return costs, outputs
+
+
 class VariableGeneratorAsymptCost(VariableGeneratorBasic):
     """Override the VariableGeneratorBasic calculate method by using a
     method that has an asymptotic gradient for the capacity cost.
@@ -356,7 +407,7 @@ class VariableGeneratorAsymptCost(VariableGeneratorBasic):
         """
         VariableGeneratorBasic.set_data(self, data)
         self.distances = data[self.config['data_type'] + '_distances']
-        mureiltypes.check_ndarray_float(self.distances)
+        mureiltypes.check_ndarray_float(self.distances, allow_float32=True)
 
 
     def calculate_cost_and_output(self, params, rem_demand, save_result=False):
@@ -409,6 +460,14 @@ class VariableGeneratorAsymptCost(VariableGeneratorBasic):
         return cost, output
 
 
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the cost and output for a batch of param sets, one at a
+        time, as the cost function here is not vectorised.
+        """
+        return singlepassgenerator.SinglePassGeneratorBase.calculate_cost_and_output_batch(
+            self, params_batch, rem_demand_batch)
+
+
 class IncrementalVariableGeneratorBasic(VariableGeneratorBasic):
     """This is a hack for the GE demo, in advance of a decent system for handling
     the incremental / multi-decade operation. The model expects twice as many
@@ -461,3 +520,13 @@ class IncrementalVariableGeneratorBasic(VariableGeneratorBasic):
             self.saved['capacity'] = params[:self.req_params] * self.config['size']
 
         return cost, output
+
+
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the cost and output for a batch of param sets in one
+        pass, as described in SinglePassGeneratorBase, with each row of
+        params_batch split into total stock and incremental build.
+        """
+        outputs = numpy.dot(params_batch[:,:self.req_params], self.cap_fac_by_site) * self.config['size']
+        costs = numpy.sum(params_batch[:,self.req_params:], axis=1) * self.config['size'] * self.config['capex']
+        return costs, outputs
@@ -81,6 +81,19 @@ class TxMultiGeneratorBase(configurablebase.ConfigurableMultiBase):
         return copy.deepcopy(self.startup_state)
     
     
+    def copy_state_handle(self, state_handle):
+        """Return a copy of the state_handle, that can be updated without changing
+        the original, for example to keep the state at the end of a period.
+        
+        Inputs:
+            state_handle: an arbitrary object, which initiated from self.get_startup_state_handle
+            
+        Outputs:
+            new_state_handle: a new copy of state_handle
+        """
+        return copy.deepcopy(state_handle)
+    
+    
     def get_data_types(self):
         """Return a list of keys for each type of
         data required, for example ts_wind, ts_demand.
@@ -514,4 +527,24 @@ class TxMultiGeneratorBase(configurablebase.ConfigurableMultiBase):
             terminal_value: a list of tuples of (site_index, value) for sites with active capacity.
         """
         return 0, []
+
+
+    def get_max_terminal_value(self, state_handle):
+        """Return an upper bound, in $M, on the terminal value that the capacity in 
+        state_handle could have at the end of the run. The masters use this to decide
+        whether a gene can still come in under a cost bound before its terminal value
+        is known. 
+        
+        Capacity built in later periods costs at least its own terminal value, so it
+        need not be included. Models that implement get_terminal_value must implement
+        this too.
+        
+        Inputs:
+            state_handle: an arbitrary object, which initiated from self.get_startup_state_handle, 
+                that describes the state of the generator model at the end of a time period.
+
+        Outputs:
+            value: the maximum total terminal value for the capacity in state_handle.
+        """
+        return 0
         
\ No newline at end of file
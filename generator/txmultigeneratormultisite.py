@@ -43,6 +43,10 @@ class TxMultiGeneratorMultiSite(txmultigeneratorbase.TxMultiGeneratorBase):
     The 'capacity' term in state_handle is implemented as a dict with one item per site. 
     Each site item is a list of tuples containing (site_index,build_period,decommissioning_period),
     describing the set of installed capacity. 
+    
+    The per-site lists in a state_handle may be shared with the startup state and with
+    other state handles (see get_startup_state_handle), so they are never modified in
+    place - a site's list is replaced with a new list when it changes.
     """
     
     def __init__(self):
@@ -250,6 +254,35 @@ class TxMultiGeneratorMultiSite(txmultigeneratorbase.TxMultiGeneratorBase):
                 cap_list[site_index].append(new_entry)
 
 
+    def get_startup_state_handle(self):
+        """Return the starting state, as for get_startup_state_handle in txmultigeneratorbase,
+        but as a copy-on-write handle rather than a deepcopy. The handle has its own 
+        'capacity' and 'history' dicts, but the per-site lists in those are shared with 
+        self.startup_state. This is thread-safe as the functions here that update the 
+        state replace a site's list rather than modifying it.
+        
+        Outputs:
+            startup_state_handle: a new copy-on-write handle to the starting state of this model
+        """
+        return self.copy_state_handle(self.startup_state)
+
+
+    def copy_state_handle(self, state_handle):
+        """Return a copy of the state_handle, as for copy_state_handle in txmultigeneratorbase,
+        but copy-on-write as for get_startup_state_handle, sharing the per-site lists.
+        
+        Inputs:
+            state_handle: a state_handle, as from get_startup_state_handle
+            
+        Outputs:
+            new_state_handle: a new copy-on-write handle to the same state
+        """
+        new_state_handle = dict(state_handle)
+        new_state_handle['capacity'] = dict(state_handle['capacity'])
+        new_state_handle['history'] = dict(state_handle['history'])
+        return new_state_handle
+
+
     def get_param_count(self):
         """Return the number of parameters that this generator,
         as configured, requires to be optimised, per time period.
@@ -305,10 +338,7 @@ class TxMultiGeneratorMultiSite(txmultigeneratorbase.TxMultiGeneratorBase):
             
             new_entry = (new_cap, period, int(decomm_date))
 
-            if site_index not in cap_list:
-                cap_list[site_index] = []
-
-            cap_list[site_index].append(new_entry)
+            cap_list[site_index] = cap_list.get(site_index, []) + [new_entry]
 
         return None
 
@@ -332,10 +362,7 @@ class TxMultiGeneratorMultiSite(txmultigeneratorbase.TxMultiGeneratorBase):
             site_index = self.params_to_site[i]
             new_entry = (new_cap[i], period, decomm_date)
 
-            if site_index not in cap_list:
-                cap_list[site_index] = []
-
-            cap_list[site_index].append(new_entry)
+            cap_list[site_index] = cap_list.get(site_index, []) + [new_entry]
 
         return None
  
@@ -369,9 +396,7 @@ class TxMultiGeneratorMultiSite(txmultigeneratorbase.TxMultiGeneratorBase):
                 total_cost += this_cost
 
                 # add the decommissioned capacity to the 'history' list
-                if not site in hist_list:
-                    hist_list[site] = []
-                hist_list[site] += decomm
+                hist_list[site] = hist_list.get(site, []) + decomm
                 
                 # and rebuild the list of what's left
                 # note that the expression in here is the complement of that to compute
@@ -479,6 +504,31 @@ class TxMultiGeneratorMultiSite(txmultigeneratorbase.TxMultiGeneratorBase):
         
         return capacity
 
+
+    def get_capacity_array(self, state_handle, site_indices=None):
+        """Return the total capacity at each site as a numpy array, so that
+        the output calculations can be done across all sites at once, rather than
+        site by site.
+        
+        Inputs:
+            state_handle: as for get_capacity
+            site_indices: optional - the list of sites to include, in order. Defaults
+                to the list from get_site_indices.
+                
+        Outputs:
+            capacity: numpy array of floats, the total capacity in MW at each site.
+        """
+        
+        if site_indices is None:
+            site_indices = self.get_site_indices(state_handle)
+        cap_list = state_handle['capacity']
+
+        capacity = numpy.zeros(len(site_indices))
+        for i, site in enumerate(site_indices):
+            capacity[i] = sum([tup[0] for tup in cap_list[site]])
+
+        return capacity
+
     
     def get_site_indices(self, state_handle):
         """Implement the get_site_indices function as defined in TxMultiGeneratorBase, for this
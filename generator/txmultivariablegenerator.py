@@ -108,6 +108,10 @@ class TxMultiVariableGeneratorBase(txmultigeneratormultisite.TxMultiGeneratorMul
         txmultigeneratormultisite.TxMultiGeneratorMultiSite.set_data(self, data)
 
         self.data = data[self.config['data_name']]
+        # Keep a transposed copy, one contiguous row per data series, so that
+        # selecting the series for a set of sites in calculate_outputs reads
+        # whole rows.
+        self.data_by_site = numpy.ascontiguousarray(self.data.T)
         self.site_to_data = {}
         
         if len(self.config['data_map_name']) > 0:
@@ -181,19 +185,11 @@ class TxMultiVariableGeneratorBase(txmultigeneratormultisite.TxMultiGeneratorMul
             site_indices: the list of sites with active capacity
             output: a set of timeseries, corresponding to site_indices
         """
-        cap_list = state_handle['capacity']
         site_indices = self.get_site_indices(state_handle)
-        num_sites = len(site_indices)
-        output = numpy.zeros((num_sites, ts_length))
-        
-        for i in range(num_sites):
-            site = site_indices[i]
-            total_cap = sum([tup[0] for tup in cap_list[site]])
-            data_index = self.site_to_data[site]
-            ### TODO - it may be expensive to have self.data this way -
-            ### would it help to transpose it when it's read in, so
-            ### the memory lines up better?
-            output[i,:] = self.data[:,data_index] * total_cap
+        capacity = self.get_capacity_array(state_handle, site_indices)
+        data_indices = [self.site_to_data[site] for site in site_indices]
+
+        output = self.data_by_site[data_indices] * capacity[:,numpy.newaxis]
 
         return site_indices, output
         
@@ -118,6 +118,18 @@ class BasicPumpedHydro(singlepassgenerator.SinglePassGeneratorBase):
         return cost, output
 
 
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the time series of electricity in and out for the
+        pumped hydro, for each row of rem_demand_batch, as for 
+        calculate_cost_and_output, with all rows computed together.
+        """
+        max_gens = np.ones(rem_demand_batch.shape[0]) * self.config['max_gen']
+        outputs = self.compute_pumped_hydro_batch(rem_demand_batch, max_gens)
+
+        costs = np.max(np.abs(outputs), axis=1) * self.config['capex']
+        return costs, outputs
+
+
     def interpret_to_string(self):
         if self.saved:
             return 'Basic Pumped Hydro, maximum generation capacity (MW) {:.2f}'.format(
@@ -170,6 +182,49 @@ class BasicPumpedHydro(singlepassgenerator.SinglePassGeneratorBase):
                 output[i] = -elec_used
 
         return output
+
+
+    def compute_pumped_hydro_batch(self, rem_demand_batch, max_gens):
+        """Compute the timeseries for the pumped hydro operation for a batch of
+        remaining demand timeseries and generation capacities, with the same
+        rules as compute_pumped_hydro_ts. The reservoir level depends on the
+        previous timestep, so the timesteps are stepped through in order, but
+        at each timestep all of the rows are updated together.
+        
+        Inputs:
+            rem_demand_batch: 2-d array, one row per timeseries of demand in MW 
+                remaining to be met, or surplus if negative
+            max_gens: 1-d array, the maximum electrical generation capacity for each row
+        
+        Output:
+            outputs: 2-d array, one row per timeseries in MW of output of generator
+        """
+
+        # Work on the transpose so each timestep is a contiguous row
+        rem_demand_t = np.ascontiguousarray(rem_demand_batch.T)
+        outputs_t = np.zeros(rem_demand_t.shape)
+        elec_res_temp = np.ones(len(max_gens)) * self.elec_res
+        elec_cap = self.elec_cap
+        pump_round_trip = self.config['pump_round_trip']
+        pump_round_trip_recip = self.pump_round_trip_recip
+
+        for i in range(rem_demand_t.shape[0]):
+            elec_diff = rem_demand_t[i]
+            releasing = elec_diff > 0
+
+            elec_to_release = np.minimum(np.minimum(elec_diff, max_gens), elec_res_temp)
+
+            elec_to_store = np.minimum(-elec_diff, max_gens) * pump_round_trip
+            space = elec_cap - elec_res_temp
+            dam_full = elec_to_store > space
+            elec_to_store = np.where(dam_full, space, elec_to_store)
+
+            outputs_t[i] = np.where(releasing, elec_to_release, 
+                -(elec_to_store * pump_round_trip_recip))
+            elec_res_temp = np.where(releasing, elec_res_temp - elec_to_release,
+                np.where(dam_full, elec_cap, elec_res_temp + elec_to_store))
+
+        return np.ascontiguousarray(outputs_t.T)
         
 
 class BasicPumpedHydroOptimisable(BasicPumpedHydro):
@@ -227,6 +282,18 @@ class BasicPumpedHydroOptimisable(BasicPumpedHydro):
         return cost, output
 
 
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Calculate the time series of electricity in and out for the
+        pumped hydro, for each row of rem_demand_batch, with the generation 
+        capacity for each row taken from the matching row of params_batch.
+        """
+        capacities = params_batch[:,0] * self.config['size']
+        outputs = self.compute_pumped_hydro_batch(rem_demand_batch, capacities)
+
+        costs = capacities * self.config['capex']
+        return costs, outputs
+
+
     def interpret_to_string(self):
         if self.saved:
             return 'Basic Pumped Hydro Optimisable, maximum generation capacity (MW) {:.2f}'.format(
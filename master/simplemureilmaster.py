@@ -83,7 +83,18 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
         self.global_calc.update_config({'data_ts_length': self.data.get_ts_length()})
         self.global_calc.post_data_global_calcs()
         self.global_config = self.global_calc.get_config()
-        
+
+        # Move the data to shared memory before any generator takes a reference to it,
+        # and before the algorithm starts its worker processes.
+        if self.config['shared_data']:
+            self.data.share_data()
+
+        # The dispatch is calculated in single precision if the global use_float32 is set.
+        if self.global_config.get('use_float32', False):
+            self.dispatch_dtype = np.float32
+        else:
+            self.dispatch_dtype = float
+
         # Instantiate the generator objects, set their data, determine their param requirements
         param_count = 0
         self.gen_list = {}
@@ -100,8 +111,9 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
             self.gen_list[gen_type] = gen
 
             # Supply data as requested by the generator
-            mureilbuilder.supply_single_pass_data(gen, self.data, gen_type)
-    
+            mureilbuilder.supply_single_pass_data(gen, self.data, gen_type,
+                self.dispatch_dtype)
+
             # Determine how many parameters this generator requires and
             # allocate the slots in the params list
             params_req = gen.get_param_count()
@@ -147,6 +159,8 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
         algorithm_config['start_values_min'] = start_values_min
         algorithm_config['start_values_max'] = start_values_max
         algorithm_config['gene_test_callback'] = self.gene_test
+        if self.config['batch_evaluation']:
+            algorithm_config['gene_test_batch_callback'] = self.gene_test_batch
         self.algorithm = mureilbuilder.create_instance(full_config, self.global_config,
             self.config['algorithm'], mureilbase.ConfigurableInterface)
 
@@ -181,7 +195,19 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
                 of the run.
 
             optim_type: Defaults to 'missed_supply'. Either 'missed_supply' or 'match_demand'. 
-                'match_demand' is a legacy case that may not be maintained. 
+                'match_demand' is a legacy case that may not be maintained.
+            batch_evaluation: Defaults to False. If True, and the algorithm is not multiprocessing,
+                the algorithm scores the whole population in one call to gene_test_batch, and each
+                generator evaluates all of the genes together with calculate_cost_and_output_batch.
+                Only applies with optim_type 'missed_supply'.
+            batch_max_values: Defaults to 1000000. With batch_evaluation, if non-zero, the genes are
+                passed through the generators in chunks of batch_max_values / data timeseries length genes,
+                so that each batch array holds no more than batch_max_values values, or one gene's
+                timeseries if that is longer. This bounds the memory for long timeseries, and keeps
+                the arrays small enough to stay in cache. If 0, the whole population is passed in one chunk.
+            shared_data: Defaults to False. If True, the data series are moved into one block of
+                shared memory, read-only, before the generators are set up, so the algorithm's worker
+                processes all use the one copy of the data.
         """
         return [
             ('algorithm', None, 'Algorithm'),
@@ -192,7 +218,10 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
             ('dispatch_order', mureilbuilder.make_string_list, None),
             ('optim_type', None, 'missed_supply'),
             ('do_plots', mureilbuilder.string_to_bool, False),
-            ('output_frequency', int, 500)
+            ('output_frequency', int, 500),
+            ('batch_evaluation', mureilbuilder.string_to_bool, False),
+            ('shared_data', mureilbuilder.string_to_bool, False),
+            ('batch_max_values', int, 1000000)
             ]
 
 
@@ -292,8 +321,8 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
 
         if self.config['optim_type'] == 'match_demand':
         
-            rem_demand = np.array(self.data.get_timeseries('ts_demand'), dtype=float)
-            mureiltypes.check_ndarray_float(rem_demand)            
+            rem_demand = np.array(self.data.get_timeseries('ts_demand'), dtype=self.dispatch_dtype)
+            mureiltypes.check_ndarray_float(rem_demand, allow_float32=True)            
 
             (solar_cost, solar_ts) = self.gen_list['solar'].calculate_cost_and_output(
                 params[self.gen_params['solar'][0]:self.gen_params['solar'][1]], rem_demand, save_result)
@@ -309,9 +338,9 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
 
             # rem_demand is the running total, modified here
             if 'demand' in self.dispatch_order:
-                rem_demand = np.zeros(self.data.get_ts_length(), dtype=float)
+                rem_demand = np.zeros(self.data.get_ts_length(), dtype=self.dispatch_dtype)
             else:
-                rem_demand = np.array(self.data.get_timeseries('ts_demand'), dtype=float)
+                rem_demand = np.array(self.data.get_timeseries('ts_demand'), dtype=self.dispatch_dtype)
             
             cost = 0
 
@@ -328,6 +357,71 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
         return cost
 
 
+    def calc_cost_batch(self, genes):
+        """Calculate the total system cost for each of a list of genes, as for
+        calc_cost with save_result=False, but passing all of the genes through
+        each generator in one call to calculate_cost_and_output_batch. This
+        function must be thread-safe, as for calc_cost.
+
+        Inputs:
+            genes: list of genes, each a list of param values of length param_count.
+
+        Outputs:
+            costs: numpy.array of the cost for each gene.
+        """
+
+        if not (self.config['optim_type'] == 'missed_supply'):
+            return np.array([self.calc_cost(gene) for gene in genes])
+
+        params_batch = np.array(genes)
+
+        # Stream the genes through the dispatch in chunks, so that each array of
+        # chunk_size timeseries stays within batch_max_values. A chunk always
+        # holds at least one gene, even if one timeseries is longer than that.
+        chunk_size = len(genes)
+        if self.config['batch_max_values'] > 0:
+            chunk_size = max(1, self.config['batch_max_values'] // self.data.get_ts_length())
+
+        if chunk_size >= len(genes):
+            return self.calc_cost_chunk(params_batch)
+        else:
+            return np.concatenate([self.calc_cost_chunk(params_batch[start:start + chunk_size])
+                for start in range(0, len(genes), chunk_size)])
+
+
+    def calc_cost_chunk(self, params_batch):
+        """Calculate the total system cost for each row of params_batch, for
+        calc_cost_batch.
+
+        Inputs:
+            params_batch: numpy.array of params, one row per gene.
+
+        Outputs:
+            costs: numpy.array of the cost for each gene.
+        """
+
+        # rem_demand_batch is the running total for each gene, modified here
+        if 'demand' in self.dispatch_order:
+            rem_demand_batch = np.zeros((len(params_batch), self.data.get_ts_length()), dtype=self.dispatch_dtype)
+        else:
+            rem_demand_batch = np.tile(np.array(self.data.get_timeseries('ts_demand'), dtype=self.dispatch_dtype),
+                (len(params_batch), 1))
+
+        costs = np.zeros(len(params_batch))
+
+        for gen_type in self.dispatch_order:
+            gen = self.gen_list[gen_type]
+            gen_ptr = self.gen_params[gen_type]
+
+            (these_costs, these_ts) = gen.calculate_cost_and_output_batch(
+                params_batch[:, gen_ptr[0]:gen_ptr[1]], rem_demand_batch)
+
+            costs += these_costs
+            rem_demand_batch -= these_ts
+
+        return costs
+
+
     def evaluate_results(self, params):
         """Collect a dict that includes all the calculated results from a
         run with params.
@@ -371,3 +465,13 @@ class SimpleMureilMaster(mureilbase.MasterInterface, configurablebase.Configurab
         """
         score = -1 * self.calc_cost(gene)
         return score
+
+
+    def gene_test_batch(self, genes):
+        """input: list of lists
+        output: list of floats
+        takes the gene.values of a whole population, tests them together
+        and returns the genes scores
+        """
+        scores = (-1 * self.calc_cost_batch(genes)).tolist()
+        return scores
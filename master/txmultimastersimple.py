@@ -30,7 +30,7 @@ import copy
 from os import path
 
 from tools import mureilbuilder, mureilexception, mureiloutput, mureiltypes, globalconfig
-from tools import mureilbase, configurablebase
+from tools import mureilbase, configurablebase, prefixcache
 
 from generator import txmultigeneratorbase
 
@@ -159,6 +159,13 @@ class TxMultiMasterSimple(mureilbase.MasterInterface, configurablebase.Configura
                 start_values_min = extra_data['start_gene']
                 start_values_max = extra_data['start_gene']
        
+        # Set up the cache of period states, used by calc_cost
+        if self.config['prefix_cache_size'] > 0:
+            self.prefix_cache = prefixcache.PrefixCache(self.config['prefix_cache_size'],
+                self.copy_prefix_state)
+        else:
+            self.prefix_cache = None
+
         # Instantiate the genetic algorithm
         mureilbuilder.check_section_exists(full_config, self.config['algorithm'])
         algorithm_config = full_config[self.config['algorithm']]
@@ -204,6 +211,10 @@ class TxMultiMasterSimple(mureilbase.MasterInterface, configurablebase.Configura
                 that, report on the simulation status.
             do_plots: Defaults to False. If True, output plots every output_frequency and at the end
                 of the run.
+            prefix_cache_size: Defaults to 0. If non-zero, the state and cost at the end of each 
+                period are cached for up to this many gene prefixes, and genes sharing the params of
+                the leading periods with a cached gene start from the cached state. The cache is
+                held per process.
         """
         return [
             ('algorithm', None, 'Algorithm'),
@@ -215,7 +226,8 @@ class TxMultiMasterSimple(mureilbase.MasterInterface, configurablebase.Configura
             ('dispatch_order', mureilbuilder.make_string_list, None),
             ('do_plots', mureilbuilder.string_to_bool, False),
             ('output_frequency', int, 500),
-            ('run_periods', mureilbuilder.make_int_list, [2010])
+            ('run_periods', mureilbuilder.make_int_list, [2010]),
+            ('prefix_cache_size', int, 0)
             ]
 
 
@@ -327,14 +339,33 @@ class TxMultiMasterSimple(mureilbase.MasterInterface, configurablebase.Configura
     def finalise(self):
         self.algorithm.finalise()
 
+
+    def copy_prefix_state(self, state):
+        """Copy a state stored in the prefix_cache, as a tuple of
+        (gen_state_handles, tx_state_handle, bound_costs), with each generator 
+        copying its own state handle. The bound_costs list is never modified, 
+        so is shared.
+        """
+        gen_state_handles, tx_state_handle, bound_costs = state
+        new_gen_state_handles = {}
+        for gen_type in gen_state_handles:
+            new_gen_state_handles[gen_type] = (
+                self.gen_list[gen_type].copy_state_handle(gen_state_handles[gen_type]))
+        return new_gen_state_handles, copy.deepcopy(tx_state_handle), bound_costs
+
             
-    def calc_cost(self, gene, full_results=False):
+    def calc_cost(self, gene, full_results=False, cost_bound=None):
         """Calculate the total system cost for this gene. This function is called
         by the algorithm from a callback. The algorithm may set up multi-processing
         and so this calc_cost function (and all functions it calls) must be
         thread-safe. 
         This means that the function must not modify any of the 
         internal data of the objects. 
+        
+        If cost_bound is set, and the cost accumulated at the end of any period, less
+        the largest terminal value the capacity built so far could have, exceeds
+        cost_bound, the gene cannot come in under the bound, so the evaluation is
+        aborted and that lower bound on its cost is returned.
         """
         
         temp = numpy.array(gene)
@@ -345,16 +376,34 @@ class TxMultiMasterSimple(mureilbase.MasterInterface, configurablebase.Configura
             gen_state_handles[gen_type] = (
                 self.gen_list[gen_type].get_startup_state_handle())        
 
+        tx_state_handle = None
         if self.transmission is not None:
             tx_state_handle = self.transmission.get_startup_state_handle()
 
         cost = 0
+        start_period = 0
+
+        # The cost less the most the terminal value could be, at the end of each
+        # period, kept in the prefix_cache so that a gene found there is aborted 
+        # just as it would be if evaluated in full. 
+        use_cache = (self.prefix_cache is not None) and (not full_results)
+        bound_costs = []
 
         if full_results:
             results = {'totals': {}, 'periods': {}, 'terminal': {}}
             total_carbon = 0.0
-
-        for i in range(len(self.run_periods)):
+        elif use_cache:
+            start_period, cached_cost, cached_state = self.prefix_cache.lookup(
+                gene, self.period_count, self.param_count)
+            if start_period > 0:
+                cost = cached_cost
+                gen_state_handles, tx_state_handle, bound_costs = cached_state
+                if cost_bound is not None:
+                    for bound_cost in bound_costs:
+                        if bound_cost > cost_bound:
+                            return bound_cost
+
+        for i in range(start_period, len(self.run_periods)):
             period = self.run_periods[i]
             params = params_set[i]
 
@@ -403,6 +452,23 @@ class TxMultiMasterSimple(mureilbase.MasterInterface, configurablebase.Configura
             
             cost += period_cost
 
+            if (cost_bound is not None) or use_cache:
+                # The terminal value is only subtracted at the end of the run, so allow
+                # for the most it could be before aborting.
+                max_terminal_value = 0.0
+                for gen_type in self.dispatch_order:
+                    max_terminal_value += self.gen_list[gen_type].get_max_terminal_value(
+                        gen_state_handles[gen_type])
+                bound_cost = cost - max_terminal_value
+                if (cost_bound is not None) and (bound_cost > cost_bound):
+                    return bound_cost
+
+            if use_cache and (i < self.period_count - 1):
+                # bound_costs is replaced, not appended to, as cached states share it
+                bound_costs = bound_costs + [bound_cost]
+                self.prefix_cache.store(gene, i + 1, self.param_count, cost, 
+                    (gen_state_handles, tx_state_handle, bound_costs))
+
         # calculate the terminal value at the end of the last period
         total_terminal_value = 0.0
 
@@ -445,10 +511,11 @@ class TxMultiMasterSimple(mureilbase.MasterInterface, configurablebase.Configura
         return results
         
         
-    def gene_test(self, gene):
-        """input: list
+    def gene_test(self, gene, cost_bound=None):
+        """input: list, and optionally a float cost bound
         output: float
-        takes the gene.values, tests it and returns the genes score
+        takes the gene.values, tests it and returns the genes score. If cost_bound
+        is provided, evaluation stops once the cost is sure to exceed it.
         """
-        score = -1 * self.calc_cost(gene)
+        score = -1 * self.calc_cost(gene, cost_bound=cost_bound)
         return score
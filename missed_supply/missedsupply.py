@@ -83,6 +83,16 @@ class LinearMissedSupply(singlepassgenerator.SinglePassGeneratorBase):
         return cost, output
 
 
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Meets all remaining demand for each row of rem_demand_batch, as
+        for calculate_cost_and_output, in one pass.
+        """
+        outputs = rem_demand_batch.clip(0)
+        costs = 1e-6 * numpy.sum(outputs, axis=1) * self.config['cost_per_mwh'] * self.config['timestep_hrs']
+        costs *= self.config['variable_cost_mult'] 
+        return costs, outputs
+
+
     def interpret_to_string(self):
         if self.saved:
             return 'Linear Missed-Supply, total {:.2f} MW-timestamps missed'.format(
@@ -244,6 +254,16 @@ class TimestepReliabilityMissedSupply(singlepassgenerator.SinglePassGeneratorBas
         return cost, output
 
 
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Meets all remaining demand for each row of rem_demand_batch, as
+        for calculate_cost_and_output, in one pass.
+        """
+        outputs = rem_demand_batch.clip(0)
+        costs = 1e-6 * numpy.sum(outputs, axis=1) * self.config['cost_per_mwh'] * self.config['timestep_hrs']
+        costs *= self.config['variable_cost_mult'] 
+        return costs, outputs
+
+
     def interpret_to_string(self):
         if self.saved:
             return 'Timestep Linear Missed-Supply, total {:.2f} MW-timestamps missed, reliability {:.3f}%'.format(
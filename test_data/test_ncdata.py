@@ -36,6 +36,7 @@ import sys
 sys.path.append('..')
 
 import os
+import shutil
 
 import unittest
 import numpy
@@ -309,6 +310,300 @@ class TestNcData(unittest.TestCase):
             self.data.set_config, config)
 
 
+    def test_mmap(self):
+        # pupynere writes big-endian data, so these are converted to native
+        # arrays whether the file is memory-mapped or not
+        ts_solar = numpy.array([[4, 3.5], [6, 3], [4, numpy.nan], [2, 1]])
+        ts_time = numpy.array([1, 2, 3, 4])
+
+        f1 = nc.NetCDFFile('test_mmap.nc', 'w')
+        f1.createDimension('sx', ts_solar.shape[0])
+        f1.createDimension('sy', ts_solar.shape[1])
+        ts_solar_var = f1.createVariable('ts_solar', 'float32', ('sx', 'sy'))
+        ts_time_var = f1.createVariable('ts_time', 'int32', ('sx',))
+        ts_solar_var[:,:] = ts_solar
+        ts_time_var[:] = ts_time
+        f1.close()
+
+        config = {
+            'description': 'test mmap',
+            'model': 'data.ncdata.py',
+            'section': 'Data',
+            'ts_float_list': 'ts_solar',
+            'ts_int_list': 'ts_time',
+            'ts_solar_file': 'test_mmap.nc',
+            'ts_time_file': 'test_mmap.nc'
+            }
+
+        exp_solar = numpy.array([[4, 3.5], [6, 3], [2, 1]])
+        exp_time = numpy.array([1, 2, 4])
+
+        try:
+            results = {}
+            for mmap in ['True', 'False']:
+                config['mmap'] = mmap
+                ncdata = data.ncdata.Data()
+                ncdata.set_config(config)
+                results[mmap] = (ncdata.get_timeseries('ts_solar'), 
+                    ncdata.get_timeseries('ts_time'))
+            
+            for ts_solar_out, ts_time_out in results.values():
+                self.assertEqual(ts_solar_out.dtype, numpy.float64)
+                self.assertTrue(ts_solar_out.dtype.isnative)
+                self.assertTrue(ts_time_out.dtype.isnative)
+                self.assertTrue((ts_solar_out == exp_solar).all())
+                self.assertTrue((ts_time_out == exp_time).all())
+        finally:
+            os.remove('test_mmap.nc')
+
+
+    def test_csv_cache(self):
+        with open('test_csv_cache.csv', 'w') as f:
+            f.write('time,a,b\n1,1.5,2\n2,3,4.25\n3,5,6\n')
+
+        config = {
+            'description': 'test csv cache',
+            'model': 'data.ncdata.py',
+            'section': 'Data',
+            'ts_csv_list': 'ts_matrix',
+            'ts_matrix_file': 'test_csv_cache.csv',
+            'csv_cache_dir': 'test_csv_cache'
+            }
+
+        exp_matrix = numpy.array([[1.5, 2], [3, 4.25], [5, 6]])
+
+        try:
+            # First pass parses the CSV and writes the cache
+            self.data.set_config(config)
+            cache_files = os.listdir('test_csv_cache')
+            self.assertEqual(len(cache_files), 1)
+            self.assertTrue(cache_files[0].startswith('test_csv_cache.csv.'))
+            self.assertTrue(cache_files[0].endswith('.npz'))
+            self.assertTrue((self.data.get_timeseries('ts_matrix') == exp_matrix).all())
+            self.assertEqual(self.data.get_ts_length(), 3)
+            self.assertEqual(self.data.get_timeseries('ts_matrix_hdr'), ['a', 'b'])
+
+            # Second pass reads the cache, and gives the same result
+            data_2 = data.ncdata.Data()
+            data_2.set_config(config)
+            self.assertTrue((data_2.get_timeseries('ts_matrix') == exp_matrix).all())
+            self.assertEqual(data_2.get_timeseries('ts_matrix_hdr'), ['a', 'b'])
+
+            # Changing the CSV invalidates the cache
+            with open('test_csv_cache.csv', 'w') as f:
+                f.write('time,a,b,c\n1,1,2,3\n2,4,5,6\n')
+            data_3 = data.ncdata.Data()
+            data_3.set_config(config)
+            self.assertTrue((data_3.get_timeseries('ts_matrix') == 
+                numpy.array([[1, 2, 3], [4, 5, 6]])).all())
+            self.assertEqual(data_3.get_timeseries('ts_matrix_hdr'), ['a', 'b', 'c'])
+            self.assertEqual(os.listdir('test_csv_cache'), cache_files)
+        finally:
+            os.remove('test_csv_cache.csv')
+            shutil.rmtree('test_csv_cache', True)
+
+
+    def test_csv_cache_same_name(self):
+        # Two CSV files of the same name, in different directories
+        for dir_name, contents in [('test_csv_cache_a', 'time,a\n1,1\n2,2\n'),
+            ('test_csv_cache_b', 'time,b\n1,3\n2,4\n')]:
+            os.mkdir(dir_name)
+            with open(os.path.join(dir_name, 'series.csv'), 'w') as f:
+                f.write(contents)
+
+        config = {
+            'description': 'test csv cache same name',
+            'model': 'data.ncdata.py',
+            'section': 'Data',
+            'ts_csv_list': 'ts_a ts_b',
+            'ts_a_file': os.path.join('test_csv_cache_a', 'series.csv'),
+            'ts_b_file': os.path.join('test_csv_cache_b', 'series.csv'),
+            'csv_cache_dir': 'test_csv_cache'
+            }
+
+        try:
+            self.data.set_config(config)
+            self.assertEqual(len(os.listdir('test_csv_cache')), 2)
+
+            # Both are read from the cache on the second pass, without parsing
+            data_2 = data.ncdata.Data()
+            def parse_csv_file(infile):
+                raise AssertionError('parse_csv_file called for ' + infile)
+            data_2.parse_csv_file = parse_csv_file
+            data_2.set_config(config)
+            self.assertTrue((data_2.get_timeseries('ts_a') == numpy.array([[1], [2]])).all())
+            self.assertTrue((data_2.get_timeseries('ts_b') == numpy.array([[3], [4]])).all())
+            self.assertEqual(data_2.get_timeseries('ts_a_hdr'), ['a'])
+            self.assertEqual(data_2.get_timeseries('ts_b_hdr'), ['b'])
+        finally:
+            for dir_name in ['test_csv_cache_a', 'test_csv_cache_b', 'test_csv_cache']:
+                shutil.rmtree(dir_name, True)
+
+
+    def test_lazy_load(self):
+        with open('test_lazy_1.csv', 'w') as f:
+            f.write('time,a,b\n1,1,2\n2,3,nan\n3,5,6\n4,7,8\n')
+        with open('test_lazy_2.csv', 'w') as f:
+            f.write('time,c\n1,10\n2,20\n3,30\n4,nan\n')
+
+        config = {
+            'description': 'test lazy load',
+            'model': 'data.ncdata.py',
+            'section': 'Data',
+            'ts_csv_list': 'ts_one ts_two',
+            'ts_one_file': 'test_lazy_1.csv',
+            'ts_two_file': 'test_lazy_2.csv',
+            'lazy_load': 'True'
+            }
+
+        try:
+            self.data.set_config(config)
+
+            # The NaN filter covers both series, but neither is held yet
+            self.assertEqual(self.data.get_ts_length(), 2)
+            self.assertFalse('ts_one' in self.data.data)
+            self.assertFalse('ts_two' in self.data.data)
+
+            self.assertTrue((self.data.get_timeseries('ts_one') == 
+                numpy.array([[1, 2], [5, 6]])).all())
+            self.assertEqual(self.data.get_timeseries('ts_one_hdr'), ['a', 'b'])
+            self.assertFalse('ts_two' in self.data.data)
+            self.assertTrue((self.data.get_timeseries('ts_two') == 
+                numpy.array([[10], [30]])).all())
+        finally:
+            os.remove('test_lazy_1.csv')
+            os.remove('test_lazy_2.csv')
+
+
+    def test_lazy_load_rep_periods(self):
+        with open('test_lazy_1.csv', 'w') as f:
+            f.write('time,a,b\n' + ''.join(['{:d},{:d},{:d}\n'.format(i, i % 5, (i * 7) % 3) 
+                for i in range(24)]))
+        with open('test_lazy_2.csv', 'w') as f:
+            f.write('time,c\n' + ''.join(['{:d},{:d}\n'.format(i, (i * 3) % 4) 
+                for i in range(24)]))
+
+        config = {
+            'description': 'test lazy load',
+            'model': 'data.ncdata.py',
+            'section': 'Data',
+            'ts_csv_list': 'ts_one ts_two',
+            'ts_one_file': 'test_lazy_1.csv',
+            'ts_two_file': 'test_lazy_2.csv',
+            'rep_period_count': 2,
+            'rep_period_len': 4
+            }
+
+        try:
+            self.data.set_config(config)
+
+            # Each series is read just once to configure lazy_load, including
+            # choosing the representative periods
+            reads = []
+            lazy_data = data.ncdata.Data()
+            read_series = lazy_data.read_series
+            def counting_read_series(series_name, list_type):
+                reads.append(series_name)
+                return read_series(series_name, list_type)
+            lazy_data.read_series = counting_read_series
+
+            config['lazy_load'] = 'True'
+            lazy_data.set_config(config)
+            self.assertEqual(reads, ['ts_one', 'ts_two'])
+
+            self.assertEqual(lazy_data.get_ts_length(), 8)
+            self.assertEqual(lazy_data.get_ts_length(), self.data.get_ts_length())
+            for ts_name in ['ts_one', 'ts_two']:
+                self.assertTrue((lazy_data.get_timeseries(ts_name) == 
+                    self.data.get_timeseries(ts_name)).all())
+        finally:
+            os.remove('test_lazy_1.csv')
+            os.remove('test_lazy_2.csv')
+
+
+    def test_float32(self):
+        with open('test_float32.csv', 'w') as f:
+            f.write('time,a,b\n1,1.5,2\n2,3,nan\n3,5,6.25\n')
+
+        config = {
+            'description': 'test float32',
+            'model': 'data.ncdata.py',
+            'section': 'Data',
+            'ts_csv_list': 'ts_matrix',
+            'ts_matrix_file': 'test_float32.csv'
+            }
+
+        try:
+            self.data.set_config(config, {'use_float32': True})
+            ts_matrix = self.data.get_timeseries('ts_matrix')
+            self.assertEqual(ts_matrix.dtype, numpy.float32)
+            self.assertTrue((ts_matrix == numpy.array([[1.5, 2], [5, 6.25]])).all())
+        finally:
+            os.remove('test_float32.csv')
+
+
+    def test_share_data(self):
+        with open('test_share_data.csv', 'w') as f:
+            f.write('time,a,b\n1,1.5,2\n2,3,4\n3,5,6.25\n')
+
+        config = {
+            'description': 'test share data',
+            'model': 'data.ncdata.py',
+            'section': 'Data',
+            'ts_csv_list': 'ts_one ts_two',
+            'ts_one_file': 'test_share_data.csv',
+            'ts_two_file': 'test_share_data.csv'
+            }
+
+        try:
+            self.data.set_config(config)
+            exp_ts = numpy.array(self.data.get_timeseries('ts_one'))
+            
+            self.data.share_data()
+            ts_one = self.data.get_timeseries('ts_one')
+            ts_two = self.data.get_timeseries('ts_two')
+            self.assertTrue((ts_one == exp_ts).all())
+            self.assertTrue((ts_two == exp_ts).all())
+            self.assertEqual(self.data.get_timeseries('ts_one_hdr'), ['a', 'b'])
+
+            # Both are read-only views into the one shared block
+            self.assertFalse(ts_one.flags.writeable)
+            self.assertFalse(numpy.may_share_memory(ts_one, ts_two))
+            self.assertTrue(ts_one.base is self.data.shared_block)
+            self.assertTrue(ts_two.base is self.data.shared_block)
+            self.assertRaises(ValueError, ts_one.__setitem__, 0, 1.0)
+        finally:
+            os.remove('test_share_data.csv')
+
+
+    def test_resample(self):
+        with open('test_resample.csv', 'w') as f:
+            f.write('time,a,b\n1,1,2\n2,3,4\n3,5,nan\n4,7,8\n5,9,10\n6,11,12\n7,13,14\n')
+
+        config = {
+            'description': 'test resample',
+            'model': 'data.ncdata.py',
+            'section': 'Data',
+            'ts_csv_list': 'ts_matrix',
+            'ts_matrix_file': 'test_resample.csv',
+            'resample_factor': '2'
+            }
+
+        try:
+            self.data.set_config(config)
+
+            # Second block has a NaN so is dropped, and the last row is not a full block
+            self.assertEqual(self.data.get_ts_length(), 2)
+            self.assertTrue((self.data.get_timeseries('ts_matrix') == 
+                numpy.array([[2, 3], [10, 11]])).all())
+
+            config['resample_factor'] = '0'
+            self.assertRaises(mureilexception.ConfigException, 
+                data.ncdata.Data().set_config, config)
+        finally:
+            os.remove('test_resample.csv')
+
+
 
 if __name__ == '__main__':
     unittest.main()
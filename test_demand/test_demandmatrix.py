@@ -103,6 +103,12 @@ class TestDemandMatrix(unittest.TestCase):
  
         self.assertEqual(self.data.ts_length, 4)
 
+        # Reconfiguring after the data is set recalculates the per-period demand
+        demand_config['scale'] = {2010: 2.0}
+        self.demand.set_config(demand_config, run_periods=run_periods)
+        data = self.demand.get_data(2030)
+        self.assertTrue(numpy.allclose(data, exp_data * 2.0))
+
 if __name__ == '__main__':
     unittest.main()
     
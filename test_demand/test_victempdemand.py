@@ -0,0 +1,110 @@
+#
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+"""Test of the demand shaping in victempdemand.py
+
+   Using the Python unittest library: 
+   http://docs.python.org/2/library/unittest.html#
+   
+   To run it, at a command line:
+   python test_victempdemand.py
+"""
+
+import sys
+sys.path.append('..')
+
+import os
+
+import unittest
+import numpy as np
+
+from tools import testutilities
+
+import demand.victempdemand
+
+def stepped_shape(daydemand, target):
+    """The original day-by-day shaping, stepping the levels 0.1 at a time.
+    """
+    demandmean = sum(daydemand)/float(len(daydemand))
+    totavail = sum(daydemand[daydemand > demandmean] - demandmean)
+    newtarget = min(target, totavail)
+    newdemand = daydemand.copy()
+    peak = max(daydemand)
+    mini = min(daydemand)
+
+    GWhsaved = 0.0
+    counter = 1
+    while GWhsaved <= newtarget:
+        yval = peak - 0.1*counter
+        GWh_filter = daydemand > yval
+        GWhsaved = sum(daydemand[GWh_filter] - yval)
+        newdemand[GWh_filter] = yval
+        counter += 1
+
+    counter = 1
+    GWhearned = 0.0
+    while GWhearned <= GWhsaved:
+        yval = mini + 0.1*counter
+        GWh_filter = daydemand < yval
+        GWhearned = sum(yval - daydemand[GWh_filter])
+        newdemand[GWh_filter] = yval
+        counter += 1
+
+    return daydemand - newdemand
+
+
+class TestShapeDays(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_matches_stepped(self):
+        rng = np.random.RandomState(7)
+        days = 4 + rng.rand(20, 48) * np.array([[0.5], [3], [10], [1]] * 5)
+        # include ties, values on the 0.1 grid, and a flat day
+        days[4:8] = np.round(days[4:8], 1)
+        days[8] = 5.0
+
+        for target in [0.0, 0.05, 1.0, 5.0, 1000.0]:
+            shapediff = demand.victempdemand.shape_days(days, target)
+            for i in range(days.shape[0]):
+                exp_diff = stepped_shape(days[i], target)
+                self.assertListEqual(shapediff[i].tolist(), exp_diff.tolist())
+
+    def test_levels(self):
+        days = np.array([[1.0, 2.0, 3.0, 4.0]])
+        (yvals, saved) = demand.victempdemand.find_shave_levels(days, np.array([0.55]))
+        # shaving to 3.5 saves 0.5, not more than 0.55, so go on to 3.4, saving 0.6
+        self.assertAlmostEqual(yvals[0], 3.4)
+        self.assertAlmostEqual(saved[0], 0.6)
+        (yvals, earned) = demand.victempdemand.find_fill_levels(days, np.array([0.0]))
+        self.assertAlmostEqual(yvals[0], 1.1)
+        self.assertAlmostEqual(earned[0], 0.1)
+
+        
+if __name__ == '__main__':
+    unittest.main()
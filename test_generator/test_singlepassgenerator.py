@@ -0,0 +1,117 @@
+#
+#
+# Copyright (C) University of Melbourne 2012
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+"""Test of the batch evaluation in the single-pass generators
+
+   Using the Python unittest library: 
+   http://docs.python.org/2/library/unittest.html#
+   
+   To run it, at a command line:
+   python test_singlepassgenerator.py
+"""
+
+import sys
+sys.path.append('..')
+
+import os
+
+import unittest
+import numpy
+
+from tools import mureilexception, testutilities
+
+from generator import singlepassvariablegenerator
+from thermal import instantthermal
+from missed_supply import missedsupply
+
+class TestBatchMatchesSingle(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+        self.params_batch = numpy.array([[0, 3, 5], [2, 0, 1], [7, 7, 0], [1, 1, 1]])
+        self.rem_demand_batch = numpy.array([[100, -50, 300, 25, 0, 80],
+            [10, 20, 30, 40, 50, 60], [-10, -20, 500, 400, 0, 5],
+            [0, 0, 0, 0, 0, 0]], dtype=float)
+        self.cap_fac = numpy.array([[0.1, 0.5, 0.0], [0.2, 0.4, 0.3], [0.9, 0.0, 0.1],
+            [0.5, 0.5, 0.5], [0.0, 0.0, 1.0], [0.3, 0.6, 0.2]])
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def check_batch(self, gen, params_batch):
+        costs, outputs = gen.calculate_cost_and_output_batch(params_batch,
+            self.rem_demand_batch)
+        for i in range(params_batch.shape[0]):
+            cost, output = gen.calculate_cost_and_output(params_batch[i],
+                self.rem_demand_batch[i])
+            self.assertAlmostEqual(costs[i], cost)
+            self.assertTrue(numpy.allclose(outputs[i], output))
+
+    def test_variable(self):
+        for gen_class, extra in [
+            (singlepassvariablegenerator.VariableGeneratorBasic, {}),
+            (singlepassvariablegenerator.VariableGeneratorLinearInstall, {'install': 15.0}),
+            (singlepassvariablegenerator.VariableGeneratorExpCost, {'install': 15.0}),
+            (singlepassvariablegenerator.VariableGeneratorSqrtCost, {'install': 15.0,
+                'max_count': 20.0})]:
+            gen = gen_class()
+            config = {'capex': 2.0, 'size': 10.0, 'type': 'Wind', 'data_type': 'ts_wind'}
+            config.update(extra)
+            gen.set_config(config)
+            gen.set_data({'ts_wind': self.cap_fac})
+            self.check_batch(gen, self.params_batch)
+
+    def test_thermal(self):
+        config = {'capex': 3.5, 'fuel_price_mwh': 10.0, 'carbon_price': 100.0,
+            'carbon_intensity': 0.9, 'timestep_hrs': 1.0, 'variable_cost_mult': 240.0}
+        gen = instantthermal.InstantMaxThermal()
+        gen.set_config(config)
+        self.check_batch(gen, self.params_batch[:,:0])
+
+        config['size'] = 50.0
+        config['time_scale_up_mult'] = 1.0
+        gen = instantthermal.InstantOptimisableThermal()
+        gen.set_config(config)
+        self.check_batch(gen, self.params_batch[:,:1])
+
+        gen = instantthermal.IncrementalInstantOptimisableThermal()
+        gen.set_config(config)
+        self.check_batch(gen, self.params_batch[:,:2])
+
+    def test_missed_supply(self):
+        gen = missedsupply.LinearMissedSupply()
+        gen.set_config({'cost_per_mwh': 12500.0, 'timestep_hrs': 1.0, 
+            'variable_cost_mult': 240.0})
+        self.check_batch(gen, self.params_batch[:,:0])
+
+        # CappedMissedSupply uses the default one-at-a-time batch evaluation
+        gen = missedsupply.CappedMissedSupply()
+        gen.set_config({'cost_per_mwh': 12500.0, 'timestep_hrs': 1.0, 
+            'variable_cost_mult': 240.0, 'reliability_reqt': 0.002, 'penalty': 1e6})
+        gen.set_data({'ts_demand': numpy.array([200, 200, 200, 200, 200, 200], dtype=float)})
+        self.check_batch(gen, self.params_batch[:,:0])
+
+        
+if __name__ == '__main__':
+    unittest.main()
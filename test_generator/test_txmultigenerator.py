@@ -211,6 +211,9 @@ class TestUpdateStateNewPeriod(unittest.TestCase):
         capacity = tmg.get_capacity(state_handle)
         exp_capacity = [300.0, 1300.0, 1000.0, 3400.0]
         self.assertTrue((exp_capacity == capacity))
+        self.assertTrue((numpy.array(exp_capacity) == tmg.get_capacity_array(state_handle)).all())
+        self.assertTrue((numpy.array([3400.0, 300.0]) == 
+            tmg.get_capacity_array(state_handle, [44, 11])).all())
 
         total_new_cap_cost, new_capacity_costs = (
             tmg.calculate_new_capacity_cost(state_handle))
@@ -412,6 +415,52 @@ class TestUpdateStateNewPeriod(unittest.TestCase):
             'In section Generator, lifetime_yrs = 8.0 which is required to be a multiple of time_period_yrs of 10.0')
             
 
+class TestStartupStateHandle(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_startup_state_not_modified(self):
+        tmg = txmultigeneratormultisite.TxMultiGeneratorMultiSite()
+        tmg.config['startup_data_name'] = 'gen_startup'
+        tmg.config['params_to_site_data_name'] = 'gen_site_map'
+        tmg.run_periods = [2010, 2020]
+
+        data = {}
+        data['gen_site_map'] = numpy.array([22, 11], dtype=int)
+        data['gen_startup'] = numpy.array([[22, 100, 1990, 2010],
+                                          [11, 300, 2000, 2020]], dtype=float)
+        tmg.set_data(data)
+
+        tmg.config['size'] = 10
+        tmg.config['capital_cost'] = 5
+        tmg.config['install_cost'] = 0
+        tmg.config['decommissioning_cost'] = 0.1
+        tmg.config['time_period_yrs'] = 10
+        tmg.config['lifetime_yrs'] = 10
+        tmg.expand_config([2010, 2020])
+
+        exp_state = {}
+        exp_state['curr_period'] = None
+        exp_state['capacity'] = {22: [(100, 1990, 2010)], 11: [(300, 2000, 2020)]}
+        exp_state['history'] = {}
+
+        # Add capacity at both sites, all of which is decommissioned at the end of 2010,
+        # along with the startup capacity at site 22
+        state_handle = tmg.get_startup_state_handle()
+        tmg.update_state_new_period_params(state_handle, 2010, numpy.array([2, 3]))
+        tmg.calculate_update_decommission(state_handle)
+
+        self.assertEqual(state_handle['capacity'], {11: [(300, 2000, 2020)]})
+        self.assertEqual(state_handle['history'], {22: [(100, 1990, 2010), (20, 2010, 2010)],
+            11: [(30, 2010, 2010)]})
+
+        # And check that the startup state, and a new handle, are unchanged
+        self.assertEqual(tmg.startup_state, exp_state)
+        self.assertEqual(tmg.get_startup_state_handle(), exp_state)
+
 
 
 if __name__ == '__main__':
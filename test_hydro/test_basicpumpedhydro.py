@@ -121,6 +121,14 @@ class TestBasicPumpedHydro(unittest.TestCase):
 
         self.assertListEqual(out_ts.tolist(), exp_ts.tolist())
         self.assertEqual(out_cost, exp_cost)
+
+        # And check the batch calculation gives the same result on each row
+        rem_demand_batch = np.array([rem_demand, rem_demand])
+        (out_costs, out_ts_batch) = self.hydro.calculate_cost_and_output_batch(
+            np.zeros((2, 0)), rem_demand_batch)
+        for i in range(2):
+            self.assertListEqual(out_ts_batch[i].round(10).tolist(), exp_ts.tolist())
+            self.assertEqual(out_costs[i].round(10), exp_cost)
     
     
     def test_1(self):
@@ -174,6 +182,41 @@ class TestBasicPumpedHydro(unittest.TestCase):
         self.do_csv_test("test10.csv")        
 
 
+class TestBasicPumpedHydroOptimisableBatch(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+        self.hydro = hydro.basicpumpedhydro.BasicPumpedHydroOptimisable()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_batch(self):
+        config = {
+            'capex': 2.0,
+            'dam_capacity': 10000,
+            'starting_level': 5000,
+            'water_factor': 2.0,
+            'pump_round_trip': 0.8,
+            'section': 'test_basicpumpedhydro',
+            'timestep_hrs': 1.0,
+            'size': 100
+        }
+        self.hydro.set_config(config)
+
+        rng = np.random.RandomState(4)
+        rem_demand_batch = (rng.rand(4, 500) - 0.5) * 2000
+        params_batch = np.array([[0], [1], [5], [30]])
+        
+        (out_costs, out_ts_batch) = self.hydro.calculate_cost_and_output_batch(
+            params_batch, rem_demand_batch)
+
+        for i in range(4):
+            (exp_cost, exp_ts) = self.hydro.calculate_cost_and_output(
+                params_batch[i], rem_demand_batch[i])
+            self.assertListEqual(out_ts_batch[i].tolist(), exp_ts.tolist())
+            self.assertEqual(out_costs[i], exp_cost)
+
+
 if __name__ == '__main__':
     unittest.main()
     
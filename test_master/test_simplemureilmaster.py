@@ -0,0 +1,103 @@
+#
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+"""Test of the batch evaluation in master/simplemureilmaster.py
+
+   Using the Python unittest library: 
+   http://docs.python.org/2/library/unittest.html#
+   
+   To run it, at a command line:
+   python test_simplemureilmaster.py
+"""
+
+import sys
+import os
+
+# The masters are built from the test_regression directories, so the path to
+# the package needs to be absolute
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+import unittest
+import random
+
+from tools import mureilbuilder, testutilities
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def build_master(self, test_name, config_file):
+        """Build the master from the config in the test_regression directory test_name,
+        and a population of 10 random genes for it.
+        """
+        os.chdir(os.path.join('..', 'test_regression', test_name))
+        master = mureilbuilder.build_master(['-f', config_file, '--iterations', '1'])
+        
+        rand = random.Random(12345)
+        genes = [[rand.randint(0, 2000) for i in range(master.param_count)] 
+            for j in range(10)]
+        return master, genes
+
+    def check_batch(self, test_name, config_file):
+        master, genes = self.build_master(test_name, config_file)
+        ts_length = master.data.get_ts_length()
+
+        try:
+            # The batch costs should agree with calc_cost on each gene
+            exp_costs = [master.calc_cost(gene) for gene in genes]
+            master.config['batch_max_values'] = 0
+            costs = master.calc_cost_batch(genes)
+            self.assertEqual(len(costs), len(genes))
+            for cost, exp_cost in zip(costs, exp_costs):
+                self.assertAlmostEqual(cost / exp_cost, 1.0, places=10)
+            self.assertEqual(master.gene_test_batch(genes), (-1 * costs).tolist())
+
+            # and not depend on the chunks they are calculated in - one gene per chunk,
+            # chunks that don't divide the population, and a batch_max_values
+            # smaller than one timeseries, which is still one gene per chunk.
+            for batch_max_values in [ts_length, 3 * ts_length, 1, 100 * ts_length]:
+                master.config['batch_max_values'] = batch_max_values
+                self.assertEqual(master.calc_cost_batch(genes).tolist(), costs.tolist())
+        finally:
+            master.finalise()
+
+    def test_asst5(self):
+        self.check_batch('asst5', 'asst5_config.txt')
+
+    def test_mg_test1(self):
+        self.check_batch('mg_test1', 'sample_config.txt')
+
+    def test_rhuva_test1(self):
+        self.check_batch('rhuva_test1', 'sample_config.txt')
+
+    def test_smm_demand(self):
+        self.check_batch('smm_demand', 'smm_demand_config.txt')
+
+
+if __name__ == '__main__':
+    unittest.main()
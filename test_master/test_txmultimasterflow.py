@@ -0,0 +1,143 @@
+#
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+"""Test of the prefix cache and parallel market solver in master/txmultimasterflow.py
+
+   Using the Python unittest library: 
+   http://docs.python.org/2/library/unittest.html#
+   
+   To run it, at a command line:
+   python test_txmultimasterflow.py
+"""
+
+import sys
+import os
+
+# The master is built from the test_regression directory, so the path to
+# the package needs to be absolute
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+import unittest
+import random
+import multiprocessing
+
+from tools import mureilbuilder, testutilities
+
+def build_master(prefix_cache_size=0, processes=0):
+    """Build the master from the flow_1 regression test config, with the
+    given prefix_cache_size and market solver processes.
+    """
+    files, conf_list = mureilbuilder.read_flags(['-f', 'flow_1_config.txt', 
+        '--iterations', '1'])
+    full_config = mureilbuilder.accum_config_files(files)
+    full_config['Master']['prefix_cache_size'] = str(prefix_cache_size)
+    full_config['MarketSolver']['processes'] = str(processes)
+    return mureilbuilder.create_master_instance(full_config, conf_list, None)
+
+
+def make_genes():
+    """Return genes that share the first period, and one that doesn't, close 
+    to the best genes found by the flow_1 regression test, so that they dispatch.
+    """
+    rand = random.Random(12345)
+    first_period = [325, 321, 4531, 790, 1649, 5391]
+    genes = [first_period + [rand.randint(0, 2000) for i in range(6)]
+        for j in range(3)]
+    genes.append([101, 6986, 4531, 1502, 1649, 5391, 1617, 1635, 384, 677, 785, 33])
+    return genes
+
+
+class TestPrefixCache(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+        os.chdir(os.path.join('..', 'test_regression', 'flow_1'))
+        self.master = build_master()
+        self.cached_master = build_master(prefix_cache_size=20)
+        self.genes = make_genes()
+
+        # Count the periods found in the cache by each calc_cost
+        self.hits = []
+        lookup = self.cached_master.prefix_cache.lookup
+        def counted_lookup(*args):
+            found = lookup(*args)
+            self.hits.append(found[0])
+            return found
+        self.cached_master.prefix_cache.lookup = counted_lookup
+
+    def tearDown(self):
+        self.master.finalise()
+        self.cached_master.finalise()
+        os.chdir(self.cwd)
+
+    def test_same_costs(self):
+        self.assertEqual(self.master.period_count, 2)
+        self.assertTrue(self.master.prefix_cache is None)
+
+        for gene in self.genes + self.genes:
+            self.assertEqual(self.cached_master.calc_cost(gene), 
+                self.master.calc_cost(gene))
+        self.assertEqual(self.hits, [0, 1, 1, 0, 1, 1, 1, 1])
+
+    def test_cost_bound(self):
+        gene = self.genes[0]
+        cost, results = self.master.calc_cost(gene, full_results=True)
+        first_cost = results['periods'][self.master.run_periods[0]]['totals']['cost']
+        self.cached_master.calc_cost(gene)
+
+        # Bounds that abort in each period, and that don't abort. After the
+        # cache hit, the gene should be aborted in the same period, with the 
+        # same cost, as without the cache.
+        for cost_bound in [first_cost * 0.5, (first_cost + cost) * 0.5, cost * 2]:
+            for gene in self.genes:
+                self.assertEqual(self.cached_master.calc_cost(gene, cost_bound=cost_bound),
+                    self.master.calc_cost(gene, cost_bound=cost_bound))
+        self.assertEqual(self.hits[1:4], [1, 1, 1])
+
+
+class TestMarketSolverProcesses(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+        os.chdir(os.path.join('..', 'test_regression', 'flow_1'))
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_same_costs(self):
+        master = build_master()
+        parallel_master = build_master(processes=2)
+        try:
+            for gene in make_genes():
+                self.assertAlmostEqual(parallel_master.calc_cost(gene) / 
+                    master.calc_cost(gene), 1.0, places=10)
+            
+            # The solver processes are stopped once each market is solved
+            self.assertEqual(multiprocessing.active_children(), [])
+        finally:
+            master.finalise()
+            parallel_master.finalise()
+
+
+if __name__ == '__main__':
+    unittest.main()
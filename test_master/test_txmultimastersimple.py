@@ -0,0 +1,189 @@
+#
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+"""Test of the cost bound and prefix cache in master/txmultimastersimple.py
+
+   Using the Python unittest library: 
+   http://docs.python.org/2/library/unittest.html#
+   
+   To run it, at a command line:
+   python test_txmultimastersimple.py
+"""
+
+import sys
+sys.path.append('..')
+
+import os
+
+import unittest
+import random
+
+from tools import mureilexception, mureilbuilder, testutilities
+
+import algorithm.geneticalgorithm
+
+class TestCostBound(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+        self.master = mureilbuilder.build_master(['-f', 
+            '../test_regression/multi/asst5_config_multi.txt', '--iterations', '1'])
+        self.gene = [120] * (self.master.period_count * self.master.param_count)
+
+    def tearDown(self):
+        self.master.finalise()
+        os.chdir(self.cwd)
+
+    def test_abort(self):
+        cost, results = self.master.calc_cost(self.gene, full_results=True)
+        period_costs = [results['periods'][period]['totals']['cost'] 
+            for period in self.master.run_periods]
+
+        # With no terminal value, the evaluation stops after the second period,
+        # with the cost so far
+        cost_bound = period_costs[0] + period_costs[1] * 0.5
+        bounded_cost = self.master.calc_cost(self.gene, cost_bound=cost_bound)
+        self.assertAlmostEqual(bounded_cost, period_costs[0] + period_costs[1])
+        self.assertTrue(bounded_cost > cost_bound)
+        self.assertTrue(bounded_cost < cost)
+
+    def test_terminal_value(self):
+        # Give one generator a terminal value, so that the gene's final cost 
+        # is under the bound, though the cost before the terminal value is 
+        # subtracted goes over it
+        terminal_value = 500000.0
+        gen = self.master.gen_list['fossil']
+        gen.get_terminal_value = lambda period, state_handle: (terminal_value, [])
+        gen.get_max_terminal_value = lambda state_handle: terminal_value
+
+        cost, results = self.master.calc_cost(self.gene, full_results=True)
+        self.assertEqual(results['totals']['terminal_value'], terminal_value)
+        
+        cost_bound = cost * 1.1
+        self.assertTrue(cost + terminal_value > cost_bound)
+        self.assertAlmostEqual(self.master.calc_cost(self.gene, cost_bound=cost_bound), cost)
+        self.assertAlmostEqual(self.master.gene_test(self.gene, cost_bound), -cost)
+
+    def test_abort_cost_mult(self):
+        config = {
+            'min_param_val': 0,
+            'max_param_val': 10000,
+            'base_mute': 0.01,
+            'gene_mute': 0.1,
+            'pop_size': 10,
+            'mort': 0.5,
+            'nuke_power': 20,
+            'processes': 0,
+            'seed': 12345,
+            'min_len': 5,
+            'max_len': 5,
+            'abort_cost_mult': 0.5
+        }
+        
+        engine = algorithm.geneticalgorithm.Engine()
+        self.assertRaises(mureilexception.ConfigException, engine.set_config, config)
+
+        config['abort_cost_mult'] = 1.5
+        engine.set_config(config)
+        engine.best_score = -1000.0
+        self.assertEqual(engine.get_cost_bound(), 1500.0)
+
+
+class TestPrefixCache(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+        self.master = self.build_master(0)
+        self.cached_master = self.build_master(20)
+        
+        # Count the periods found in the cache by each calc_cost
+        self.hits = []
+        lookup = self.cached_master.prefix_cache.lookup
+        def counted_lookup(*args):
+            found = lookup(*args)
+            self.hits.append(found[0])
+            return found
+        self.cached_master.prefix_cache.lookup = counted_lookup
+
+        # A gene, and genes sharing 0 to period_count - 1 periods with it
+        period_count = self.master.period_count
+        param_count = self.master.param_count
+        rand = random.Random(12345)
+        self.gene = [rand.randint(0, 200) for i in range(period_count * param_count)]
+        self.variants = [self.gene[:k * param_count] + 
+            [rand.randint(0, 200) for i in range((period_count - k) * param_count)]
+            for k in range(period_count)]
+
+    def tearDown(self):
+        self.master.finalise()
+        self.cached_master.finalise()
+        os.chdir(self.cwd)
+
+    def build_master(self, prefix_cache_size):
+        files, conf_list = mureilbuilder.read_flags(['-f', 
+            '../test_regression/multi/asst5_config_multi.txt', '--iterations', '1'])
+        full_config = mureilbuilder.accum_config_files(files)
+        full_config['Master']['prefix_cache_size'] = str(prefix_cache_size)
+        return mureilbuilder.create_master_instance(full_config, conf_list, None)
+
+    def test_same_costs(self):
+        self.assertTrue(self.master.prefix_cache is None)
+        
+        genes = [self.gene] + self.variants[::-1] + [self.gene] + self.variants
+        for gene in genes:
+            self.assertEqual(self.cached_master.calc_cost(gene), 
+                self.master.calc_cost(gene))
+        
+        # The first time through, each variant is found in the cache as far as it 
+        # shares periods with the first gene, and the second time through, all
+        # but the last period of every gene is found
+        period_count = self.master.period_count
+        self.assertEqual(self.hits, [0] + range(period_count - 1, -1, -1) + 
+            [period_count - 1] * (period_count + 1))
+        
+    def test_cost_bound(self):
+        cost, results = self.master.calc_cost(self.gene, full_results=True)
+        period_costs = [results['periods'][period]['totals']['cost'] 
+            for period in self.master.run_periods]
+        self.cached_master.calc_cost(self.gene)
+        
+        # Bounds that abort in each period, and that don't abort. After the
+        # cache hit, the gene should be aborted in the same period, with the 
+        # same cost, as without the cache.
+        cost_bounds = [sum(period_costs[:k]) + period_costs[k] * 0.5 
+            for k in range(self.master.period_count)] + [cost * 2]
+        for cost_bound in cost_bounds:
+            for gene in [self.gene] + self.variants:
+                self.assertEqual(self.cached_master.calc_cost(gene, cost_bound=cost_bound),
+                    self.master.calc_cost(gene, cost_bound=cost_bound))
+        self.assertEqual(self.hits[1::len(self.variants) + 1], 
+            [self.master.period_count - 1] * len(cost_bounds))
+
+        # An aborted evaluation leaves the cache in a state that gives the same costs
+        for gene in [self.gene] + self.variants:
+            self.assertEqual(self.cached_master.calc_cost(gene), 
+                self.master.calc_cost(gene))
+        
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -33,6 +33,7 @@ flow_1 - first test of flow model.
 
 config = 'flow_1_config.txt'
 pickle = 'flow_1.pkl'
+float32_config = 'float32_config.txt'
 
 import sys
 sys.path.append('../..')
@@ -41,12 +42,41 @@ import os
 test_dir = os.path.dirname(os.path.realpath(__file__)) 
 
 import unittest
+import cPickle
+import runmureil
 from test_regression.single_test import single_test
 
 class RegressionTest(unittest.TestCase):
     def test(self):
         self.assertTrue(single_test(
             test_dir, config, pickle))
+
+    def test_float32(self):
+        """Run the flow model with use_float32 set, and check it follows the same
+        genes as the double precision run, at close to the same cost.
+        """
+        cwd = os.getcwd()
+        os.chdir(test_dir)
+
+        opt_data = {}
+        try:
+            for name, configs in [('float64', ['-f', config]),
+                ('float32', ['-f', config, '-f', float32_config])]:
+                out_file = 'test_out_' + name + '.pkl'
+                log_file = 'test_' + name + '.log'
+                results = runmureil.runmureil(configs + ['--output_file', out_file,
+                    '-l', log_file])
+                self.assertTrue(results is not None)
+                opt_data[name] = cPickle.load(open(out_file, 'rb'))['opt_data']
+                os.remove(out_file)
+                os.remove(log_file)
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual([x[0] for x in opt_data['float32']],
+            [x[0] for x in opt_data['float64']])
+        for x32, x64 in zip(opt_data['float32'], opt_data['float64']):
+            self.assertAlmostEqual(x32[1] / x64[1], 1.0, places=5)
       
 if __name__ == '__main__':
     unittest.main()
@@ -196,6 +196,80 @@ class TestSlowResponseThermalFixed(unittest.TestCase):
         self.assertEqual(out_cost, exp_cost)
     
 
+class TestSlowResponseThermalBatch(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_batch(self):
+        config = {
+            'capex': 3.0,
+            'fuel_price_mwh': 10,
+            'carbon_price': 5,
+            'carbon_intensity': 1.0,
+            'timestep_hrs': 1.0,
+            'variable_cost_mult': 1.0,
+            'ramp_time_mins': 240,
+            'type': 'BlackCoal',
+            'fixed_capacity': 1200
+        }
+
+        rem_demand_batch = np.array([
+            [10, 20, 30, 40, 40, 40, 40, 30, 20, 10],
+            [0, 900, 1500, 1500, -200, -200, 800, 100, 0, 0],
+            [500, 500, 0, 0, 2000, 2000, 2000, 50, 50, 50]], dtype=float)
+        params_batch = np.array([[5], [0], [12]])
+        ts_demand = {'ts_demand': np.ones(10)*10000} # dummy demand
+
+        for thermal_class in [thermal.slowresponsethermal.SlowResponseThermal,
+            thermal.slowresponsethermal.SlowResponseThermalFixed]:
+            gen = thermal_class()
+            gen_config = dict(config)
+            if thermal_class == thermal.slowresponsethermal.SlowResponseThermal:
+                del gen_config['fixed_capacity']
+            gen.set_config(gen_config)
+            gen.set_data(ts_demand)
+
+            (costs, outputs) = gen.calculate_cost_and_output_batch(params_batch, 
+                rem_demand_batch)
+
+            for i in range(len(params_batch)):
+                (exp_cost, exp_ts) = gen.calculate_cost_and_output(params_batch[i],
+                    rem_demand_batch[i])
+                self.assertListEqual(outputs[i].tolist(), exp_ts.tolist())
+                self.assertAlmostEqual(costs[i], exp_cost)
+
+    def test_float32(self):
+        config = {
+            'capex': 3.0,
+            'fuel_price_mwh': 10,
+            'carbon_price': 5,
+            'carbon_intensity': 1.0,
+            'timestep_hrs': 1.0,
+            'variable_cost_mult': 1.0,
+            'ramp_time_mins': 240,
+            'type': 'BlackCoal'
+        }
+
+        rem_demand = np.array([0, 900, 1500, 1500, -200, -200, 800, 100, 0, 0])
+
+        gen = thermal.slowresponsethermal.SlowResponseThermal()
+        gen.set_config(config)
+        gen.set_data({'ts_demand': np.ones(10)*10000})
+        (exp_cost, exp_ts) = gen.calculate_cost_and_output([12], 
+            rem_demand.astype(float))
+
+        # With use_float32 set, the data and demand arrive as float32
+        gen.set_data({'ts_demand': np.ones(10, dtype=np.float32)*10000})
+        (out_cost, out_ts) = gen.calculate_cost_and_output([12], 
+            rem_demand.astype(np.float32))
+
+        self.assertTrue(np.allclose(out_ts, exp_ts))
+        self.assertAlmostEqual(out_cost, exp_cost, places=4)
+    
+
 if __name__ == '__main__':
     unittest.main()
     
@@ -64,7 +64,8 @@ class TestCalcs(unittest.TestCase):
         gc.set_config(global_conf)
         exp_pre = {'timestep_mins': 30, 'timestep_hrs': 0.5,
             'carbon_price': 25, 'carbon_price_m': 25e-6,
-            'data_ts_length': 365 * 3, 'time_period_yrs': 5}
+            'data_ts_length': 365 * 3, 'time_period_yrs': 5,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         gc.post_data_global_calcs()
@@ -88,7 +89,8 @@ class TestCalcs(unittest.TestCase):
             'timestep_hrs': 0.5,
             'carbon_price': {2040:25, 2030:12.5, 2010:6}, 
             'carbon_price_m': {2040:25e-6, 2030:12.5e-6, 2010:6e-6},
-            'data_ts_length': 365 * 3, 'time_period_yrs': 5}
+            'data_ts_length': 365 * 3, 'time_period_yrs': 5,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         gc.post_data_global_calcs()
@@ -161,7 +163,8 @@ class TestCalcs(unittest.TestCase):
 
         exp_pre = {'timestep_mins': 30, 'timestep_hrs': 0.5,
             'carbon_price': 12.5, 'carbon_price_m': 12.5e-6,
-            'data_ts_length': 365 * 3, 'time_period_yrs': 5}
+            'data_ts_length': 365 * 3, 'time_period_yrs': 5,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         gc.post_data_global_calcs()
@@ -185,7 +188,8 @@ class TestCalcs(unittest.TestCase):
 
         exp_pre = {'timestep_mins': 30, 'timestep_hrs': 0.5,
             'carbon_price': 12.5, 'carbon_price_m': 12.5e-6,
-            'data_ts_length': 365 * 3, 'time_period_yrs': 5}
+            'data_ts_length': 365 * 3, 'time_period_yrs': 5,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         gc.post_data_global_calcs()
@@ -203,7 +207,8 @@ class TestCalcs(unittest.TestCase):
         
         gc = globalconfig.GlobalBase()
         gc.set_config(global_conf)
-        exp_pre = {'data_ts_length': 365 * 3, 'time_period_yrs': 5}
+        exp_pre = {'data_ts_length': 365 * 3, 'time_period_yrs': 5,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         gc.post_data_global_calcs()
@@ -222,7 +227,8 @@ class TestCalcs(unittest.TestCase):
 
         exp_pre = {'timestep_mins': 30, 'timestep_hrs': 0.5,
             'carbon_price': 25, 'carbon_price_m': 25e-6,
-            'data_ts_length': 365 * 3}
+            'data_ts_length': 365 * 3,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         gc.post_data_global_calcs()
@@ -246,7 +252,8 @@ class TestCalcs(unittest.TestCase):
         exp_pre = {'timestep_mins': 30, 'timestep_hrs': 0.5,
             'carbon_price': 12.5, 'carbon_price_m': 12.5e-6,
             'data_ts_length': 365 * 3, 'time_period_yrs': 5,
-            'time_scale_up_mult': 100}
+            'time_scale_up_mult': 100,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         gc.post_data_global_calcs()
@@ -272,7 +279,8 @@ class TestCalcs(unittest.TestCase):
         exp_pre = {'timestep_mins': 30, 'timestep_hrs': 0.5,
             'carbon_price': 12.5, 'carbon_price_m': 12.5e-6,
             'data_ts_length': 365 * 3, 'time_period_yrs': 5,
-            'variable_cost_mult': 100}
+            'variable_cost_mult': 100,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         gc.post_data_global_calcs()
@@ -295,7 +303,8 @@ class TestCalcs(unittest.TestCase):
 
         exp_pre = {'timestep_mins': 30, 'timestep_hrs': 0.5,
             'carbon_price': 12.5, 'carbon_price_m': 12.5e-6,
-            'time_period_yrs': 5}
+            'time_period_yrs': 5,
+            'use_float32': False}
         self.assertTrue((exp_pre == gc.get_config()))
 
         with self.assertRaises(mureilexception.ConfigException) as cm:
@@ -305,6 +314,16 @@ class TestCalcs(unittest.TestCase):
             'Global calculations of time_scale_up_mult require the data_ts_length parameter to be set')
 
 
+    def test_use_float32(self):
+        gc = globalconfig.GlobalBase()
+        gc.set_config({'use_float32': 'True'})
+        self.assertTrue(gc.get_config()['use_float32'] is True)
+
+        gc = globalconfig.GlobalBase()
+        gc.set_config({'use_float32': 'False'})
+        self.assertTrue(gc.get_config()['use_float32'] is False)
+
+
 if __name__ == '__main__':
     unittest.main()
     
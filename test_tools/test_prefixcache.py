@@ -0,0 +1,115 @@
+#
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+"""Test of tools/prefixcache.py
+
+   Using the Python unittest library: 
+   http://docs.python.org/2/library/unittest.html#
+   
+   To run it, at a command line:
+   python test_prefixcache.py
+"""
+
+import sys
+sys.path.append('..')
+
+import os
+
+import unittest
+
+from tools import testutilities
+
+from tools import prefixcache
+
+class TestPrefixCache(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+        self.cache = prefixcache.PrefixCache(2)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_longest_prefix(self):
+        # 3 periods of 2 params
+        self.cache.store([1, 2, 3, 4, 5, 6], 1, 2, 10.0, {'cap': [1]})
+        self.cache.store([1, 2, 3, 4, 5, 6], 2, 2, 25.0, {'cap': [2]})
+        
+        self.assertEqual(self.cache.lookup([1, 2, 3, 4, 9, 9], 3, 2),
+            (2, 25.0, {'cap': [2]}))
+        self.assertEqual(self.cache.lookup([1, 2, 9, 9, 9, 9], 3, 2),
+            (1, 10.0, {'cap': [1]}))
+        self.assertEqual(self.cache.lookup([9, 2, 3, 4, 5, 6], 3, 2),
+            (0, None, None))
+
+    def test_state_copied(self):
+        state = {'cap': [1]}
+        self.cache.store([1, 2], 1, 1, 10.0, state)
+        state['cap'].append(2)
+        
+        periods_done, cost, found = self.cache.lookup([1, 2], 2, 1)
+        self.assertEqual(found, {'cap': [1]})
+        found['cap'].append(3)
+        self.assertEqual(self.cache.lookup([1, 2], 2, 1)[2], {'cap': [1]})
+
+    def test_oldest_discarded(self):
+        self.cache.store([1, 0], 1, 1, 1.0, None)
+        self.cache.store([2, 0], 1, 1, 2.0, None)
+        self.cache.store([3, 0], 1, 1, 3.0, None)
+        
+        self.assertEqual(self.cache.lookup([1, 0], 2, 1)[0], 0)
+        self.assertEqual(self.cache.lookup([2, 0], 2, 1)[0], 1)
+        self.assertEqual(self.cache.lookup([3, 0], 2, 1)[0], 1)
+
+    def test_least_recently_used_discarded(self):
+        self.cache.store([1, 0], 1, 1, 1.0, None)
+        self.cache.store([2, 0], 1, 1, 2.0, None)
+        
+        # The hit on [1] makes [2] the least recently used
+        self.assertEqual(self.cache.lookup([1, 0], 2, 1)[0], 1)
+        self.cache.store([3, 0], 1, 1, 3.0, None)
+        
+        self.assertEqual(self.cache.lookup([1, 0], 2, 1)[0], 1)
+        self.assertEqual(self.cache.lookup([2, 0], 2, 1)[0], 0)
+        self.assertEqual(self.cache.lookup([3, 0], 2, 1)[0], 1)
+
+    def test_copy_state(self):
+        copies = []
+        def copy_state(state):
+            copies.append(state)
+            return dict(state)
+        
+        cache = prefixcache.PrefixCache(2, copy_state)
+        state = {'cap': [1]}
+        cache.store([1, 2], 1, 1, 10.0, state)
+        found = cache.lookup([1, 2], 2, 1)[2]
+        
+        self.assertEqual(len(copies), 2)
+        self.assertEqual(found, state)
+        self.assertFalse(found is state)
+        self.assertTrue(found['cap'] is state['cap'])
+
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+"""Test of tools/representativeperiods.py
+
+   Using the Python unittest library: 
+   http://docs.python.org/2/library/unittest.html#
+   
+   To run it, at a command line:
+   python test_representativeperiods.py
+"""
+
+import sys
+sys.path.append('..')
+
+import os
+
+import unittest
+import numpy
+
+from tools import mureilexception, testutilities
+
+from tools import representativeperiods
+
+class TestRepresentativePeriods(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_two_clusters(self):
+        # 6 periods of length 3 - 4 'low' periods and 2 'high' periods
+        low = [1.0, 2.0, 1.0]
+        high = [10.0, 12.0, 10.0]
+        demand = numpy.array(low + high + low + low + high + low)
+        wind = numpy.array([[0.5, 0.2]] * 18)
+        
+        keep = representativeperiods.select_representative_periods(
+            [demand, wind], 3, 3, 2)
+        
+        # Expect 2 low and 1 high period, in time order
+        self.assertEqual(len(keep), 9)
+        self.assertTrue(numpy.all(numpy.diff(keep) > 0))
+        reduced = demand[keep].reshape(3, 3)
+        self.assertEqual(numpy.sum(reduced[:,1] == 12.0), 1)
+        self.assertEqual(numpy.sum(reduced[:,1] == 2.0), 2)
+
+    def test_all_periods(self):
+        demand = numpy.arange(20, dtype=float)
+        keep = representativeperiods.select_representative_periods(
+            [demand], 4, 5)
+        self.assertTrue(numpy.array_equal(keep, numpy.arange(20)))
+
+    def test_partial_period_dropped(self):
+        demand = numpy.arange(10, dtype=float)
+        keep = representativeperiods.select_representative_periods(
+            [demand], 4, 2)
+        self.assertTrue(numpy.array_equal(keep, numpy.arange(8)))
+
+    def test_too_many_periods(self):
+        demand = numpy.arange(10, dtype=float)
+        self.assertRaises(mureilexception.ConfigException, 
+            representativeperiods.select_representative_periods, [demand], 4, 3)
+
+        
+if __name__ == '__main__':
+    unittest.main()
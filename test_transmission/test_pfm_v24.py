@@ -0,0 +1,155 @@
+#
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+"""Test of transmission/PFM_v24.py
+
+   Using the Python unittest library: 
+   http://docs.python.org/2/library/unittest.html#
+   
+   To run it, at a command line:
+   python test_pfm_v24.py
+"""
+
+import sys
+sys.path.append('..')
+
+import os
+
+import unittest
+import numpy as np
+
+from tools import testutilities
+
+from transmission import PFM_v24
+
+class TestPowerFlow(unittest.TestCase):
+    def setUp(self):
+        testutilities.unittest_path_setup(self, __file__)
+        self.pf = PFM_v24.PowerFlow()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def create_triangle(self):
+        # Three nodes, all connected by lines of the same admittance,
+        # with node 0 the slack node.
+        y_bus = np.array([[0, 10, 10], [10, 0, 10], [10, 10, 0]], dtype=float)
+        a_matrix = np.array([[1, -1, 0], [0, 1, -1], [1, 0, -1]])
+        capacity_matrix = np.array([[0, 100, 100], [100, 0, 100], [100, 100, 0]], dtype=float)
+        self.pf.create_transmission_network(y_bus, a_matrix, capacity_matrix)
+
+    def test_triangle(self):
+        self.create_triangle()
+
+        # Power from node 1 to the slack node splits 2/3 on the direct line, 
+        # and 1/3 via node 2
+        self.pf.calculate_flow([[-1, 1, 0], [-1, 0, 1]])
+        exp_flows = np.array([[-2, 1, -1], [-1, -1, -2]]) / 3.0
+        self.assertEqual(self.pf.flow_series.shape, (2, 3))
+        self.assertTrue(np.allclose(self.pf.flow_series, exp_flows))
+
+        # A further call adds its flows to the end of the flow_series
+        self.pf.calculate_flow([[0, -1, 1]])
+        self.assertEqual(self.pf.flow_series.shape, (3, 3))
+        self.assertTrue(np.allclose(self.pf.flow_series[2], exp_flows[1] - exp_flows[0]))
+
+        max_in, max_ag, load90_in, load90_ag = self.pf.analyse_network()
+        for result in [max_in, max_ag, load90_in, load90_ag]:
+            self.assertEqual(result.shape, (3,))
+        self.assertTrue(np.allclose(max_in, np.array([1, 1, 0]) / 3.0))
+        
+    def load_nem(self, pf):
+        folder = '../transmission/NEM_test/'
+        a_matrix = np.genfromtxt(folder + 'A-matrix.csv', dtype=float, delimiter=',')
+        y_bus = np.genfromtxt(folder + 'Y-Bus_matrix.csv', dtype=float, delimiter=',')
+        capacity_matrix = np.genfromtxt(folder + 'Cap_matrix.csv', dtype=float, delimiter=',')
+        pf.create_transmission_network(y_bus, a_matrix, capacity_matrix)
+
+    def test_nem(self):
+        # Compare with the flows found timestep by timestep from the phase angles
+        self.load_nem(self.pf)
+
+        supply = np.random.RandomState(0).randn(20, self.pf.no_nodes) * 1000
+        self.pf.calculate_flow(supply)
+        
+        b_inverse = np.linalg.inv(self.pf.b_prime_matrix)
+        for t in range(len(supply)):
+            phase_angles = np.dot(b_inverse, supply[t, 1:])
+            exp_flow = np.dot(np.asarray(self.pf.a_d_matrix), phase_angles)
+            self.assertTrue(np.allclose(self.pf.flow_series[t], exp_flow))
+
+    def test_update_line_admittance(self):
+        # Chain enough updates that the network is rebuilt along the way, and
+        # compare each time with a network built from scratch
+        self.load_nem(self.pf)
+        rand = np.random.RandomState(1)
+        rebuilds = 0
+        
+        for k in range(30):
+            line = self.pf.line_dictionary[rand.randint(self.pf.no_edges)]
+            orig_id = line['origin']
+            dest_id = line['destination']
+            new_y = line['Y'] * rand.uniform(0.5, 2)
+            
+            # As update_transmission_network does
+            self.pf.y_bus[orig_id][dest_id] = new_y
+            self.pf.y_bus[dest_id][orig_id] = new_y
+            if not self.pf.update_line_admittance(orig_id, dest_id, new_y):
+                self.pf.create_transmission_network(self.pf.y_bus, 
+                    self.pf.a_matrix, self.pf.capacity_matrix)
+                rebuilds += 1
+            
+            exp_pf = PFM_v24.PowerFlow()
+            exp_pf.create_transmission_network(self.pf.y_bus.copy(), 
+                self.pf.a_matrix, self.pf.capacity_matrix)
+            self.assertTrue(np.allclose(self.pf.ptdf_matrix, exp_pf.ptdf_matrix))
+            self.assertTrue(np.allclose(self.pf.b_prime_matrix, exp_pf.b_prime_matrix))
+            self.assertTrue(np.allclose(self.pf.a_d_matrix, exp_pf.a_d_matrix))
+            self.assertEqual(self.pf.line_dictionary, exp_pf.line_dictionary)
+        
+        self.assertEqual(rebuilds, 1)
+
+    def test_max_admittance_updates(self):
+        self.pf = PFM_v24.PowerFlow(max_admittance_updates=2)
+        self.create_triangle()
+        
+        self.assertTrue(self.pf.update_line_admittance(0, 1, 20))
+        self.assertTrue(self.pf.update_line_admittance(1, 2, 20))
+        self.assertFalse(self.pf.update_line_admittance(0, 2, 20))
+        
+        # Lines that don't exist can't be updated in place
+        self.pf.create_transmission_network(self.pf.y_bus, self.pf.a_matrix, 
+            self.pf.capacity_matrix)
+        self.assertFalse(self.pf.update_line_admittance(0, 0, 20))
+        self.assertTrue(self.pf.update_line_admittance(0, 2, 20))
+        
+        # With no in-place updates allowed, the network is always rebuilt
+        self.pf = PFM_v24.PowerFlow(max_admittance_updates=0)
+        self.create_triangle()
+        self.assertFalse(self.pf.update_line_admittance(0, 1, 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
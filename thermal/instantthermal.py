@@ -87,6 +87,19 @@ class InstantMaxThermal(singlepassgenerator.SinglePassGeneratorBase):
         return cost, output
         
 
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Meets all remaining demand for each row of rem_demand_batch, as
+        for calculate_cost_and_output, in one pass.
+        """
+        outputs = rem_demand_batch.clip(0)
+        max_caps = numpy.max(outputs, axis=1)
+        variable_costs = numpy.sum(outputs, axis=1) * self.config['timestep_hrs'] * (
+            self.config['fuel_price_mwh'] + (
+            self.config['carbon_price'] * self.config['carbon_intensity'])) / float(1e6)
+        costs = variable_costs * self.config['variable_cost_mult'] + self.config['capex'] * max_caps
+        return costs, outputs
+
+
     def interpret_to_string(self):
         if self.saved:
             return 'Instant Fossil Thermal, max capacity (MW) {:.2f}'.format(
@@ -163,6 +176,19 @@ class InstantOptimisableThermal(singlepassgenerator.SinglePassGeneratorBase):
         return cost, output
          
  
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Attempts to meet remaining demand for each row of rem_demand_batch, 
+        as for calculate_cost_and_output, in one pass.
+        """
+        max_caps = params_batch[:,0] * self.config['size']
+        outputs = numpy.clip(rem_demand_batch, 0, max_caps[:,numpy.newaxis])
+        variable_costs = numpy.sum(outputs, axis=1) * self.config['timestep_hrs'] * (
+            self.config['fuel_price_mwh'] + (
+            self.config['carbon_price'] * self.config['carbon_intensity'])) / 1e6
+        costs = variable_costs * self.config['variable_cost_mult'] + self.config['capex'] * max_caps
+        return costs, outputs
+
+
     def interpret_to_string(self):
         if self.saved:
             return 'Instant Fossil Thermal, optimisable, max capacity (MW) {:.2f}'.format(
@@ -219,4 +245,19 @@ class IncrementalInstantOptimisableThermal(InstantOptimisableThermal):
             self.saved['other'] = {'carbon': carbon_output}
  
         return cost, output
+
+
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Attempts to meet remaining demand for each row of rem_demand_batch, 
+        as for calculate_cost_and_output, in one pass.
+        """
+        max_caps = params_batch[:,0] * self.config['size']
+        outputs = numpy.clip(rem_demand_batch, 0, max_caps[:,numpy.newaxis])
+        output_mwh = numpy.sum(outputs, axis=1) * self.config['timestep_hrs']
+        carbon_costs = (self.config['carbon_price'] * self.config['carbon_intensity'] * 
+            output_mwh) / 1e6
+        fuel_costs = output_mwh * self.config['fuel_price_mwh'] / 1e6
+        costs = (carbon_costs + fuel_costs) * self.config['variable_cost_mult'] + (
+            self.config['capex'] * (params_batch[:,1] * self.config['size']))
+        return costs, outputs
          
@@ -82,7 +82,7 @@ class SlowResponseThermal(singlepassgenerator.SinglePassGeneratorBase):
         """
         
         self.ts_demand = data['ts_demand']
-        mureiltypes.check_ndarray_float(self.ts_demand)
+        mureiltypes.check_ndarray_float(self.ts_demand, allow_float32=True)
     
     
     def calculate_cost_and_output(self, params, rem_demand, save_result=False):
@@ -156,6 +156,56 @@ class SlowResponseThermal(singlepassgenerator.SinglePassGeneratorBase):
             self.saved['output'] = numpy.copy(output)
  
         return cost, output
+
+
+
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Attempts to meet remaining demand for each row of rem_demand_batch, 
+        as for calculate_cost_and_output, with the ramp-limited dispatch of all
+        of the rows done together at each timestep.
+        """
+        capacities = params_batch[:,0] * self.config['size']
+        return self.calculate_ramped_batch(capacities, rem_demand_batch)
+
+
+    def calculate_ramped_batch(self, capacities, rem_demand_batch):
+        """Calculate the cost and ramp-limited output for a batch of capacities, 
+        following the same ramping rules as calculate_cost_and_output. The
+        timesteps must be stepped through in order, but at each timestep the
+        output for every row is updated at once.
+        
+        Inputs:
+            capacities: numpy.array - 1-d, the capacity in MW for each row.
+            rem_demand_batch: numpy.array - 2-d, one row per capacity, each row
+                a time series of the demand remaining to be met.
+                
+        Outputs:
+            costs: numpy.array - 1-d, capex cost plus fuel and carbon tax cost for each row.
+            outputs: numpy.array - 2-d, the power generated at each timestep for each row.
+        """
+        # Work on the transpose so each timestep is a contiguous row
+        rem_demand_t = numpy.ascontiguousarray(rem_demand_batch.T)
+        outputs_t = numpy.zeros(rem_demand_t.shape)
+
+        therm_out = numpy.zeros(len(capacities)) # initial thermal output assumed zero
+        max_grad = capacities/(self.config['ramp_time_mins']/60) # max response gradient
+        max_inc = max_grad * self.config['timestep_hrs'] # max inc/dec based on ramp
+        
+        for i in range(rem_demand_t.shape[0]):
+            des_inc = rem_demand_t[i] - therm_out 
+            therm_out = therm_out + numpy.where(numpy.abs(des_inc) <= max_inc, 
+                des_inc, max_inc * numpy.sign(des_inc))
+            # limit to max capacity, then to zero
+            therm_out = numpy.maximum(numpy.minimum(therm_out, capacities), 0)
+            outputs_t[i] = therm_out
+
+        outputs = numpy.ascontiguousarray(outputs_t.T)
+        variable_costs = numpy.sum(outputs, axis=1) * self.config['timestep_hrs'] * (
+            self.config['fuel_price_mwh'] + (
+            self.config['carbon_price'] * self.config['carbon_intensity'])) / 1e6
+        costs = variable_costs * self.config['variable_cost_mult'] + self.config['capex'] * capacities
+
+        return costs, outputs
          
  
     def interpret_to_string(self):
@@ -179,6 +229,15 @@ class SlowResponseThermalFixed(SlowResponseThermal):
         return SlowResponseThermal.calculate_cost_and_output(self, 
             [self.config['fixed_capacity'] / self.config['size']], rem_demand, save_result)
 
+
+    def calculate_cost_and_output_batch(self, params_batch, rem_demand_batch):
+        """Return the batch cost and output from the optimisable slow
+        response thermal, with every capacity set to fixed capacity.
+        """
+        capacities = numpy.ones(rem_demand_batch.shape[0]) * (
+            (self.config['fixed_capacity'] / self.config['size']) * self.config['size'])
+        return self.calculate_ramped_batch(capacities, rem_demand_batch)
+
     
     def get_config_spec(self):
         """Return a list of tuples of format (name, conversion function, default),
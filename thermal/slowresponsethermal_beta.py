@@ -88,7 +88,7 @@ class SlowResponseThermal(singlepassgenerator.SinglePassGeneratorBase):
         """
         
         self.ts_demand = data['ts_demand']
-        mureiltypes.check_ndarray_float(self.ts_demand)
+        mureiltypes.check_ndarray_float(self.ts_demand, allow_float32=True)
     
     
     def calculate_cost_and_output(self, params, rem_demand, save_result=False):
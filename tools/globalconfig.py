@@ -77,6 +77,9 @@ class GlobalBase(configurablebase.ConfigurableBase):
             data_ts_length: the length of the timeseries being simulated, in samples. Typically
                 this is determined by the master.
             carbon_price: float - the carbon price in $/tonne.
+            use_float32: boolean - if True, the data timeseries are held, and the dispatch
+                is calculated, in single precision, which halves the memory and memory
+                bandwidth they use, at the cost of precision. Defaults to False.
         """
         return [('timestep_mins', float, None),
             ('time_period_yrs', float, None),
@@ -86,7 +89,8 @@ class GlobalBase(configurablebase.ConfigurableBase):
             ('time_scale_up_mult', float, None),
             ('variable_cost_mult', float, None),
             ('data_ts_length', int, None),
-            ('carbon_price', float, None)
+            ('carbon_price', float, None),
+            ('use_float32', mureilbuilder.string_to_bool, False)
             ]
 
 
@@ -741,7 +741,7 @@ def python_eval(val):
         return val
     
     
-def supply_single_pass_data(gen, data, gen_type):
+def supply_single_pass_data(gen, data, gen_type, float_dtype=None):
     """Make the call to set_data for gen, extracting the relevant series from data.
     
     Inputs:
@@ -749,6 +749,8 @@ def supply_single_pass_data(gen, data, gen_type):
         data: an object subclassed from DataSinglePassBase
         gen_type: the name the calling Master uses to refer to the generator, for
             the exception message.
+        float_dtype: optional - if set, e.g. to numpy.float32, floating point
+            series are supplied as this dtype, converting them if required.
               
     Outputs:
         None. Raises a ConfigException if a generator requests a series that is not
@@ -764,6 +766,10 @@ def supply_single_pass_data(gen, data, gen_type):
             msg = 'Data series ' + str(key) + ' requested by ' + gen_type + ', but is not provided.'
             raise mureilexception.ConfigException(msg, {})
 
+        if ((float_dtype is not None) and isinstance(this_data_dict[key], numpy.ndarray) and
+            (this_data_dict[key].dtype.kind == 'f')):
+            this_data_dict[key] = this_data_dict[key].astype(float_dtype, copy=False)
+
     gen.set_data(this_data_dict)
 
 
@@ -30,8 +30,9 @@ import numpy
 """Module providing helper functions for type-checking of arrays.
 """
 
-def check_ndarray_float(array, no_exception=False):
-    """Return only if the array is of type numpy.ndarray, with a float64 dtype.
+def check_ndarray_float(array, no_exception=False, allow_float32=False):
+    """Return only if the array is of type numpy.ndarray, with a float64 dtype,
+    or float32 if allow_float32 is True.
     If not, raise a mureilexception.ArrayDataTypeException. 
     If no_exception is True, don't raise the exception, but return False.
     """
@@ -44,7 +45,8 @@ def check_ndarray_float(array, no_exception=False):
                 ' in ' + mureilexception.find_caller(1))
             raise mureilexception.ArrayDataTypeException(msg, {})
 
-    if not(array.dtype.name == 'float64'):
+    if not(array.dtype.name == 'float64' or 
+        (allow_float32 and array.dtype.name == 'float32')):
         if no_exception:
             return False
         else:
@@ -0,0 +1,89 @@
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+
+
+"""Module providing a cache of the simulation state at the end of each period,
+keyed on the gene values that determine that state, so that the multi-period
+masters can skip re-simulating the leading periods of genes that share them.
+"""
+
+import collections
+import copy
+
+
+class PrefixCache(object):
+    """A bounded cache mapping a gene prefix (the params for the first k periods)
+    to the accumulated cost and the simulation state at the end of period k.
+    When full, the least recently used entry is discarded.
+    """
+
+    def __init__(self, max_size, copy_state=copy.deepcopy):
+        """Initialise the cache.
+        
+        Inputs:
+            max_size: the maximum number of entries to keep.
+            copy_state: a function returning a copy of a state, that can be updated
+                without changing the original. The masters supply one that copies
+                each state handle as its model requires, which for the copy-on-write
+                handles of TxMultiGeneratorMultiSite is much cheaper than a deepcopy.
+        """
+        self.max_size = max_size
+        self.copy_state = copy_state
+        self.entries = collections.OrderedDict()
+
+
+    def lookup(self, gene, period_count, param_count):
+        """Find the longest prefix of gene, of at most period_count - 1 periods, 
+        that is in the cache.
+        
+        Inputs:
+            gene: list of param values, for all periods.
+            period_count: the number of periods in the gene.
+            param_count: the number of params in each period.
+            
+        Outputs:
+            periods_done: the number of periods found in the cache, or 0 if none.
+            cost: the accumulated cost at the end of those periods, or None.
+            state: a copy of the state stored, or None.
+        """
+        for periods_done in range(period_count - 1, 0, -1):
+            key = tuple(gene[:periods_done * param_count])
+            if key in self.entries:
+                # Move the entry to the end, as the most recently used
+                cost, state = self.entries[key] = self.entries.pop(key)
+                return periods_done, cost, self.copy_state(state)
+
+        return 0, None, None
+
+
+    def store(self, gene, periods_done, param_count, cost, state):
+        """Store a copy of the state, and the cost, at the end of periods_done 
+        periods of gene.
+        """
+        key = tuple(gene[:periods_done * param_count])
+        if key not in self.entries:
+            self.entries[key] = (cost, self.copy_state(state))
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
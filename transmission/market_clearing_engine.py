@@ -28,6 +28,8 @@ of power flows based on bid and offer prices.
 """
 
 import logging
+import math
+import sys
 import numpy as np
 import cvxopt as cvx
 from cvxopt import solvers
@@ -40,6 +42,28 @@ class MarketOptimisation:
     pass
 
 
+# The parts of the LP that are the same for every timestep, as the tuple
+# (objective, G, A, b), set in each solver process by _set_lp_static.
+_lp_static = None
+
+
+def _set_lp_static(lp_static):
+    """Set the parts of the LP that are the same for every timestep, as the
+    initializer of the pool of solver processes, so they are only sent once.
+    """
+    global _lp_static
+    _lp_static = lp_static
+
+
+def _solve_lp(rhs):
+    """Solve a single LP, given the inequality constraint rhs (h) for the timestep,
+    with the rest of the LP set by _set_lp_static. This is at module level so that
+    it can be used by multiprocessing.Pool.map.
+    """
+    objective, G, A, b = _lp_static
+    return solvers.lp(objective, G, rhs, A, b)
+
+
 class MarketClearingEngine(configurablebase.ConfigurableMultiBase):
     """Configure the engine that calculates the dispatch using an LP.
     """
@@ -51,6 +75,12 @@ class MarketClearingEngine(configurablebase.ConfigurableMultiBase):
         solvers.options['abstol'] = self.config['abstol']
         solvers.options['reltol'] = self.config['reltol']
 
+        # Multiprocessing as implemented here does not work on Windows
+        if (sys.platform == 'win32'):
+            self.config['processes'] = 0
+
+        self.is_configured = True
+
         
     def get_config_spec(self):
         """Return a list of tuples of format (name, conversion function, default),
@@ -72,6 +102,9 @@ class MarketClearingEngine(configurablebase.ConfigurableMultiBase):
                 running the optimisation, the maximum allowable sum(demand_bids)/sum(supply_offers).
                 This aims to reduce the range of the objective to reduce numerical issues, 
                 and to weed out impossible problems quickly.
+            processes: integer, default 0 - the number of processes to use to solve the
+                timesteps in solve_multiple_steps in parallel. If 0, the timesteps are
+                solved in sequence in the calling process.
         """
         return [
             ('show_progress', mureilbuilder.string_to_bool, 'False'),
@@ -79,7 +112,8 @@ class MarketClearingEngine(configurablebase.ConfigurableMultiBase):
             ('abstol', float, 1e-8),
             ('reltol', float, 1e-8),
             ('demand_min', float, 0),
-            ('reject_outright_proportion', float, 2.0)
+            ('reject_outright_proportion', float, 2.0),
+            ('processes', int, 0)
             ]
 
 
@@ -183,16 +217,24 @@ class MarketClearingEngine(configurablebase.ConfigurableMultiBase):
                 ', multi_generation.size[1] = ' + str(multi_generation.size[1]))
             raise mureilexception.ConfigException(msg, {})
 
-        for j in range(multi_generation.size[1]):
-            # Check here that total demand isn't heaps more than total supply
-            tot_d = np.sum(multi_demand[:,j])
-            tot_g = np.sum(multi_generation[:,j])
-            if (tot_d / tot_g) > self.config['reject_outright_proportion']:
-                msg = 'Reject outright ' + str(tot_d / tot_g)
-                raise mureilexception.SolverException(msg, {'prop': tot_d / tot_g})
-            self.update_program(market, multi_demand[:,j], multi_generation[:,j])
-            this_sol = self.solve(market)
-            solutions.append(this_sol)
+        # Check here, for all timesteps at once, that total demand isn't heaps
+        # more than total supply. The first offending timestep is reported.
+        tot_d = np.sum(np.array(multi_demand), axis=0)
+        tot_g = np.sum(np.array(multi_generation), axis=0)
+        prop = tot_d / tot_g
+        rejected = np.flatnonzero(prop > self.config['reject_outright_proportion'])
+        if len(rejected) > 0:
+            reject_prop = prop[rejected[0]]
+            msg = 'Reject outright ' + str(reject_prop)
+            raise mureilexception.SolverException(msg, {'prop': reject_prop})
+
+        if self.config['processes'] > 0:
+            solutions = self.solve_steps_parallel(market, multi_demand, multi_generation)
+        else:
+            for j in range(multi_generation.size[1]):
+                self.update_program(market, multi_demand[:,j], multi_generation[:,j])
+                this_sol = self.solve(market)
+                solutions.append(this_sol)
     
         results = {}
         schedules = cvx.matrix([s['x'].T for s in solutions]).T
@@ -201,6 +243,62 @@ class MarketClearingEngine(configurablebase.ConfigurableMultiBase):
         return results, solutions
 
 
+    def solve_steps_parallel(self, market, multi_demand, multi_generation):
+        """Solve the LP in the market object for each timestep, as for solve_multiple_steps,
+        but farming the timesteps out to a pool of self.config['processes'] processes.
+        The market object is not modified.
+        
+        The pool is started for each market, with the parts of the LP that are the same
+        for every timestep passed to each process once as it starts, so only the 
+        inequality constraint rhs is sent for each timestep. The pool is closed before
+        returning.
+        
+        Outputs:
+            solutions: a list of solution objects from solvers.lp, one per timestep.
+            
+        Exception:
+            raises mureilexception.SolverException if the solver does not find an optimal solution
+                for any timestep.
+        """
+        start = market.start_to_update_program
+        end = market.end_to_update_program
+
+        step_count = multi_generation.size[1]
+        rhs_list = []
+        for j in range(step_count):
+            rhs = cvx.matrix(market.inequality_constraint_rhs)
+            rhs[start:end] = cvx.matrix([multi_demand[:,j], multi_generation[:,j]])
+            rhs_list.append(rhs)
+
+        lp_static = (market.objective, market.inequality_constraint_lhs,
+            market.conservation_of_energy_lhs, market.conservation_of_energy_rhs)
+        processes = self.config['processes']
+        
+        # A few chunks per process, to balance the load while keeping the 
+        # number of messages down
+        chunksize = max(1, int(math.ceil(step_count / (processes * 4.0))))
+
+        from multiprocessing import Pool
+        pool = Pool(processes, _set_lp_static, (lp_static,))
+        try:
+            solutions = pool.map(_solve_lp, rhs_list, chunksize)
+            pool.close()
+        except:
+            # An interrupted map can leave work queued in the pool, so stop it rather
+            # than wait for it
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+        for solution in solutions:
+            if not (solution['status'] == 'optimal'):
+                msg = 'Solver status ' + solution['status']
+                raise mureilexception.SolverException(msg, {'sol': solution})
+
+        return solutions
+
+
     def build_objective(self, bids, offers, dc_lines):
         bid_prices = np.array([bid['price'] for bid in bids])
         offer_prices = np.array([offer['price'] for offer in offers])
@@ -270,29 +368,35 @@ class MarketClearingEngine(configurablebase.ConfigurableMultiBase):
 
 
     def _injections_from_schedule(self, bids, offers, nodes, dc_lines):
+        """Build the matrix mapping the schedule (bids, offers, negative then
+        positive dc line flows) to nodal injections. Uses a lookup from node name
+        to row index, so each bid, offer and dc line is visited only once.
+        """
         len_bids = len(bids)
         len_offers = len(offers)
-        injections_from_schedule = np.zeros((len(nodes), len_bids + len_offers + 2*len(dc_lines)))
-        for node_idx, node in enumerate(nodes):
-            for bid_idx, bid in enumerate(bids):
-                if bid['node'] == node['name']:
-                    injections_from_schedule[node_idx, bid_idx] = -1.
-            for offer_idx, offer in enumerate(offers):
-                if offer['node'] == node['name']:
-                    injections_from_schedule[node_idx, len_bids + offer_idx] = +1.
-            if dc_lines:
-                for neg_dc_line_idx, neg_dc_line in enumerate(dc_lines):
-                    if neg_dc_line['node from'] == node['name']:
-                        injections_from_schedule[node_idx, len_bids + len_offers + neg_dc_line_idx] = -1.
-                    if neg_dc_line['node to'] == node['name']:
-                        injections_from_schedule[node_idx, len_bids + len_offers + neg_dc_line_idx] = +1.
-
-                for pos_dc_line_idx, pos_dc_line in enumerate(dc_lines):
-                    if pos_dc_line['node from'] == node['name']:
-                        injections_from_schedule[node_idx, len_bids + len_offers + len(dc_lines) + pos_dc_line_idx] = -1.
-                    if pos_dc_line['node to'] == node['name']:
-                        injections_from_schedule[node_idx, len_bids + len_offers + len(dc_lines) + pos_dc_line_idx] = +1.
-        return cvx.matrix(injections_from_schedule)
-
+        len_dc_lines = len(dc_lines)
+        injections_from_schedule = np.zeros((len(nodes), len_bids + len_offers + 2*len_dc_lines))
 
+        node_index = {}
+        for node_idx, node in enumerate(nodes):
+            node_index.setdefault(node['name'], []).append(node_idx)
+
+        for bid_idx, bid in enumerate(bids):
+            for node_idx in node_index.get(bid['node'], []):
+                injections_from_schedule[node_idx, bid_idx] = -1.
+
+        for offer_idx, offer in enumerate(offers):
+            for node_idx in node_index.get(offer['node'], []):
+                injections_from_schedule[node_idx, len_bids + offer_idx] = +1.
+
+        neg_start = len_bids + len_offers
+        pos_start = neg_start + len_dc_lines
+        for dc_line_idx, dc_line in enumerate(dc_lines):
+            for node_idx in node_index.get(dc_line['node from'], []):
+                injections_from_schedule[node_idx, neg_start + dc_line_idx] = -1.
+                injections_from_schedule[node_idx, pos_start + dc_line_idx] = -1.
+            for node_idx in node_index.get(dc_line['node to'], []):
+                injections_from_schedule[node_idx, neg_start + dc_line_idx] = +1.
+                injections_from_schedule[node_idx, pos_start + dc_line_idx] = +1.
 
+        return cvx.matrix(injections_from_schedule)